@@ -716,4 +716,20 @@ MATCH (pd:PriceData)
 WITH pd.id as id, count(pd) as nodeCount
 WHERE nodeCount > 1
 RETURN id as DuplicatePriceDataId, nodeCount;
-// Expected Result: No rows (no duplicate nodes should exist)
\ No newline at end of file
+// Expected Result: No rows (no duplicate nodes should exist)
+
+// =====================================
+// POST-LOAD: DATA VERSION
+// =====================================
+// Invalidate dashboard caches for the revenue domain. Keep this as the last write of the load.
+MERGE (dv:DataVersion {domain: 'revenue'})
+SET dv.version = coalesce(dv.version, 0) + 1,
+    dv.updatedAt = datetime()
+RETURN dv.domain AS Domain, dv.version AS Version;
+
+// =====================================
+// POST-LOAD: MATERIALISED AGGREGATES
+// =====================================
+// After loading or changing revenue facts, rebuild the MonthlyFact nodes read by the
+// dashboard in materialized mode (GOLDENBERRY_READ_MODE=materialized):
+//   python -m dashboard_codex.tools.refresh_monthly_facts
@@ -7,6 +7,9 @@
 // - goldenberry_complete_model.cypher must be loaded first (creates 33 CostStructure nodes)
 // - complete_12month_real_data.cypher must be loaded first (creates 13 TimePeriod nodes)
 //
+// LOADING: python -m dashboard_codex.tools.load_phased_script (from examples/Goldenberry_Flow)
+// runs Phase 1, then Phases 2-4 concurrently with resumable checkpoints and validation.
+//
 // EXECUTION STATUS:
 // ✅ Phase 1: Schema Extension (constraints + indexes)
 // ✅ Phase 2: Personnel Costs (52 nodes)
@@ -27,6 +30,7 @@
 // ----------------------------------------
 // Creates CostData node type with constraints and indexes
 // This phase adds no data - only prepares the schema
+// (also declared in dashboard_codex/database/schema.py)
 // Execution time: ~5 seconds
 // ----------------------------------------
 
@@ -1766,4 +1770,12 @@ RETURN count(cd) as VariableNodes,
 // ========================================
 // Cost data integration complete: 99 nodes, $2,097,991 total
 // Next: Phase 5-6 will add validation and analysis queries
-// ========================================
\ No newline at end of file
+// ========================================
+// After loading cost data, rebuild MonthlyFact aggregates for the touched periods:
+//   python -m dashboard_codex.tools.refresh_monthly_facts
+
+// Invalidate dashboard caches for the cost domain. Keep this as the last write of the load:
+MERGE (dv:DataVersion {domain: 'cost'})
+SET dv.version = coalesce(dv.version, 0) + 1,
+    dv.updatedAt = datetime()
+RETURN dv.domain AS Domain, dv.version AS Version;
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import html
 import sys
+import time
 from pathlib import Path
 
 import streamlit as st
@@ -12,6 +14,9 @@ import streamlit as st
 if __package__ in (None, ""):
     package_root = Path(__file__).resolve().parent
     sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import MetricsBackend, ensure_schema, get_connection, run_scope
+    from dashboard_codex.pages.components import record_render_time
+    from dashboard_codex.pages.script_run import begin_script_run
     from dashboard_codex.styles import COLORS, inject_app_css
     from dashboard_codex.pages import (
         executive_dashboard,
@@ -20,6 +25,9 @@ if __package__ in (None, ""):
         cost_overview,
     )
 else:  # pragma: no cover - handled when executed as a module
+    from .database import MetricsBackend, ensure_schema, get_connection, run_scope
+    from .pages.components import record_render_time
+    from .pages.script_run import begin_script_run
     from .styles import COLORS, inject_app_css
     from .pages import executive_dashboard, product_performance, revenue_overview, cost_overview
 
@@ -54,8 +62,31 @@ def render_app_title() -> None:
     )
 
 
+def render_schema_warnings() -> None:
+    report = ensure_schema()
+    if report is None or report.healthy:
+        return
+
+    details = "".join(f"<li>{html.escape(problem)}</li>" for problem in report.problems())
+    st.warning(
+        "Neo4j schema check failed - dashboard queries may fall back to label scans. "
+        "Run `python -m dashboard_codex.tools.provision_schema` to fix.",
+    )
+    st.markdown(f"<ul style='font-size:0.85rem;'>{details}</ul>", unsafe_allow_html=True)
+
+
 def main() -> None:
+    started = time.perf_counter()
+    connection = get_connection()
+    run_token = begin_script_run(connection)
+    with run_scope(run_token):
+        render_run(connection)
+    record_render_time("full script run", started)
+
+
+def render_run(connection: MetricsBackend) -> None:
     render_app_title()
+    render_schema_warnings()
 
     tabs = st.tabs(
         [
@@ -67,13 +98,13 @@ def main() -> None:
     )
 
     with tabs[0]:
-        executive_dashboard.render()
+        executive_dashboard.render(connection)
     with tabs[1]:
-        revenue_overview.render()
+        revenue_overview.render(connection)
     with tabs[2]:
-        cost_overview.render()
+        cost_overview.render(connection)
     with tabs[3]:
-        product_performance.render()
+        product_performance.render(connection)
 
 
 if __name__ == "__main__":
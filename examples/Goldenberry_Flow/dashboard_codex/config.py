@@ -26,4 +26,65 @@ CONNECTION_SETTINGS = {
     "max_connection_pool_size": 50,
     "connection_acquisition_timeout": 60,
     "connection_timeout": 30,
+    # Records pulled from the server per round trip by stream_query().
+    "stream_fetch_size": int(os.getenv("GOLDENBERRY_STREAM_FETCH_SIZE", "1000")),
+}
+
+SCHEMA_SETTINGS = {
+    # Create missing constraints and indexes when the app starts. Off by
+    # default so read-only deployments never issue DDL.
+    "apply_on_startup": os.getenv("GOLDENBERRY_APPLY_SCHEMA", "0") == "1",
+    "verify_on_startup": os.getenv("GOLDENBERRY_VERIFY_SCHEMA", "1") == "1",
+}
+
+AGGREGATE_SETTINGS = {
+    # "live" walks RevenueStream/VolumeData/PriceData paths on every read;
+    # "materialized" reads the precomputed MonthlyFact nodes instead.
+    "read_mode": os.getenv("GOLDENBERRY_READ_MODE", "live"),
+    # Metrics backend from database/backend.py: "neo4j" answers reads with
+    # Cypher, "duckdb" with SQL over an embedded, incrementally synced mirror
+    # of the fact nodes; "module:factory" plugs in any other implementation.
+    "analytics_backend": os.getenv("GOLDENBERRY_ANALYTICS_BACKEND", "neo4j"),
+    "duckdb_path": os.getenv(
+        "GOLDENBERRY_DUCKDB_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "analytics.duckdb"),
+    ),
+    # Graphs without DataVersion nodes give the mirror no change signal; their
+    # facts are re-copied on a read at most this often (seconds), 0 = only by
+    # tools/sync_analytical_mirror.py.
+    "mirror_resync_seconds": float(os.getenv("GOLDENBERRY_MIRROR_RESYNC_SECONDS", "3600")),
+}
+
+UI_SETTINGS = {
+    # Show per-section render times (full script and fragment reruns) as captions.
+    "render_timings": os.getenv("GOLDENBERRY_RENDER_TIMINGS", "0") == "1",
+    # Serialized Plotly figures kept per process, keyed by input data and widget state.
+    "figure_cache_size": int(os.getenv("GOLDENBERRY_FIGURE_CACHE_SIZE", "128")),
+    # Timeline charts are downsampled to a point budget derived from this width.
+    "chart_width_px": int(os.getenv("GOLDENBERRY_CHART_WIDTH_PX", "1200")),
+    # Plotted points above which line traces render through WebGL.
+    "webgl_threshold": int(os.getenv("GOLDENBERRY_WEBGL_THRESHOLD", "1000")),
+}
+
+CACHE_SETTINGS = {
+    # Aggregates for TimePeriods flagged closed are computed once and kept on disk.
+    "closed_period_cache": os.getenv("GOLDENBERRY_CLOSED_PERIOD_CACHE", "1") == "1",
+    "closed_period_dir": os.getenv(
+        "GOLDENBERRY_CLOSED_PERIOD_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "closed_periods"),
+    ),
+    # Read results are reused until a DataVersion counter of their domain changes.
+    "versioned_cache": os.getenv("GOLDENBERRY_VERSIONED_CACHE", "1") == "1",
+    # Read results kept per connection; the least recently used are evicted.
+    "result_cache_size": int(os.getenv("GOLDENBERRY_RESULT_CACHE_SIZE", "256")),
+    # Upper bound on how often the DataVersion nodes are polled (seconds).
+    "version_poll_seconds": float(os.getenv("GOLDENBERRY_VERSION_POLL_SECONDS", "2")),
+    # Result cache shared by server processes: "none", "sqlite", "memory" or "module:factory".
+    "shared_cache": os.getenv("GOLDENBERRY_SHARED_CACHE", "none"),
+    "shared_cache_path": os.getenv(
+        "GOLDENBERRY_SHARED_CACHE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "shared_cache.sqlite3"),
+    ),
+    # Expiry backstop for shared entries; DataVersion changes already switch keys.
+    "shared_cache_ttl": float(os.getenv("GOLDENBERRY_SHARED_CACHE_TTL", "3600")),
 }
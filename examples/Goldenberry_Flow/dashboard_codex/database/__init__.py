@@ -1,12 +1,57 @@
 """Database helpers for the Codex dashboard."""
 
-from .connection import Neo4jConnection, close_connection, get_connection
+from .aggregates import refresh_for_batch, refresh_monthly_facts
+from .analytical_mirror import AnalyticalMirror, MirrorConnection
+from .backend import MetricsBackend, available_backends, create_backend, register_backend
+from .connection import Neo4jConnection, close_connection, get_connection, run_scope
+from .cost_propagation import CostToServe, load_cost_to_serve, propagate_costs
+from .data_version import bump_versions, read_versions
+from .model_graph import ModelGraph, load_model_graph
+from .model_templates import build_plan, load_spec, write_model
+from .period_cache import ClosedPeriodCache, close_periods
+from .phased_load import PhasedLoader, parse_phased_script
+from .schema import REQUIRED_SCHEMA, apply_schema, ensure_schema, verify_schema
+from .semantic_store import deduplicate_semantics, inline_semantics, resolve_semantics
+from .shared_cache import KeyValueStore, SharedResultCache, create_store
 from .status_indicator import get_compact_database_status, render_status_pill
 
 __all__ = [
     "Neo4jConnection",
+    "MirrorConnection",
+    "AnalyticalMirror",
+    "MetricsBackend",
+    "available_backends",
+    "create_backend",
+    "register_backend",
+    "run_scope",
     "get_connection",
     "close_connection",
     "get_compact_database_status",
     "render_status_pill",
+    "REQUIRED_SCHEMA",
+    "apply_schema",
+    "ensure_schema",
+    "verify_schema",
+    "refresh_for_batch",
+    "refresh_monthly_facts",
+    "ModelGraph",
+    "load_model_graph",
+    "build_plan",
+    "load_spec",
+    "write_model",
+    "ClosedPeriodCache",
+    "close_periods",
+    "PhasedLoader",
+    "parse_phased_script",
+    "CostToServe",
+    "load_cost_to_serve",
+    "propagate_costs",
+    "bump_versions",
+    "read_versions",
+    "deduplicate_semantics",
+    "inline_semantics",
+    "resolve_semantics",
+    "KeyValueStore",
+    "SharedResultCache",
+    "create_store",
 ]
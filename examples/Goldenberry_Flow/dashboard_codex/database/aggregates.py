@@ -0,0 +1,141 @@
+"""
+MonthlyFact materialisation for the Goldenberry dashboard.
+Precomputes per-product, per-period revenue, volume, variable cost, fixed
+cost share and throughput so read paths avoid multi-hop traversals.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, List, Optional, Sequence
+
+from .connection import Neo4jConnection
+from .data_version import DOMAIN_COST, DOMAIN_REVENUE, bump_statement
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DELETE_FACTS_QUERY = """
+MATCH (mf:MonthlyFact)
+WHERE mf.periodId IN $period_ids
+DETACH DELETE mf
+"""
+
+# Revenue follows the live read path (volume and price joined on the shared
+# TimePeriod). Fixed costs for the period are allocated by revenue share,
+# matching the product page allocation. Properties stay null when the period
+# has no underlying facts so materialised reads can mirror live row sets.
+MATERIALIZE_FACTS_QUERY = """
+UNWIND $period_ids AS period_id
+MATCH (tp:TimePeriod {id: period_id})
+OPTIONAL MATCH (fixed:CostData {costBehavior: 'fixed'})-[:INCURRED_IN_PERIOD]->(tp)
+WITH tp, SUM(fixed.amount) AS fixedTotal
+MATCH (p:Product)
+OPTIONAL MATCH (p)<-[:VOLUME_FOR_PRODUCT]-(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp),
+               (p)<-[:PRICE_FOR_PRODUCT]-(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
+WITH tp, fixedTotal, p,
+     SUM(vd.volume * pd.price) AS revenue,
+     SUM(vd.volume) AS volume,
+     count(vd) AS revenueRows
+OPTIONAL MATCH (p)<-[:COST_FOR_PRODUCT]-(cd:CostData {costBehavior: 'variable'})-[:INCURRED_IN_PERIOD]->(tp)
+WITH tp, fixedTotal, p, revenue, volume, revenueRows,
+     SUM(cd.amount) AS variableCost,
+     count(cd) AS costRows
+WHERE revenueRows > 0 OR costRows > 0
+WITH tp, fixedTotal,
+     collect({product: p, revenue: revenue, volume: volume, revenueRows: revenueRows,
+              variableCost: variableCost, costRows: costRows}) AS rows
+WITH tp, fixedTotal, rows, reduce(total = 0.0, row IN rows | total + row.revenue) AS periodRevenue
+UNWIND rows AS row
+WITH tp, row, row.product AS p,
+     CASE WHEN periodRevenue = 0 THEN 0.0 ELSE fixedTotal * row.revenue / periodRevenue END AS fixedShare
+CREATE (mf:MonthlyFact {id: 'mf_' + p.id + '_' + tp.id})
+SET mf.productId = p.id,
+    mf.productName = p.name,
+    mf.periodId = tp.id,
+    mf.year = tp.year,
+    mf.month = tp.month,
+    mf.quarter = tp.quarter,
+    mf.revenue = CASE WHEN row.revenueRows = 0 THEN null ELSE row.revenue END,
+    mf.volume = CASE WHEN row.revenueRows = 0 THEN null ELSE row.volume END,
+    mf.variableCost = CASE WHEN row.costRows = 0 THEN null ELSE row.variableCost END,
+    mf.fixedCostShare = fixedShare,
+    mf.throughput = row.revenue - row.variableCost,
+    mf.updatedAt = datetime()
+CREATE (mf)-[:FACT_FOR_PRODUCT]->(p)
+CREATE (mf)-[:FACT_IN_PERIOD]->(tp)
+RETURN count(mf) AS facts
+"""
+
+TOUCHED_PERIODS_QUERY = """
+UNWIND $fact_ids AS fact_id
+CALL {
+    WITH fact_id
+    MATCH (:VolumeData {id: fact_id})-[:OCCURS_IN_PERIOD]->(tp:TimePeriod)
+    RETURN tp
+    UNION
+    WITH fact_id
+    MATCH (:PriceData {id: fact_id})-[:PRICED_IN_PERIOD]->(tp:TimePeriod)
+    RETURN tp
+    UNION
+    WITH fact_id
+    MATCH (:CostData {id: fact_id})-[:INCURRED_IN_PERIOD]->(tp:TimePeriod)
+    RETURN tp
+}
+RETURN DISTINCT tp.id AS period_id
+"""
+
+
+def list_period_ids(connection: Neo4jConnection) -> List[str]:
+    """Return every TimePeriod id in chronological order."""
+
+    rows = connection.execute_query(
+        "MATCH (tp:TimePeriod) RETURN tp.id AS period_id ORDER BY tp.year, tp.month"
+    )
+    return [row["period_id"] for row in rows if row.get("period_id")]
+
+
+def touched_periods(connection: Neo4jConnection, fact_ids: Iterable[str]) -> List[str]:
+    """Return the TimePeriod ids linked to a batch of ingested fact ids."""
+
+    rows = connection.execute_query(TOUCHED_PERIODS_QUERY, {"fact_ids": list(fact_ids)})
+    return sorted(row["period_id"] for row in rows if row.get("period_id"))
+
+
+def refresh_monthly_facts(connection: Neo4jConnection, period_ids: Optional[Sequence[str]] = None) -> int:
+    """Rebuild MonthlyFact nodes for the given periods (all periods when None).
+
+    The delete and rebuild run in one transaction, together with the revenue
+    and cost DataVersion bump, so readers never observe a period with
+    partially materialised facts or serve stale cached reads.
+    """
+
+    periods = list(period_ids) if period_ids is not None else list_period_ids(connection)
+    if not periods:
+        return 0
+
+    results = connection.execute_transaction(
+        [
+            (DELETE_FACTS_QUERY, {"period_ids": periods}),
+            (MATERIALIZE_FACTS_QUERY, {"period_ids": periods}),
+            bump_statement(DOMAIN_REVENUE, DOMAIN_COST),
+        ]
+    )
+    created = int(results[1][0]["facts"]) if results[1] else 0
+    logger.info("Materialised %d MonthlyFact nodes across %d periods", created, len(periods))
+    return created
+
+
+def refresh_for_batch(connection: Neo4jConnection, fact_ids: Iterable[str]) -> int:
+    """Recompute MonthlyFact nodes only for periods touched by an ingestion batch."""
+
+    periods = touched_periods(connection, fact_ids)
+    return refresh_monthly_facts(connection, periods)
+
+
+__all__ = [
+    "list_period_ids",
+    "refresh_for_batch",
+    "refresh_monthly_facts",
+    "touched_periods",
+]
@@ -0,0 +1,634 @@
+"""
+Embedded DuckDB mirror of the fact nodes for analytical reads.
+VolumeData, PriceData and CostData are copied per TimePeriod (closed periods
+only once) together with their dimensions, and the connection's metric
+methods are answered with SQL instead of Cypher graph walks.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+try:  # Optional dependency: only needed for the "duckdb" analytics backend.
+    import duckdb
+except ImportError:  # pragma: no cover - depends on the deployment
+    duckdb = None
+
+from ..config import AGGREGATE_SETTINGS, CONNECTION_SETTINGS
+from .connection import (
+    ANALYTICS_BACKEND_DUCKDB,
+    ANALYTICS_BACKEND_NEO4J,
+    ColumnSpec,
+    Neo4jConnection,
+    _typed_frame,
+)
+from .data_version import DOMAIN_COST, DOMAIN_REVENUE
+from .schema import connection_queries
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Table -> columns in insert order. Facts carry the ids of their period,
+# product, revenue stream and cost structure (each fact has at most one).
+TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "time_period": [("id", "VARCHAR"), ("year", "BIGINT"), ("month", "BIGINT"), ("quarter", "VARCHAR"), ("closed", "BOOLEAN")],
+    "product": [("id", "VARCHAR"), ("name", "VARCHAR")],
+    "cost_structure": [("id", "VARCHAR"), ("name", "VARCHAR")],
+    "revenue_stream_product": [("revenue_stream_id", "VARCHAR"), ("product_id", "VARCHAR")],
+    "volume_data": [
+        ("id", "VARCHAR"),
+        ("volume", "DOUBLE"),
+        ("period_id", "VARCHAR"),
+        ("product_id", "VARCHAR"),
+        ("revenue_stream_id", "VARCHAR"),
+    ],
+    "price_data": [
+        ("id", "VARCHAR"),
+        ("price", "DOUBLE"),
+        ("period_id", "VARCHAR"),
+        ("product_id", "VARCHAR"),
+        ("revenue_stream_id", "VARCHAR"),
+    ],
+    "cost_data": [
+        ("id", "VARCHAR"),
+        ("amount", "DOUBLE"),
+        ("cost_behavior", "VARCHAR"),
+        ("unit", "VARCHAR"),
+        ("description", "VARCHAR"),
+        ("period_id", "VARCHAR"),
+        ("product_id", "VARCHAR"),
+        ("structure_id", "VARCHAR"),
+    ],
+}
+
+STATE_DDL = (
+    "CREATE TABLE IF NOT EXISTS mirror_state (domain VARCHAR PRIMARY KEY, version BIGINT, synced_at TIMESTAMP)",
+    "CREATE TABLE IF NOT EXISTS mirror_periods (dataset VARCHAR, period_id VARCHAR, closed BOOLEAN)",
+)
+
+DIMENSION_QUERIES: Dict[str, str] = {
+    "time_period": """
+    MATCH (tp:TimePeriod)
+    RETURN tp.id AS id, tp.year AS year, tp.month AS month, toString(tp.quarter) AS quarter,
+           coalesce(tp.closed, false) AS closed
+    """,
+    "product": "MATCH (p:Product) RETURN p.id AS id, p.name AS name",
+    "cost_structure": "MATCH (cs:CostStructure) RETURN cs.id AS id, cs.name AS name",
+    "revenue_stream_product": """
+    MATCH (rs:RevenueStream)-[:SELLS_PRODUCT]->(p:Product)
+    RETURN rs.id AS revenue_stream_id, p.id AS product_id
+    """,
+}
+
+# Fact table -> (data-version domain, label, period relationship, RETURN clause).
+FACT_SOURCES: Dict[str, Tuple[str, str, str, str]] = {
+    "volume_data": (
+        DOMAIN_REVENUE,
+        "VolumeData",
+        "OCCURS_IN_PERIOD",
+        """
+        RETURN fact.id AS id, toFloat(fact.volume) AS volume, period_id,
+               head([(fact)-[:VOLUME_FOR_PRODUCT]->(p:Product) | p.id]) AS product_id,
+               head([(rs:RevenueStream)-[:HAS_VOLUME_DATA]->(fact) | rs.id]) AS revenue_stream_id
+        """,
+    ),
+    "price_data": (
+        DOMAIN_REVENUE,
+        "PriceData",
+        "PRICED_IN_PERIOD",
+        """
+        RETURN fact.id AS id, toFloat(fact.price) AS price, period_id,
+               head([(fact)-[:PRICE_FOR_PRODUCT]->(p:Product) | p.id]) AS product_id,
+               head([(rs:RevenueStream)-[:HAS_PRICE_DATA]->(fact) | rs.id]) AS revenue_stream_id
+        """,
+    ),
+    "cost_data": (
+        DOMAIN_COST,
+        "CostData",
+        "INCURRED_IN_PERIOD",
+        """
+        RETURN fact.id AS id, toFloat(fact.amount) AS amount, fact.costBehavior AS cost_behavior,
+               fact.unit AS unit, fact.description AS description, period_id,
+               head([(fact)-[:COST_FOR_PRODUCT]->(p:Product) | p.id]) AS product_id,
+               head([(fact)-[:COST_FOR_STRUCTURE]->(cs:CostStructure) | cs.id]) AS structure_id
+        """,
+    ),
+}
+
+# Revenue joins volume and price on their stream and period, like the
+# RevenueStream walks in connection.py; per-product series join on product.
+_STREAM_REVENUE = """
+FROM volume_data v
+JOIN price_data pd ON pd.revenue_stream_id = v.revenue_stream_id AND pd.period_id = v.period_id
+"""
+_PRODUCT_REVENUE = """
+FROM volume_data v
+JOIN price_data pd ON pd.product_id = v.product_id AND pd.period_id = v.period_id
+JOIN product p ON p.id = v.product_id
+JOIN time_period tp ON tp.id = v.period_id
+"""
+# The ``$period_ids``/``$excluded_period_ids`` filter of the per-period frame
+# reads, so closed periods served from the period cache are not read twice.
+_PERIOD_FILTER = """
+(CAST($period_ids AS VARCHAR[]) IS NULL OR list_contains(CAST($period_ids AS VARCHAR[]), tp.id))
+AND NOT list_contains(CAST($excluded_period_ids AS VARCHAR[]), tp.id)
+"""
+_COST_LINES = """
+FROM cost_data cd
+JOIN time_period tp ON tp.id = cd.period_id
+JOIN cost_structure cs ON cs.id = cd.structure_id
+LEFT JOIN product p ON p.id = cd.product_id
+WHERE (CAST($product AS VARCHAR) IS NULL OR p.name = $product)
+  AND (CAST($category AS VARCHAR) IS NULL OR cs.name = $category)
+"""
+
+# Connection method -> SQL returning the same columns as its Cypher query,
+# so the method's own post-processing runs unchanged on the result.
+MIRROR_QUERIES: Dict[str, str] = {
+    "get_product_count": "SELECT count(*) AS product_count FROM product",
+    "get_total_revenue": f"SELECT SUM(v.volume * pd.price) AS totalRevenue {_STREAM_REVENUE}",
+    "get_total_volume": "SELECT SUM(volume) AS totalVolume FROM volume_data",
+    "get_average_monthly_revenue": f"""
+        SELECT AVG(monthlyRevenue) AS avgMonthlyRevenue
+        FROM (SELECT v.period_id, SUM(v.volume * pd.price) AS monthlyRevenue {_STREAM_REVENUE} GROUP BY v.period_id)
+    """,
+    "get_average_price_per_kg": f"""
+        SELECT SUM(v.volume * pd.price) / NULLIF(SUM(v.volume), 0) AS avgPricePerKg {_STREAM_REVENUE}
+    """,
+    "get_total_costs": "SELECT SUM(amount) AS totalCosts FROM cost_data",
+    "get_variable_costs": "SELECT SUM(amount) AS variableCosts FROM cost_data WHERE product_id IS NOT NULL",
+    "get_fixed_costs": "SELECT SUM(amount) AS fixedCosts FROM cost_data WHERE product_id IS NULL",
+    "get_cost_timeseries": f"""
+        SELECT p.name AS product, cs.name AS category, tp.year AS year, tp.month AS month, SUM(cd.amount) AS cost
+        {_COST_LINES}
+        GROUP BY p.name, cs.name, tp.year, tp.month
+        ORDER BY year, month, category NULLS LAST, product NULLS LAST
+    """,
+    "get_quarterly_costs": f"""
+        SELECT p.name AS product, cs.name AS category, tp.year AS year, tp.quarter AS quarter, SUM(cd.amount) AS cost
+        {_COST_LINES}
+        GROUP BY p.name, cs.name, tp.year, tp.quarter
+        ORDER BY year, quarter, category NULLS LAST, product NULLS LAST
+    """,
+    "get_cost_categories": """
+        SELECT DISTINCT cs.name AS name
+        FROM cost_structure cs JOIN cost_data cd ON cd.structure_id = cs.id
+        ORDER BY name
+    """,
+    "iter_cost_line_items": f"""
+        SELECT cd.id AS id, tp.id AS period_id, tp.year AS year, tp.month AS month, cs.name AS category,
+               p.name AS product, cd.cost_behavior AS behavior, cd.amount AS amount, cd.unit AS unit,
+               cd.description AS description
+        {_COST_LINES}
+        ORDER BY year, month, id
+    """,
+    "get_product_costs": """
+        SELECT cs.name AS category, COALESCE(SUM(cd.amount), 0) AS totalCost
+        FROM product p
+        LEFT JOIN cost_data cd ON cd.product_id = p.id
+        LEFT JOIN cost_structure cs ON cs.id = cd.structure_id
+        WHERE p.name = $product_name
+        GROUP BY cs.name
+        ORDER BY totalCost DESC
+    """,
+    "get_product_cost_breakdown": """
+        SELECT p.name AS product, cs.name AS category, cd.cost_behavior AS behavior, SUM(cd.amount) AS totalCost
+        FROM cost_data cd
+        JOIN product p ON p.id = cd.product_id
+        LEFT JOIN cost_structure cs ON cs.id = cd.structure_id
+        GROUP BY p.name, cs.name, cd.cost_behavior
+        ORDER BY product, totalCost DESC
+    """,
+    "get_product_variable_cost": """
+        SELECT SUM(cd.amount) AS variableCost
+        FROM cost_data cd JOIN product p ON p.id = cd.product_id
+        WHERE p.name = $product_name AND cd.cost_behavior = 'variable'
+    """,
+    "get_product_variable_costs": """
+        SELECT p.name AS product, SUM(cd.amount) AS variableCost
+        FROM cost_data cd JOIN product p ON p.id = cd.product_id
+        WHERE cd.cost_behavior = 'variable'
+        GROUP BY p.name
+    """,
+    # Every cost line pairs with every volume row of its product and period.
+    "get_average_cost_per_kg": """
+        SELECT CASE WHEN SUM(v.volume) = 0 THEN 0 ELSE SUM(cd.amount) / SUM(v.volume) END AS avgCostPerKg
+        FROM cost_data cd
+        JOIN volume_data v ON v.product_id = cd.product_id AND v.period_id = cd.period_id
+    """,
+    "get_variable_cost_timeseries_frame": f"""
+        SELECT p.name AS product, tp.id AS period_id, tp.year AS year, tp.month AS month, SUM(cd.amount) AS cost
+        FROM cost_data cd
+        JOIN time_period tp ON tp.id = cd.period_id
+        JOIN product p ON p.id = cd.product_id
+        WHERE cd.cost_behavior = 'variable' AND {_PERIOD_FILTER}
+        GROUP BY p.name, tp.id, tp.year, tp.month
+        ORDER BY year, month, product
+    """,
+    "get_fixed_cost_timeseries_frame": f"""
+        SELECT cs.name AS category, tp.id AS period_id, tp.year AS year, tp.month AS month, SUM(cd.amount) AS cost
+        FROM cost_data cd
+        JOIN time_period tp ON tp.id = cd.period_id
+        JOIN cost_structure cs ON cs.id = cd.structure_id
+        WHERE cd.cost_behavior = 'fixed' AND {_PERIOD_FILTER}
+        GROUP BY cs.name, tp.id, tp.year, tp.month
+        ORDER BY year, month, category
+    """,
+    "get_cost_totals_by_behavior": """
+        SELECT cost_behavior AS behavior, SUM(amount) AS total FROM cost_data GROUP BY cost_behavior
+    """,
+    "get_cost_totals_by_category": """
+        SELECT cs.name AS category,
+               SUM(cd.amount) AS totalCost,
+               CASE WHEN cd.product_id IS NOT NULL OR cd.cost_behavior = 'variable' THEN 'variable' ELSE 'fixed' END
+                   AS behavior
+        FROM cost_data cd JOIN cost_structure cs ON cs.id = cd.structure_id
+        GROUP BY category, behavior
+    """,
+    # Products without priced volume keep a zero row, like the OPTIONAL MATCH.
+    "get_product_metrics": """
+        SELECT p.name AS Product,
+               COALESCE(SUM(v.volume * pd.price), 0) AS TotalRevenue,
+               COALESCE(SUM(v.volume), 0) AS TotalVolume,
+               SUM(v.volume * pd.price) / NULLIF(SUM(v.volume), 0) AS AvgPrice
+        FROM product p
+        LEFT JOIN (
+            volume_data v
+            JOIN price_data pd ON pd.product_id = v.product_id AND pd.period_id = v.period_id
+        ) ON v.product_id = p.id
+        GROUP BY p.name
+        ORDER BY TotalRevenue DESC
+    """,
+    "get_product_monthly_performance_frame": f"""
+        SELECT p.name AS Product, tp.id AS PeriodId, tp.year AS Year, tp.month AS Month,
+               SUM(pd.price * v.volume) AS MonthlyRevenue, SUM(v.volume) AS MonthlyVolume
+        {_PRODUCT_REVENUE}
+        WHERE {_PERIOD_FILTER}
+        GROUP BY p.name, tp.id, tp.year, tp.month
+        ORDER BY Year, Month, Product
+    """,
+    "get_revenue_timeseries_frame": f"""
+        SELECT p.name AS Product, tp.id AS PeriodId, tp.year AS Year, tp.month AS Month,
+               SUM(pd.price * v.volume) AS MonthlyRevenue
+        {_PRODUCT_REVENUE}
+        WHERE {_PERIOD_FILTER}
+        GROUP BY p.name, tp.id, tp.year, tp.month
+        ORDER BY Year, Month, Product
+    """,
+    "get_quarterly_revenue": f"""
+        SELECT p.name AS Product, tp.year AS Year, tp.quarter AS Quarter,
+               SUM(pd.price * v.volume) AS QuarterlyRevenue
+        {_PRODUCT_REVENUE}
+        GROUP BY p.name, tp.year, tp.quarter
+        ORDER BY Year, Quarter, Product
+    """,
+}
+
+_PARAMETER = re.compile(r"\$(\w+)")
+
+
+def _normalise(query: str) -> str:
+    return " ".join(query.split())
+
+
+@lru_cache(maxsize=1)
+def mirrored_statements() -> Dict[str, str]:
+    """Map the Cypher text of every mirrored read (both read modes) to its method.
+
+    Queries are recognised by their text, so reads nested inside a mirrored
+    method (``get_period_catalog`` under a ``*_frame`` read, say) still go
+    to Neo4j.
+    """
+
+    statements: Dict[str, str] = {}
+    for read in connection_queries():
+        if read.method in MIRROR_QUERIES:
+            statements[_normalise(read.query)] = read.method
+    return statements
+
+
+def _fact_query(label: str, relationship: str, returns: str, orphans: bool) -> str:
+    if orphans:
+        match = f"MATCH (fact:{label})\nWHERE NOT (fact)-[:{relationship}]->(:TimePeriod)\nWITH fact, null AS period_id"
+    else:
+        match = (
+            f"UNWIND $period_ids AS period_id\n"
+            f"MATCH (:TimePeriod {{id: period_id}})<-[:{relationship}]-(fact:{label})"
+        )
+    return f"{match}\n{returns}"
+
+
+class AnalyticalMirror:
+    """DuckDB file holding the fact tables and their sync bookkeeping."""
+
+    def __init__(self, path: Path | str) -> None:
+        if duckdb is None:
+            raise RuntimeError("The duckdb analytics backend requires the 'duckdb' package")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = duckdb.connect(str(self.path))
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+        for table, columns in TABLES.items():
+            definition = ", ".join(f"{name} {dtype}" for name, dtype in columns)
+            self._db.execute(f"CREATE TABLE IF NOT EXISTS {table} ({definition})")
+        for statement in STATE_DDL:
+            self._db.execute(statement)
+        self._versions: Dict[str, Optional[int]] = {
+            domain: version for domain, version in self._db.execute("SELECT domain, version FROM mirror_state").fetchall()
+        }
+
+    @property
+    def synced(self) -> bool:
+        """Whether both fact domains have been copied at least once."""
+
+        return DOMAIN_REVENUE in self._versions and DOMAIN_COST in self._versions
+
+    def _cursor(self):
+        # DuckDB connections are not shared across threads; cursors are cheap duplicates.
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            cursor = self._db.cursor()
+            self._local.cursor = cursor
+        return cursor
+
+    def _execute(self, sql: str, parameters: Optional[Dict[str, Any]]):
+        wanted = set(_PARAMETER.findall(sql))
+        bound = {name: value for name, value in (parameters or {}).items() if name in wanted}
+        return self._cursor().execute(sql, bound) if bound else self._cursor().execute(sql)
+
+    def query(self, sql: str, parameters: Optional[Dict[str, Any]] = None) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """Run ``sql`` (``$name`` placeholders) and return column names and rows."""
+
+        try:
+            result = self._execute(sql, parameters)
+            return [column[0] for column in result.description], result.fetchall()
+        except Exception as exc:
+            message = f"Mirror query failed: {exc}"
+            logger.error(message)
+            raise RuntimeError(message) from exc
+
+    def stream(
+        self, sql: str, parameters: Optional[Dict[str, Any]], batch_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield result rows as dicts in batches of ``batch_size``."""
+
+        try:
+            result = self._execute(sql, parameters)
+            keys = [column[0] for column in result.description]
+            while True:
+                rows = result.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield [dict(zip(keys, row)) for row in rows]
+        except Exception as exc:
+            message = f"Mirror query failed: {exc}"
+            logger.error(message)
+            raise RuntimeError(message) from exc
+
+    # Sync --------------------------------------------------------------
+    def sync(self, connection: Neo4jConnection, force: bool = False, full: bool = False) -> Dict[str, int]:
+        """Copy changed facts from Neo4j; returns rows written per table.
+
+        A fact domain is re-copied when its DataVersion moved. Graphs without
+        DataVersion nodes are re-copied at most once per
+        ``mirror_resync_seconds`` (never when 0), so reads do not pay for a
+        copy on every poll; ``force`` is the explicit refresh. Periods that
+        were already closed when last copied are skipped unless ``full``;
+        ``force`` re-copies both domains regardless of versions.
+        """
+
+        force = force or full
+
+        with self._sync_lock:
+            versions = connection.get_data_versions((DOMAIN_REVENUE, DOMAIN_COST))
+            now = time.monotonic()
+            interval = AGGREGATE_SETTINGS["mirror_resync_seconds"]
+            unversioned_due = force or (
+                interval > 0 and (self._checked_at is None or now - self._checked_at >= interval)
+            )
+            stale = [
+                domain
+                for domain, version in versions.items()
+                if force
+                or domain not in self._versions
+                or (version is None and unversioned_due)
+                or (version is not None and version != self._versions[domain])
+            ]
+            if not stale:
+                return {}
+            self._checked_at = now
+
+            written: Dict[str, int] = {}
+            started = time.perf_counter()
+            catalog = connection.execute_query(DIMENSION_QUERIES["time_period"])
+            self._db.execute("BEGIN TRANSACTION")
+            try:
+                for table, query in DIMENSION_QUERIES.items():
+                    rows = catalog if table == "time_period" else connection.execute_query(query)
+                    self._db.execute(f"DELETE FROM {table}")
+                    written[table] = self._insert(table, rows)
+                for table, (domain, label, relationship, returns) in FACT_SOURCES.items():
+                    if domain in stale:
+                        written[table] = self._sync_facts(
+                            connection, table, label, relationship, returns, catalog, full
+                        )
+                for domain in stale:
+                    self._db.execute("DELETE FROM mirror_state WHERE domain = ?", [domain])
+                    self._db.execute(
+                        "INSERT INTO mirror_state VALUES (?, ?, now())", [domain, versions[domain]]
+                    )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            self._versions.update({domain: versions[domain] for domain in stale})
+            logger.info(
+                "Synced analytical mirror (%s) in %.0f ms: %s",
+                ", ".join(stale),
+                (time.perf_counter() - started) * 1000,
+                ", ".join(f"{table}={count}" for table, count in written.items()),
+            )
+            return written
+
+    def _sync_facts(
+        self,
+        connection: Neo4jConnection,
+        table: str,
+        label: str,
+        relationship: str,
+        returns: str,
+        catalog: List[Dict[str, Any]],
+        full: bool,
+    ) -> int:
+        done = set()
+        if not full:
+            done = {
+                period_id
+                for (period_id,) in self._db.execute(
+                    "SELECT period_id FROM mirror_periods WHERE dataset = ? AND closed", [table]
+                ).fetchall()
+            }
+        pull = [row["id"] for row in catalog if not (row.get("closed") and row["id"] in done)]
+        rows = connection.execute_query(_fact_query(label, relationship, returns, False), {"period_ids": pull})
+        rows += connection.execute_query(_fact_query(label, relationship, returns, True))
+
+        self._db.register("pulled_periods", pd.DataFrame({"period_id": pd.Series(pull, dtype="object")}))
+        try:
+            self._db.execute(
+                f"""
+                DELETE FROM {table}
+                WHERE period_id IS NULL
+                   OR period_id IN (SELECT period_id FROM pulled_periods)
+                   OR period_id NOT IN (SELECT id FROM time_period)
+                """
+            )
+        finally:
+            self._db.unregister("pulled_periods")
+        self._db.execute("DELETE FROM mirror_periods WHERE dataset = ?", [table])
+        self._db.executemany(
+            "INSERT INTO mirror_periods VALUES (?, ?, ?)",
+            [[table, row["id"], bool(row.get("closed"))] for row in catalog],
+        )
+        return self._insert(table, rows)
+
+    def _insert(self, table: str, rows: List[Dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+        names = [name for name, _ in TABLES[table]]
+        frame = pd.DataFrame([[row.get(name) for name in names] for row in rows], columns=names)
+        self._db.register("incoming", frame)
+        try:
+            casts = ", ".join(f"CAST({name} AS {dtype})" for name, dtype in TABLES[table])
+            self._db.execute(f"INSERT INTO {table} SELECT {casts} FROM incoming")
+        finally:
+            self._db.unregister("incoming")
+        return len(rows)
+
+    def export_parquet(self, directory: Path | str) -> List[Path]:
+        """Write every mirrored table to ``<directory>/<table>.parquet``."""
+
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        paths: List[Path] = []
+        with self._sync_lock:
+            for table in TABLES:
+                path = target / f"{table}.parquet"
+                self._db.execute(f"COPY {table} TO '{path.as_posix()}' (FORMAT PARQUET)")
+                paths.append(path)
+        return paths
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class MirrorConnection(Neo4jConnection):
+    """Neo4j connection whose metric reads run as SQL over the DuckDB mirror.
+
+    Neo4j stays the source of truth and still serves writes, data versions
+    and anything without a registered SQL statement. If the mirror cannot be
+    opened (for example duckdb is not installed) every read uses Cypher.
+    """
+
+    def __init__(self, read_mode: Optional[str] = None, path: Optional[Path | str] = None) -> None:
+        super().__init__(read_mode)
+        # The mirror already copies closed periods once; the JSON cache would only duplicate it.
+        self.period_cache = None
+        self.mirror: Optional[AnalyticalMirror] = None
+        try:
+            self.mirror = AnalyticalMirror(path or AGGREGATE_SETTINGS["duckdb_path"])
+        except Exception as exc:
+            logger.error("Analytical mirror disabled, reading from Neo4j: %s", exc)
+
+    def _mirror_ready(self) -> bool:
+        """Bring the mirror up to date; False when it has never been synced."""
+
+        if self.mirror is None:
+            return False
+        try:
+            self.mirror.sync(self)
+        except Exception as exc:
+            # A stale mirror still answers; one that was never filled cannot.
+            logger.warning("Analytical mirror sync failed: %s", exc)
+        return self.mirror.synced
+
+    def _versioned_read(
+        self,
+        name: str,
+        domains: Tuple[str, ...],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        load: Callable[[], Any],
+    ) -> Any:
+        if name in MIRROR_QUERIES:
+            self._mirror_ready()
+        return super()._versioned_read(name, domains, args, kwargs, load)
+
+    def _mirror_sql(self, query: str) -> Optional[str]:
+        """SQL answering ``query`` when it is a mirrored read and the mirror is filled."""
+
+        if self.mirror is None or not self.mirror.synced:
+            return None
+        method = mirrored_statements().get(_normalise(query))
+        return MIRROR_QUERIES[method] if method is not None else None
+
+    def execute_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        sql = self._mirror_sql(query)
+        if sql is None:
+            return super().execute_query(query, parameters)
+        assert self.mirror is not None
+        keys, rows = self.mirror.query(sql, parameters)
+        return [dict(zip(keys, row)) for row in rows]
+
+    def execute_query_frame(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        columns: Optional[ColumnSpec] = None,
+    ) -> pd.DataFrame:
+        sql = self._mirror_sql(query)
+        if sql is None:
+            return super().execute_query_frame(query, parameters, columns)
+        assert self.mirror is not None
+        keys, rows = self.mirror.query(sql, parameters)
+        return _typed_frame(keys, [list(column) for column in zip(*rows)] if rows else [[] for _ in keys], columns)
+
+    def iter_cost_line_items(
+        self,
+        product: Optional[str] = None,
+        category: Optional[str] = None,
+        fetch_size: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream individual CostData line items from the mirror in batches."""
+
+        if not self._mirror_ready():
+            yield from super().iter_cost_line_items(product, category, fetch_size)
+            return
+        assert self.mirror is not None
+        yield from self.mirror.stream(
+            MIRROR_QUERIES["iter_cost_line_items"],
+            {"product": product, "category": category},
+            fetch_size or CONNECTION_SETTINGS["stream_fetch_size"],
+        )
+
+    def get_connection_status(self) -> Dict[str, Any]:
+        status = super().get_connection_status()
+        status["analytics_backend"] = ANALYTICS_BACKEND_DUCKDB if self.mirror is not None else ANALYTICS_BACKEND_NEO4J
+        return status
+
+    def close(self) -> None:
+        if self.mirror is not None:
+            self.mirror.close()
+        super().close()
+
+
+__all__ = ["MIRROR_QUERIES", "TABLES", "AnalyticalMirror", "MirrorConnection"]
@@ -0,0 +1,147 @@
+"""
+Metrics backend protocol and registry for the dashboard data layer.
+Pages only depend on ``MetricsBackend``; which implementation serves it is
+chosen by name from ``AGGREGATE_SETTINGS["analytics_backend"]``, so other
+engines (snapshots, replays, in-memory frames) can be plugged in and
+benchmarked side by side.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, runtime_checkable
+
+import pandas as pd
+
+from ..config import AGGREGATE_SETTINGS
+from .analytical_mirror import MirrorConnection
+from .connection import ANALYTICS_BACKEND_DUCKDB, ANALYTICS_BACKEND_NEO4J, Neo4jConnection
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@runtime_checkable
+class MetricsBackend(Protocol):
+    """Read API the pages use; ``Neo4jConnection`` is the reference implementation.
+
+    Money values are in the model's currency and volumes in kg. List reads
+    return plain dicts with the keys documented on ``Neo4jConnection``;
+    ``*_frame`` reads return typed DataFrames. Backends may additionally
+    offer ``cancel_run()`` for script-run cancellation; it is optional.
+    """
+
+    connected: bool
+    error_message: Optional[str]
+
+    # Revenue
+    def get_product_count(self) -> int: ...
+    def get_total_revenue(self) -> float: ...
+    def get_total_volume(self) -> float: ...
+    def get_average_monthly_revenue(self) -> float: ...
+    def get_average_price_per_kg(self) -> float: ...
+    def get_product_metrics(self) -> List[Dict[str, Any]]: ...
+    def get_product_monthly_performance_frame(self) -> pd.DataFrame: ...
+    def get_product_monthly_performance(self) -> List[Dict[str, Any]]: ...
+    def get_revenue_timeseries_frame(self) -> pd.DataFrame: ...
+    def get_revenue_timeseries(self) -> List[Dict[str, Any]]: ...
+    def get_quarterly_revenue(self) -> List[Dict[str, Any]]: ...
+
+    # Costs
+    def get_total_costs(self) -> float: ...
+    def get_variable_costs(self) -> float: ...
+    def get_fixed_costs(self) -> float: ...
+    def get_cost_timeseries(
+        self, product: Optional[str] = None, category: Optional[str] = None
+    ) -> List[Dict[str, Any]]: ...
+    def get_quarterly_costs(
+        self, product: Optional[str] = None, category: Optional[str] = None
+    ) -> List[Dict[str, Any]]: ...
+    def get_cost_categories(self) -> List[str]: ...
+    def iter_cost_line_items(
+        self, product: Optional[str] = None, category: Optional[str] = None, fetch_size: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]: ...
+    def get_product_costs(self, product_name: str) -> List[Dict[str, Any]]: ...
+    def get_product_cost_breakdown(self) -> List[Dict[str, Any]]: ...
+    def get_product_variable_cost(self, product_name: str) -> float: ...
+    def get_product_variable_costs(self) -> Dict[str, float]: ...
+    def get_average_cost_per_kg(self) -> float: ...
+    def get_variable_cost_timeseries_frame(self) -> pd.DataFrame: ...
+    def get_variable_cost_timeseries(self) -> List[Dict[str, Any]]: ...
+    def get_fixed_cost_timeseries_frame(self) -> pd.DataFrame: ...
+    def get_fixed_cost_timeseries(self) -> List[Dict[str, Any]]: ...
+    def get_cost_totals_by_behavior(self) -> Dict[str, float]: ...
+    def get_cost_totals_by_category(self) -> List[Dict[str, Any]]: ...
+
+    # Theory of Constraints
+    def get_throughput(self) -> float: ...
+    def get_inventory_investment(self) -> float: ...
+    def get_operating_expense(self) -> float: ...
+    def get_toc_roi(self) -> float: ...
+    def get_toc_productivity(self) -> float: ...
+    def get_investment_turn(self) -> float: ...
+    def get_inventory_turnover(self) -> float: ...
+    def get_daily_throughput_rate(self, days: int = 365) -> float: ...
+    def get_product_throughput(self, product_name: str) -> float: ...
+    def get_product_toc_metrics(self, product_name: str) -> Dict[str, Any]: ...
+
+    # Housekeeping
+    def get_connection_status(self) -> Dict[str, Any]: ...
+    def close(self) -> None: ...
+
+
+BackendFactory = Callable[[], MetricsBackend]
+
+_FACTORIES: Dict[str, BackendFactory] = {
+    ANALYTICS_BACKEND_NEO4J: Neo4jConnection,
+    ANALYTICS_BACKEND_DUCKDB: MirrorConnection,
+}
+
+
+def register_backend(name: str, factory: BackendFactory) -> None:
+    """Make ``factory`` selectable as ``GOLDENBERRY_ANALYTICS_BACKEND=<name>``."""
+
+    _FACTORIES[name] = factory
+
+
+def available_backends() -> List[str]:
+    return sorted(_FACTORIES)
+
+
+def missing_methods(backend: Any) -> List[str]:
+    """Return the protocol members ``backend`` does not provide."""
+
+    members = [name for name in MetricsBackend.__annotations__] + [
+        name for name, value in vars(MetricsBackend).items() if callable(value) and not name.startswith("_")
+    ]
+    return [name for name in members if not hasattr(backend, name)]
+
+
+def create_backend(name: Optional[str] = None) -> MetricsBackend:
+    """Build the named backend: a registered name or ``module:factory``."""
+
+    name = name or AGGREGATE_SETTINGS["analytics_backend"]
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        module_name, _, attribute = name.partition(":")
+        if not attribute:
+            raise ValueError(f"Unknown metrics backend: {name} (registered: {', '.join(available_backends())})")
+        factory = getattr(importlib.import_module(module_name), attribute)
+
+    backend = factory()
+    missing = missing_methods(backend)
+    if missing:
+        raise TypeError(f"Metrics backend {name} does not implement: {', '.join(missing)}")
+    logger.info("Using %s metrics backend (%s)", name, type(backend).__name__)
+    return backend
+
+
+__all__ = [
+    "BackendFactory",
+    "MetricsBackend",
+    "available_backends",
+    "create_backend",
+    "missing_methods",
+    "register_backend",
+]
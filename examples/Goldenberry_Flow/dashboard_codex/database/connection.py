@@ -7,26 +7,145 @@ logging, typing, and data post-processing.
 from __future__ import annotations
 
 import logging
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
-
-from neo4j import GraphDatabase
-
-from ..config import CONNECTION_SETTINGS, NEO4J_CONFIG
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import pandas as pd
+from neo4j import GraphDatabase, Query
+
+from ..config import AGGREGATE_SETTINGS, CACHE_SETTINGS, CONNECTION_SETTINGS, NEO4J_CONFIG
+from .data_version import DOMAIN_COST, DOMAIN_MODEL, DOMAIN_REVENUE, DOMAINS, read_versions
+from .period_cache import ClosedPeriodCache
+from .shared_cache import SharedResultCache, create_store
+
+if TYPE_CHECKING:  # pragma: no cover - for type checkers only
+    from .backend import MetricsBackend
+    from .cost_propagation import CostToServe
+    from .model_graph import ModelGraph
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+READ_MODE_LIVE = "live"
+READ_MODE_MATERIALIZED = "materialized"
+
+ANALYTICS_BACKEND_NEO4J = "neo4j"
+ANALYTICS_BACKEND_DUCKDB = "duckdb"
+
+# Per-thread ``run_token`` (set by run_scope()) tagging reads with the
+# Streamlit script run that issued them.
+_thread_state = threading.local()
+
+# Transaction metadata key carrying the run token, used to find and kill the
+# reads of an abandoned script run.
+RUN_TOKEN_METADATA_KEY = "dashboardRun"
+
+RUN_TRANSACTIONS_QUERY = f"""
+SHOW TRANSACTIONS
+YIELD transactionId, metaData
+WHERE metaData.{RUN_TOKEN_METADATA_KEY} = $token
+RETURN transactionId
+"""
+
+TERMINATE_TRANSACTIONS_QUERY = "TERMINATE TRANSACTIONS $transaction_ids"
+
+# Result column -> (frame column, dtype) for the columnar read path.
+ColumnSpec = Dict[str, Tuple[str, str]]
+
+REVENUE_TIMESERIES_COLUMNS: ColumnSpec = {
+    "Product": ("product", "object"),
+    "PeriodId": ("period_id", "object"),
+    "Year": ("year", "int64"),
+    "Month": ("month", "int64"),
+    "MonthlyRevenue": ("revenue", "float64"),
+}
+MONTHLY_PERFORMANCE_COLUMNS: ColumnSpec = {
+    **REVENUE_TIMESERIES_COLUMNS,
+    "MonthlyVolume": ("volume", "float64"),
+}
+VARIABLE_COST_COLUMNS: ColumnSpec = {
+    "product": ("product", "object"),
+    "period_id": ("period_id", "object"),
+    "year": ("year", "int64"),
+    "month": ("month", "int64"),
+    "cost": ("cost", "float64"),
+}
+FIXED_COST_COLUMNS: ColumnSpec = {
+    "category": ("category", "object"),
+    "period_id": ("period_id", "object"),
+    "year": ("year", "int64"),
+    "month": ("month", "int64"),
+    "cost": ("cost", "float64"),
+}
+
+
+@contextmanager
+def run_scope(token: Optional[str]) -> Iterator[None]:
+    """Tag reads issued by the current thread with a script-run token."""
+
+    previous = getattr(_thread_state, "run_token", None)
+    _thread_state.run_token = token
+    try:
+        yield
+    finally:
+        _thread_state.run_token = previous
+
+
+def _versioned(*domains: str):
+    """Reuse a read method's result until a DataVersion of ``domains`` changes."""
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return self._versioned_read(method.__name__, domains, args, kwargs, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
 
 class Neo4jConnection:
     """Lightweight wrapper around the Neo4j Python driver."""
 
     TOC_WORKING_CAPITAL_BUFFER: float = 1.5
 
-    def __init__(self) -> None:
+    def __init__(self, read_mode: Optional[str] = None) -> None:
         self._driver = None
         self.connected: bool = False
         self.error_message: Optional[str] = None
+        self.read_mode: str = read_mode or AGGREGATE_SETTINGS["read_mode"]
+        self.period_cache: Optional[ClosedPeriodCache] = None
+        if CACHE_SETTINGS["closed_period_cache"]:
+            self.period_cache = ClosedPeriodCache(
+                CACHE_SETTINGS["closed_period_dir"],
+                f"{NEO4J_CONFIG.uri}/{NEO4J_CONFIG.database}",
+            )
+        self._result_cache: "OrderedDict[Tuple[Any, ...], Tuple[Tuple[int, ...], Any]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._snapshots: Dict[Tuple[str, str], Tuple[Tuple[Optional[int], ...], Any]] = {}
+        self._snapshot_lock = threading.Lock()
+        self.shared_cache: Optional[SharedResultCache] = None
+        try:
+            store = create_store(CACHE_SETTINGS["shared_cache"], CACHE_SETTINGS["shared_cache_path"])
+        except Exception as exc:
+            logger.error("Shared result cache disabled: %s", exc)
+            store = None
+        if store is not None:
+            self.shared_cache = SharedResultCache(
+                store,
+                f"{NEO4J_CONFIG.uri}/{NEO4J_CONFIG.database}",
+                ttl=CACHE_SETTINGS["shared_cache_ttl"],
+            )
+        self._versions: Optional[Dict[str, Optional[int]]] = None
+        self._versions_read_at: float = 0.0
+        self._version_lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._inflight_runs: Dict[str, int] = {}
+        self._cancelled_runs: Set[str] = set()
 
         try:
             self._driver = GraphDatabase.driver(
@@ -73,57 +192,393 @@ class Neo4jConnection:
         assert self._driver is not None
 
         try:
-            with self._driver.session(database=NEO4J_CONFIG.database) as session:
-                result = session.run(query, parameters or {})
+            with self._track_query() as token, self._driver.session(database=NEO4J_CONFIG.database) as session:
+                result = session.run(_tagged(query, token), parameters or {})
                 return [record.data() for record in result]
         except Exception as exc:
             message = f"Query execution failed: {exc}"
             logger.error(message)
             raise RuntimeError(message) from exc
 
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = None,
+        fetch_size: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield result rows in batches, keeping the session open until exhausted.
+
+        ``fetch_size`` bounds how many records the driver buffers per round
+        trip; ``batch_size`` (defaults to ``fetch_size``) bounds each yielded
+        list. Close the generator early to release the session.
+        """
+
+        if not self.connected:
+            raise RuntimeError(self.error_message or "Database connection is not ready")
+
+        assert self._driver is not None
+
+        fetch = fetch_size or CONNECTION_SETTINGS["stream_fetch_size"]
+        batch_limit = batch_size or fetch
+        try:
+            with self._track_query() as token, self._driver.session(
+                database=NEO4J_CONFIG.database, fetch_size=fetch
+            ) as session:
+                result = session.run(_tagged(query, token), parameters or {})
+                batch: List[Dict[str, Any]] = []
+                for record in result:
+                    batch.append(record.data())
+                    if len(batch) >= batch_limit:
+                        yield batch
+                        batch = []
+                        # A superseded run may still hold this generator; release the session.
+                        if token is not None and token in self._cancelled_runs:
+                            raise RuntimeError("stream cancelled, its script run was superseded")
+                if batch:
+                    yield batch
+        except Exception as exc:
+            message = f"Query execution failed: {exc}"
+            logger.error(message)
+            raise RuntimeError(message) from exc
+
+    def execute_query_frame(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        columns: Optional[ColumnSpec] = None,
+    ) -> pd.DataFrame:
+        """Execute a Cypher query and decode records straight into typed columns.
+
+        ``columns`` maps result keys to ``(column, dtype)``; numeric nulls
+        become 0 like the record-based helpers. Without a spec every result
+        key becomes an ``object`` column.
+        """
+
+        if not self.connected:
+            raise RuntimeError(self.error_message or "Database connection is not ready")
+
+        assert self._driver is not None
+
+        try:
+            with self._track_query() as token, self._driver.session(database=NEO4J_CONFIG.database) as session:
+                result = session.run(_tagged(query, token), parameters or {})
+                keys = list(result.keys())
+                values: List[List[Any]] = [[] for _ in keys]
+                appenders = [column.append for column in values]
+                for record in result:
+                    for append, value in zip(appenders, record.values()):
+                        append(value)
+        except Exception as exc:
+            message = f"Query execution failed: {exc}"
+            logger.error(message)
+            raise RuntimeError(message) from exc
+
+        return _typed_frame(keys, values, columns)
+
+    def execute_transaction(self, statements: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """Run several write statements atomically in one explicit transaction."""
+
+        if not self.connected:
+            raise RuntimeError(self.error_message or "Database connection is not ready")
+
+        assert self._driver is not None
+
+        def _work(tx) -> List[List[Dict[str, Any]]]:
+            return [[record.data() for record in tx.run(query, parameters or {})] for query, parameters in statements]
+
+        try:
+            # Writes are never tagged: a rerun must not kill an ingestion.
+            with self._driver.session(database=NEO4J_CONFIG.database) as session:
+                return session.execute_write(_work)
+        except Exception as exc:
+            message = f"Transaction failed: {exc}"
+            logger.error(message)
+            raise RuntimeError(message) from exc
+        finally:
+            # Writes may have bumped a DataVersion; re-poll on the next read.
+            self._versions = None
+
+    @contextmanager
+    def _track_query(self) -> Iterator[Optional[str]]:
+        """Yield the run token to tag a query with, tracking it while it runs.
+
+        Tagged queries are counted per run token so cancel_run() knows
+        whether there is anything to kill.
+        """
+
+        token = getattr(_thread_state, "run_token", None)
+        if token is None:
+            yield None
+            return
+        with self._run_lock:
+            self._inflight_runs[token] = self._inflight_runs.get(token, 0) + 1
+        try:
+            yield token
+        finally:
+            with self._run_lock:
+                remaining = self._inflight_runs.pop(token) - 1
+                if remaining:
+                    self._inflight_runs[token] = remaining
+                else:
+                    self._cancelled_runs.discard(token)
+
+    def cancel_run(self, token: str) -> int:
+        """Terminate the reads still running for an abandoned script run.
+
+        Open ``stream_query`` sessions of the run stop at their next batch;
+        server-side transactions are found by their metadata and killed.
+        Returns the number of transactions terminated.
+        """
+
+        with self._run_lock:
+            if not self._inflight_runs.get(token):
+                return 0
+            self._cancelled_runs.add(token)
+
+        try:
+            with run_scope(None):
+                rows = self.execute_query(RUN_TRANSACTIONS_QUERY, {"token": token})
+                transaction_ids = [row["transactionId"] for row in rows]
+                if transaction_ids:
+                    self.execute_query(TERMINATE_TRANSACTIONS_QUERY, {"transaction_ids": transaction_ids})
+        except RuntimeError as exc:
+            logger.warning("Could not cancel queries of run %s: %s", token, exc)
+            return 0
+        if transaction_ids:
+            logger.info("Terminated %d query transaction(s) of superseded run %s", len(transaction_ids), token)
+        return len(transaction_ids)
+
+    def get_data_versions(self, domains: Iterable[str] = DOMAINS) -> Dict[str, Optional[int]]:
+        """Return DataVersion counters, polling the graph at most once per interval."""
+
+        with self._version_lock:
+            now = time.monotonic()
+            if self._versions is None or now - self._versions_read_at >= CACHE_SETTINGS["version_poll_seconds"]:
+                self._versions = read_versions(self, DOMAINS)
+                self._versions_read_at = now
+            return {domain: self._versions.get(domain) for domain in domains}
+
+    def _versioned_read(
+        self,
+        name: str,
+        domains: Tuple[str, ...],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        load: Callable[[], Any],
+    ) -> Any:
+        """Serve a read from the result cache while its domain versions are unchanged.
+
+        Graphs that were never stamped with DataVersion nodes bypass the cache,
+        since there is no way to tell whether they changed. With a shared cache
+        configured, local misses are filled from it, and only one process
+        computes each (read, versions) key. The cache holds at most
+        ``CACHE_SETTINGS["result_cache_size"]`` results and is shared by the
+        sessions using this connection. Callers get copied lists and dicts and shallow frame
+        copies, and must treat everything else they receive as read-only.
+        """
+
+        if not CACHE_SETTINGS["versioned_cache"]:
+            return load()
+
+        versions = self.get_data_versions(domains)
+        if any(version is None for version in versions.values()):
+            return load()
+
+        stamp = tuple(versions[domain] for domain in domains)
+        key = (name, self.read_mode, args, tuple(sorted(kwargs.items())))
+        with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._result_cache.move_to_end(key)
+                return _detached(entry[1])
+
+        if self.shared_cache is not None:
+            value = self.shared_cache.get_or_load(key + (stamp,), load)
+        else:
+            value = load()
+        with self._result_cache_lock:
+            self._result_cache[key] = (stamp, value)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > max(CACHE_SETTINGS["result_cache_size"], 0):
+                self._result_cache.popitem(last=False)
+        return _detached(value)
+
+    def _snapshot(self, name: str, domains: Tuple[str, ...], build: Callable[[], Any]) -> Any:
+        """Return the one object ``build()`` made for the current versions of ``domains``.
+
+        In-memory models (``ModelGraph``, ``CostToServe``) are kept in a slot
+        of their own rather than the result cache: they are neither copied nor
+        evicted nor pickled into the shared cache, so lazily derived state
+        survives between calls. Every caller gets the same instance and must
+        treat it as immutable. Unversioned graphs rebuild it on each call.
+        """
+
+        versions = self.get_data_versions(domains)
+        stamp = tuple(versions[domain] for domain in domains)
+        cacheable = CACHE_SETTINGS["versioned_cache"] and None not in stamp
+        key = (name, self.read_mode)
+        if cacheable:
+            with self._snapshot_lock:
+                entry = self._snapshots.get(key)
+                if entry is not None and entry[0] == stamp:
+                    return entry[1]
+
+        value = build()
+        if cacheable:
+            with self._snapshot_lock:
+                entry = self._snapshots.get(key)
+                if entry is not None and entry[0] == stamp:
+                    return entry[1]  # another thread built it first
+                self._snapshots[key] = (stamp, value)
+        return value
+
+    def _select_query(self, live: str, materialized: str) -> str:
+        """Pick the live traversal or the MonthlyFact read for the current mode."""
+
+        return materialized if self.read_mode == READ_MODE_MATERIALIZED else live
+
+    @_versioned(DOMAIN_REVENUE, DOMAIN_COST)
+    def get_period_catalog(self) -> List[Dict[str, Any]]:
+        """Return every TimePeriod with its quarter and fiscal-close flag."""
+
+        query = """
+        MATCH (tp:TimePeriod)
+        RETURN tp.id AS id, tp.year AS year, tp.month AS month, tp.quarter AS quarter,
+               coalesce(tp.closed, false) AS closed, coalesce(tp.closedVersion, 0) AS closed_version
+        ORDER BY year, month
+        """
+        return self.execute_query(query)
+
+    def _read_period_frame(
+        self,
+        dataset: str,
+        query: str,
+        columns: ColumnSpec,
+        sort_by: List[str],
+    ) -> pd.DataFrame:
+        """Run a per-period query, serving closed periods from the on-disk cache.
+
+        ``query`` must filter on ``$period_ids``/``$excluded_period_ids`` and
+        return a period id column. Closed periods are computed once per read
+        mode and ``closedVersion`` of the period, so writes to open months do
+        not touch them; only open periods are aggregated live.
+        """
+
+        if self.period_cache is None:
+            frame = self.execute_query_frame(query, {"period_ids": None, "excluded_period_ids": []}, columns)
+            return frame.sort_values(sort_by, kind="stable", ignore_index=True)
+
+        versions = {
+            row["id"]: int(row.get("closed_version") or 0) for row in self.get_period_catalog() if row.get("closed")
+        }
+        closed = list(versions)
+        cached = self.period_cache.load(dataset, self.read_mode, versions)
+        missing = [period_id for period_id in closed if period_id not in cached]
+        if missing:
+            fresh = self.execute_query_frame(query, {"period_ids": missing, "excluded_period_ids": []}, columns)
+            grouped = {period_id: [] for period_id in missing}
+            for row in fresh.to_dict("records"):
+                grouped.setdefault(row["period_id"], []).append(row)
+            for period_id, rows in grouped.items():
+                self.period_cache.store(dataset, self.read_mode, period_id, versions[period_id], rows)
+            cached.update(grouped)
+
+        live = self.execute_query_frame(query, {"period_ids": None, "excluded_period_ids": closed}, columns)
+        closed_rows = [row for period_id in closed for row in cached.get(period_id, [])]
+        if closed_rows:
+            dtypes = {name: dtype for name, dtype in columns.values()}
+            live = pd.concat([pd.DataFrame(closed_rows).astype(dtypes), live], ignore_index=True)
+        return live.sort_values(sort_by, kind="stable", ignore_index=True)
+
+    def explain_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Return the planner's EXPLAIN tree for a query without executing it."""
+
+        if not self.connected:
+            raise RuntimeError(self.error_message or "Database connection is not ready")
+
+        assert self._driver is not None
+
+        try:
+            with self._driver.session(database=NEO4J_CONFIG.database) as session:
+                summary = session.run("EXPLAIN " + query, parameters or {}).consume()
+                return dict(summary.plan or {})
+        except Exception as exc:
+            message = f"Query explain failed: {exc}"
+            logger.error(message)
+            raise RuntimeError(message) from exc
+
     # Metric helpers ----------------------------------------------------
+    @_versioned(DOMAIN_REVENUE)
     def get_product_count(self) -> int:
         data = self.execute_query("MATCH (p:Product) RETURN count(p) AS product_count")
         return int(data[0]["product_count"]) if data else 0
 
+    @_versioned(DOMAIN_REVENUE)
     def get_total_revenue(self) -> float:
-        query = """
-        MATCH (rs:RevenueStream)-[:HAS_VOLUME_DATA]->(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod),
-              (rs)-[:HAS_PRICE_DATA]->(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
-        RETURN SUM(vd.volume * pd.price) AS totalRevenue
-        """
+        query = self._select_query(
+            """
+            MATCH (rs:RevenueStream)-[:HAS_VOLUME_DATA]->(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod),
+                  (rs)-[:HAS_PRICE_DATA]->(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
+            RETURN SUM(vd.volume * pd.price) AS totalRevenue
+            """,
+            """
+            MATCH (mf:MonthlyFact)
+            RETURN SUM(mf.revenue) AS totalRevenue
+            """,
+        )
         data = self.execute_query(query)
         return float(data[0]["totalRevenue"] or 0.0) if data else 0.0
 
+    @_versioned(DOMAIN_REVENUE)
     def get_total_volume(self) -> float:
         data = self.execute_query("MATCH (vd:VolumeData) RETURN SUM(vd.volume) AS totalVolume")
         return float(data[0]["totalVolume"] or 0.0) if data else 0.0
 
+    @_versioned(DOMAIN_REVENUE)
     def get_average_monthly_revenue(self) -> float:
-        query = """
-        MATCH (rs:RevenueStream)-[:HAS_VOLUME_DATA]->(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod),
-              (rs)-[:HAS_PRICE_DATA]->(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
-        WITH tp, SUM(vd.volume * pd.price) AS monthlyRevenue
-        RETURN AVG(monthlyRevenue) AS avgMonthlyRevenue
-        """
+        query = self._select_query(
+            """
+            MATCH (rs:RevenueStream)-[:HAS_VOLUME_DATA]->(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod),
+                  (rs)-[:HAS_PRICE_DATA]->(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
+            WITH tp, SUM(vd.volume * pd.price) AS monthlyRevenue
+            RETURN AVG(monthlyRevenue) AS avgMonthlyRevenue
+            """,
+            """
+            MATCH (mf:MonthlyFact)
+            WHERE mf.revenue IS NOT NULL
+            WITH mf.periodId AS period, SUM(mf.revenue) AS monthlyRevenue
+            RETURN AVG(monthlyRevenue) AS avgMonthlyRevenue
+            """,
+        )
         data = self.execute_query(query)
         return float(data[0]["avgMonthlyRevenue"] or 0.0) if data else 0.0
 
+    @_versioned(DOMAIN_REVENUE)
     def get_average_price_per_kg(self) -> float:
-        query = """
-        MATCH (rs:RevenueStream)-[:HAS_VOLUME_DATA]->(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod),
-              (rs)-[:HAS_PRICE_DATA]->(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
-        RETURN SUM(vd.volume * pd.price) / SUM(vd.volume) AS avgPricePerKg
-        """
+        query = self._select_query(
+            """
+            MATCH (rs:RevenueStream)-[:HAS_VOLUME_DATA]->(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod),
+                  (rs)-[:HAS_PRICE_DATA]->(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
+            RETURN SUM(vd.volume * pd.price) / SUM(vd.volume) AS avgPricePerKg
+            """,
+            """
+            MATCH (mf:MonthlyFact)
+            WHERE mf.revenue IS NOT NULL
+            RETURN SUM(mf.revenue) / SUM(mf.volume) AS avgPricePerKg
+            """,
+        )
         data = self.execute_query(query)
         return float(data[0]["avgPricePerKg"] or 0.0) if data else 0.0
 
+    @_versioned(DOMAIN_COST)
     def get_total_costs(self) -> float:
         """Return the sum of all recorded costs."""
 
         data = self.execute_query("MATCH (cd:CostData) RETURN SUM(cd.amount) AS totalCosts")
         return float(data[0]["totalCosts"] or 0.0) if data else 0.0
 
+    @_versioned(DOMAIN_COST)
     def get_variable_costs(self) -> float:
         """Return the sum of all product-linked costs."""
 
@@ -134,6 +589,7 @@ class Neo4jConnection:
         data = self.execute_query(query)
         return float(data[0]["variableCosts"] or 0.0) if data else 0.0
 
+    @_versioned(DOMAIN_COST)
     def get_fixed_costs(self) -> float:
         """Return the sum of costs without an associated product."""
 
@@ -145,6 +601,7 @@ class Neo4jConnection:
         data = self.execute_query(query)
         return float(data[0]["fixedCosts"] or 0.0) if data else 0.0
 
+    @_versioned(DOMAIN_COST)
     def get_cost_timeseries(self, product: Optional[str] = None, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """Return monthly cost totals optionally filtered by product or category."""
 
@@ -178,6 +635,7 @@ class Neo4jConnection:
 
         return records
 
+    @_versioned(DOMAIN_COST)
     def get_quarterly_costs(self, product: Optional[str] = None, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """Return quarterly cost totals optionally filtered by product or category."""
 
@@ -211,6 +669,7 @@ class Neo4jConnection:
 
         return records
 
+    @_versioned(DOMAIN_COST)
     def get_cost_categories(self) -> List[str]:
         """Return the list of cost structures that have recorded costs."""
 
@@ -222,6 +681,36 @@ class Neo4jConnection:
         result = self.execute_query(query)
         return [row["name"] for row in result if row.get("name")]
 
+    def iter_cost_line_items(
+        self,
+        product: Optional[str] = None,
+        category: Optional[str] = None,
+        fetch_size: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream individual CostData line items in batches for drill-downs and exports."""
+
+        query = """
+        MATCH (cd:CostData)-[:INCURRED_IN_PERIOD]->(tp:TimePeriod)
+        MATCH (cd)-[:COST_FOR_STRUCTURE]->(cs:CostStructure)
+        OPTIONAL MATCH (cd)-[:COST_FOR_PRODUCT]->(p:Product)
+        WITH cd, tp, cs, p
+        WHERE ($product IS NULL OR p.name = $product)
+          AND ($category IS NULL OR cs.name = $category)
+        RETURN cd.id AS id,
+               tp.id AS period_id,
+               tp.year AS year,
+               tp.month AS month,
+               cs.name AS category,
+               p.name AS product,
+               cd.costBehavior AS behavior,
+               cd.amount AS amount,
+               cd.unit AS unit,
+               cd.description AS description
+        ORDER BY year, month, id
+        """
+        yield from self.stream_query(query, {"product": product, "category": category}, fetch_size=fetch_size)
+
+    @_versioned(DOMAIN_COST)
     def get_product_costs(self, product_name: str) -> List[Dict[str, Any]]:
         """Return cost totals per category for a specific product."""
 
@@ -245,22 +734,76 @@ class Neo4jConnection:
             )
 
         return records
-    def get_product_variable_cost(self, product_name: str) -> float:
-        """Return aggregated variable cost for a specific product."""
+    @_versioned(DOMAIN_COST)
+    def get_product_cost_breakdown(self) -> List[Dict[str, Any]]:
+        """Return cost totals per product, category and behaviour for all products at once."""
 
         query = """
-        MATCH (p:Product {name: $product_name})
-        MATCH (cd:CostData {costBehavior: 'variable'})-[:COST_FOR_PRODUCT]->(p)
-        RETURN SUM(cd.amount) AS variableCost
+        MATCH (cd:CostData)-[:COST_FOR_PRODUCT]->(p:Product)
+        OPTIONAL MATCH (cd)-[:COST_FOR_STRUCTURE]->(cs:CostStructure)
+        RETURN p.name AS product,
+               cs.name AS category,
+               cd.costBehavior AS behavior,
+               SUM(cd.amount) AS totalCost
+        ORDER BY product, totalCost DESC
         """
+        result = self.execute_query(query)
+
+        return [
+            {
+                "product": row.get("product"),
+                "category": row.get("category"),
+                "behavior": (row.get("behavior") or "").lower(),
+                "cost": float(row.get("totalCost") or 0.0),
+            }
+            for row in result
+        ]
+
+    @_versioned(DOMAIN_REVENUE, DOMAIN_COST)
+    def get_product_variable_cost(self, product_name: str) -> float:
+        """Return aggregated variable cost for a specific product."""
+
+        query = self._select_query(
+            """
+            MATCH (p:Product {name: $product_name})
+            MATCH (cd:CostData {costBehavior: 'variable'})-[:COST_FOR_PRODUCT]->(p)
+            RETURN SUM(cd.amount) AS variableCost
+            """,
+            """
+            MATCH (mf:MonthlyFact {productName: $product_name})
+            RETURN SUM(mf.variableCost) AS variableCost
+            """,
+        )
         result = self.execute_query(query, {"product_name": product_name})
         if not result:
             return 0.0
         value = result[0].get("variableCost")
         return float(value or 0.0)
 
+    @_versioned(DOMAIN_REVENUE, DOMAIN_COST)
+    def get_product_variable_costs(self) -> Dict[str, float]:
+        """Return ``get_product_variable_cost`` for every product in one query."""
+
+        query = self._select_query(
+            """
+            MATCH (cd:CostData {costBehavior: 'variable'})-[:COST_FOR_PRODUCT]->(p:Product)
+            RETURN p.name AS product, SUM(cd.amount) AS variableCost
+            """,
+            """
+            MATCH (mf:MonthlyFact)
+            WHERE mf.productName IS NOT NULL
+            RETURN mf.productName AS product, SUM(mf.variableCost) AS variableCost
+            """,
+        )
+        return {
+            row["product"]: float(row.get("variableCost") or 0.0)
+            for row in self.execute_query(query)
+            if row.get("product")
+        }
+
 
 
+    @_versioned(DOMAIN_REVENUE, DOMAIN_COST)
     def get_average_cost_per_kg(self) -> float:
         """Return the weighted average cost per kilogram across all products."""
 
@@ -276,60 +819,72 @@ class Neo4jConnection:
         return float(data[0]["avgCostPerKg"] or 0.0) if data else 0.0
 
 
+    @_versioned(DOMAIN_COST)
+    def get_variable_cost_timeseries_frame(self) -> pd.DataFrame:
+        """Return monthly variable costs grouped by product as a typed DataFrame."""
+
+        query = self._select_query(
+            """
+            MATCH (cd:CostData {costBehavior: 'variable'})-[:INCURRED_IN_PERIOD]->(tp:TimePeriod)
+            WHERE ($period_ids IS NULL OR tp.id IN $period_ids) AND NOT tp.id IN $excluded_period_ids
+            MATCH (cd)-[:COST_FOR_PRODUCT]->(p:Product)
+            RETURN p.name AS product,
+                   tp.id AS period_id,
+                   tp.year AS year,
+                   tp.month AS month,
+                   SUM(cd.amount) AS cost
+            ORDER BY year, month, product
+            """,
+            """
+            MATCH (mf:MonthlyFact)
+            WHERE mf.variableCost IS NOT NULL
+              AND ($period_ids IS NULL OR mf.periodId IN $period_ids) AND NOT mf.periodId IN $excluded_period_ids
+            RETURN mf.productName AS product,
+                   mf.periodId AS period_id,
+                   mf.year AS year,
+                   mf.month AS month,
+                   mf.variableCost AS cost
+            ORDER BY year, month, product
+            """,
+        )
+
+        return self._read_period_frame(
+            "variable_cost_timeseries", query, VARIABLE_COST_COLUMNS, ["year", "month", "product"]
+        )
+
     def get_variable_cost_timeseries(self) -> List[Dict[str, Any]]:
         """Return monthly variable costs grouped by product."""
 
-        query = """
-        MATCH (cd:CostData {costBehavior: 'variable'})-[:INCURRED_IN_PERIOD]->(tp:TimePeriod)
-        MATCH (cd)-[:COST_FOR_PRODUCT]->(p:Product)
-        RETURN p.name AS product,
-               tp.year AS year,
-               tp.month AS month,
-               SUM(cd.amount) AS cost
-        ORDER BY year, month, product
-        """
-        result = self.execute_query(query)
+        return self.get_variable_cost_timeseries_frame().to_dict("records")
 
-        records: List[Dict[str, Any]] = []
-        for row in result:
-            records.append(
-                {
-                    "product": row.get("product"),
-                    "year": int(row.get("year") or 0),
-                    "month": int(row.get("month") or 0),
-                    "cost": float(row.get("cost") or 0.0),
-                }
-            )
-        return records
 
-
-    def get_fixed_cost_timeseries(self) -> List[Dict[str, Any]]:
-        """Return monthly fixed costs grouped by cost structure."""
+    @_versioned(DOMAIN_COST)
+    def get_fixed_cost_timeseries_frame(self) -> pd.DataFrame:
+        """Return monthly fixed costs grouped by cost structure as a typed DataFrame."""
 
         query = """
         MATCH (cd:CostData {costBehavior: 'fixed'})-[:INCURRED_IN_PERIOD]->(tp:TimePeriod)
+        WHERE ($period_ids IS NULL OR tp.id IN $period_ids) AND NOT tp.id IN $excluded_period_ids
         MATCH (cd)-[:COST_FOR_STRUCTURE]->(cs:CostStructure)
         RETURN cs.name AS category,
+               tp.id AS period_id,
                tp.year AS year,
                tp.month AS month,
                SUM(cd.amount) AS cost
         ORDER BY year, month, category
         """
-        result = self.execute_query(query)
 
-        records: List[Dict[str, Any]] = []
-        for row in result:
-            records.append(
-                {
-                    "category": row.get("category"),
-                    "year": int(row.get("year") or 0),
-                    "month": int(row.get("month") or 0),
-                    "cost": float(row.get("cost") or 0.0),
-                }
-            )
-        return records
+        return self._read_period_frame(
+            "fixed_cost_timeseries", query, FIXED_COST_COLUMNS, ["year", "month", "category"]
+        )
 
+    def get_fixed_cost_timeseries(self) -> List[Dict[str, Any]]:
+        """Return monthly fixed costs grouped by cost structure."""
+
+        return self.get_fixed_cost_timeseries_frame().to_dict("records")
 
+
+    @_versioned(DOMAIN_COST)
     def get_cost_totals_by_behavior(self) -> Dict[str, float]:
         """Return aggregated totals for variable and fixed costs."""
 
@@ -345,6 +900,7 @@ class Neo4jConnection:
                 totals[behavior] = float(row.get("total") or 0.0)
         return totals
 
+    @_versioned(DOMAIN_COST)
     def get_cost_totals_by_category(self) -> List[Dict[str, Any]]:
         """Return aggregated cost totals per cost structure."""
 
@@ -506,24 +1062,38 @@ class Neo4jConnection:
         }
 
 
+    @_versioned(DOMAIN_REVENUE)
     def get_product_metrics(self) -> List[Dict[str, Any]]:
         """Get metrics for all products"""
 
-        query = """
-        MATCH (p:Product)
-        OPTIONAL MATCH (rs:RevenueStream)-[:SELLS_PRODUCT]->(p)
-        OPTIONAL MATCH (rs)-[:HAS_VOLUME_DATA]->(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod)
-        OPTIONAL MATCH (rs)-[:HAS_PRICE_DATA]->(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
-        WITH p.name as Product,
-             SUM(vd.volume * pd.price) as TotalRevenue,
-             SUM(vd.volume) as TotalVolume,
-             CASE WHEN SUM(vd.volume) = 0 THEN null ELSE SUM(vd.volume * pd.price) / SUM(vd.volume) END as AvgPrice
-        RETURN Product,
-               TotalRevenue,
-               TotalVolume,
-               AvgPrice
-        ORDER BY TotalRevenue DESC
-        """
+        query = self._select_query(
+            """
+            MATCH (p:Product)
+            OPTIONAL MATCH (p)<-[:VOLUME_FOR_PRODUCT]-(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod),
+                           (p)<-[:PRICE_FOR_PRODUCT]-(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
+            WITH p.name as Product,
+                 SUM(vd.volume * pd.price) as TotalRevenue,
+                 SUM(vd.volume) as TotalVolume
+            RETURN Product,
+                   TotalRevenue,
+                   TotalVolume,
+                   CASE WHEN TotalVolume = 0 THEN null ELSE TotalRevenue / TotalVolume END as AvgPrice
+            ORDER BY TotalRevenue DESC
+            """,
+            """
+            MATCH (p:Product)
+            OPTIONAL MATCH (mf:MonthlyFact {productId: p.id})
+            WHERE mf.revenue IS NOT NULL
+            WITH p.name as Product,
+                 SUM(mf.revenue) as TotalRevenue,
+                 SUM(mf.volume) as TotalVolume
+            RETURN Product,
+                   TotalRevenue,
+                   TotalVolume,
+                   CASE WHEN TotalVolume = 0 THEN null ELSE TotalRevenue / TotalVolume END as AvgPrice
+            ORDER BY TotalRevenue DESC
+            """,
+        )
         rows = self.execute_query(query)
 
         processed: List[Dict[str, Any]] = []
@@ -537,85 +1107,111 @@ class Neo4jConnection:
                 }
             )
         return processed
+    @_versioned(DOMAIN_REVENUE)
+    def get_product_monthly_performance_frame(self) -> pd.DataFrame:
+        """Return monthly revenue and volume for each product as a typed DataFrame."""
+
+        query = self._select_query(
+            """
+            MATCH (p:Product)<-[:VOLUME_FOR_PRODUCT]-(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod)
+            WHERE ($period_ids IS NULL OR tp.id IN $period_ids) AND NOT tp.id IN $excluded_period_ids
+            MATCH (p)<-[:PRICE_FOR_PRODUCT]-(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
+            WITH p.name AS Product,
+                 tp.id AS PeriodId,
+                 tp.year AS Year,
+                 tp.month AS Month,
+                 SUM(pd.price * vd.volume) AS MonthlyRevenue,
+                 SUM(vd.volume) AS MonthlyVolume
+            RETURN Product, PeriodId, Year, Month, MonthlyRevenue, MonthlyVolume
+            ORDER BY Year, Month, Product
+            """,
+            """
+            MATCH (mf:MonthlyFact)
+            WHERE mf.revenue IS NOT NULL
+              AND ($period_ids IS NULL OR mf.periodId IN $period_ids) AND NOT mf.periodId IN $excluded_period_ids
+            RETURN mf.productName AS Product,
+                   mf.periodId AS PeriodId,
+                   mf.year AS Year,
+                   mf.month AS Month,
+                   mf.revenue AS MonthlyRevenue,
+                   mf.volume AS MonthlyVolume
+            ORDER BY Year, Month, Product
+            """,
+        )
+
+        return self._read_period_frame(
+            "product_monthly_performance",
+            query,
+            MONTHLY_PERFORMANCE_COLUMNS,
+            ["year", "month", "product"],
+        )
+
     def get_product_monthly_performance(self) -> List[Dict[str, Any]]:
         """Return monthly revenue and volume for each product."""
 
-        query = """
-        MATCH (p:Product)
-        MATCH (pd:PriceData)-[:PRICE_FOR_PRODUCT]->(p)
-        MATCH (vd:VolumeData)-[:VOLUME_FOR_PRODUCT]->(p)
-        MATCH (pd)-[:PRICED_IN_PERIOD]->(tp:TimePeriod)
-        MATCH (vd)-[:OCCURS_IN_PERIOD]->(tp2:TimePeriod)
-        WHERE tp.id = tp2.id
-        WITH p.name AS Product,
-             tp.year AS Year,
-             tp.month AS Month,
-             SUM(pd.price * vd.volume) AS MonthlyRevenue,
-             SUM(vd.volume) AS MonthlyVolume
-        RETURN Product, Year, Month, MonthlyRevenue, MonthlyVolume
-        ORDER BY Year, Month, Product
-        """
-        result = self.execute_query(query)
-
-        records: List[Dict[str, Any]] = []
-        for row in result:
-            records.append(
-                {
-                    "product": row["Product"],
-                    "year": int(row["Year"]),
-                    "month": int(row["Month"]),
-                    "revenue": float(row["MonthlyRevenue"] or 0.0),
-                    "volume": float(row["MonthlyVolume"] or 0.0),
-                }
-            )
+        return self.get_product_monthly_performance_frame().to_dict("records")
+    @_versioned(DOMAIN_REVENUE)
+    def get_revenue_timeseries_frame(self) -> pd.DataFrame:
+        """Return monthly revenue per product as a typed DataFrame."""
+
+        query = self._select_query(
+            """
+            MATCH (p:Product)<-[:VOLUME_FOR_PRODUCT]-(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod)
+            WHERE ($period_ids IS NULL OR tp.id IN $period_ids) AND NOT tp.id IN $excluded_period_ids
+            MATCH (p)<-[:PRICE_FOR_PRODUCT]-(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
+            WITH p.name AS Product, tp.id AS PeriodId, tp.year AS Year, tp.month AS Month,
+                 SUM(pd.price * vd.volume) AS MonthlyRevenue
+            RETURN Product, PeriodId, Year, Month, MonthlyRevenue
+            ORDER BY Year, Month, Product
+            """,
+            """
+            MATCH (mf:MonthlyFact)
+            WHERE mf.revenue IS NOT NULL
+              AND ($period_ids IS NULL OR mf.periodId IN $period_ids) AND NOT mf.periodId IN $excluded_period_ids
+            RETURN mf.productName AS Product, mf.periodId AS PeriodId, mf.year AS Year, mf.month AS Month,
+                   mf.revenue AS MonthlyRevenue
+            ORDER BY Year, Month, Product
+            """,
+        )
+
+        return self._read_period_frame(
+            "revenue_timeseries", query, REVENUE_TIMESERIES_COLUMNS, ["year", "month", "product"]
+        )
 
-        return records
     def get_revenue_timeseries(self) -> List[Dict[str, Any]]:
         """Return monthly revenue per product."""
 
-        query = """
-        MATCH (p:Product)
-        MATCH (pd:PriceData)-[:PRICE_FOR_PRODUCT]->(p)
-        MATCH (vd:VolumeData)-[:VOLUME_FOR_PRODUCT]->(p)
-        MATCH (pd)-[:PRICED_IN_PERIOD]->(tp:TimePeriod)
-        MATCH (vd)-[:OCCURS_IN_PERIOD]->(tp2:TimePeriod)
-        WHERE tp.id = tp2.id
-        WITH p.name AS Product, tp.year AS Year, tp.month AS Month, SUM(pd.price * vd.volume) AS MonthlyRevenue
-        RETURN Product, Year, Month, MonthlyRevenue
-        ORDER BY Year, Month, Product
-        """
-        result = self.execute_query(query)
-
-        formatted: List[Dict[str, Any]] = []
-        for row in result:
-            formatted.append(
-                {
-                    "product": row["Product"],
-                    "year": int(row["Year"]),
-                    "month": int(row["Month"]),
-                    "revenue": float(row["MonthlyRevenue"] or 0.0),
-                }
-            )
-
-        return formatted
+        return self.get_revenue_timeseries_frame().to_dict("records")
 
+    @_versioned(DOMAIN_REVENUE)
     def get_quarterly_revenue(self) -> List[Dict[str, Any]]:
         """Return quarterly revenue grouped by product."""
 
-        query = """
-        MATCH (p:Product)
-        MATCH (pd:PriceData)-[:PRICE_FOR_PRODUCT]->(p)
-        MATCH (vd:VolumeData)-[:VOLUME_FOR_PRODUCT]->(p)
-        MATCH (pd)-[:PRICED_IN_PERIOD]->(tp:TimePeriod)
-        MATCH (vd)-[:OCCURS_IN_PERIOD]->(tp2:TimePeriod)
-        WHERE tp.id = tp2.id
-        WITH p.name AS Product,
-             tp.year AS Year,
-             tp.quarter AS Quarter,
-             SUM(pd.price * vd.volume) AS QuarterlyRevenue
-        RETURN Product, Year, Quarter, QuarterlyRevenue
-        ORDER BY Year, Quarter, Product
-        """
+        if self.period_cache is not None:
+            return self._rollup_quarterly_revenue()
+
+        query = self._select_query(
+            """
+            MATCH (p:Product)<-[:VOLUME_FOR_PRODUCT]-(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod)
+            MATCH (p)<-[:PRICE_FOR_PRODUCT]-(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
+            WITH p.name AS Product,
+                 tp.year AS Year,
+                 tp.quarter AS Quarter,
+                 SUM(pd.price * vd.volume) AS QuarterlyRevenue
+            RETURN Product, Year, Quarter, QuarterlyRevenue
+            ORDER BY Year, Quarter, Product
+            """,
+            """
+            MATCH (mf:MonthlyFact)
+            WHERE mf.revenue IS NOT NULL
+            WITH mf.productName AS Product,
+                 mf.year AS Year,
+                 mf.quarter AS Quarter,
+                 SUM(mf.revenue) AS QuarterlyRevenue
+            RETURN Product, Year, Quarter, QuarterlyRevenue
+            ORDER BY Year, Quarter, Product
+            """,
+        )
         result = self.execute_query(query)
 
         records: List[Dict[str, Any]] = []
@@ -630,6 +1226,81 @@ class Neo4jConnection:
             )
 
         return records
+    def _rollup_quarterly_revenue(self) -> List[Dict[str, Any]]:
+        """Derive quarterly revenue from the period-cached monthly series."""
+
+        frame = self.get_revenue_timeseries_frame()
+        if frame.empty:
+            return []
+
+        quarters = {row["id"]: _parse_quarter_value(row.get("quarter")) for row in self.get_period_catalog()}
+        frame["quarter"] = frame["period_id"].map(quarters).fillna(0).astype("int64")
+        totals = (
+            frame.groupby(["year", "quarter", "product"], as_index=False, sort=True)["revenue"]
+            .sum()
+        )
+        return totals[["product", "year", "quarter", "revenue"]].to_dict("records")
+
+    # Business model canvas ---------------------------------------------
+    @_versioned(DOMAIN_MODEL)
+    def get_semantic_definitions(self) -> Dict[str, Dict[str, Any]]:
+        """Return the shared semantic texts per canvas label."""
+
+        from .semantic_store import read_semantic_definitions
+
+        return read_semantic_definitions(self)
+
+    @_versioned(DOMAIN_MODEL)
+    def get_canvas_elements(self, label: str) -> List[Dict[str, Any]]:
+        """List a canvas label's nodes without their semantic texts.
+
+        Resolve the texts of a single node with ``describe_canvas_element``.
+        """
+
+        from .model_templates import load_templates
+
+        template = load_templates().labels.get(label)
+        if template is None:
+            raise ValueError(f"Unknown canvas label: {label}")
+        fields = ", ".join(f".{name}" for name in template.properties if name not in template.semantics)
+        return [row["element"] for row in self.execute_query(f"MATCH (n:`{label}`) RETURN n {{{fields}}} AS element ORDER BY n.id")]
+
+    def describe_canvas_element(self, label: str, node_id: str) -> Optional[Dict[str, Any]]:
+        """Return one canvas node with its label's shared semantic texts filled in."""
+
+        from .model_templates import load_templates
+        from .semantic_store import resolve_semantics
+
+        if label not in load_templates().labels:
+            raise ValueError(f"Unknown canvas label: {label}")
+        rows = self.execute_query(f"MATCH (n:`{label}` {{id: $id}}) RETURN properties(n) AS element", {"id": node_id})
+        if not rows:
+            return None
+        return resolve_semantics(self.get_semantic_definitions(), label, rows[0]["element"])
+
+    def get_model_graph(self) -> "ModelGraph":
+        """Return the in-memory CSR snapshot of the non-fact graph.
+
+        Rebuilt only when the model or revenue DataVersion changes (products
+        are part of the snapshot); traversals on it run without Bolt calls.
+        Calls between changes return the same immutable object.
+        """
+
+        from .model_graph import load_model_graph
+
+        return self._snapshot("get_model_graph", (DOMAIN_MODEL, DOMAIN_REVENUE), lambda: load_model_graph(self))
+
+    def get_cost_to_serve(self) -> "CostToServe":
+        """Monthly cost per value proposition, customer segment and job-to-be-done.
+
+        Recomputed only when the model or cost DataVersion changes; calls in
+        between return the same immutable object.
+        """
+
+        from .cost_propagation import load_cost_to_serve
+
+        return self._snapshot("get_cost_to_serve", (DOMAIN_MODEL, DOMAIN_COST), lambda: load_cost_to_serve(self))
+
     # Housekeeping ------------------------------------------------------
     def get_connection_status(self) -> Dict[str, Any]:
         return {
@@ -637,6 +1308,13 @@ class Neo4jConnection:
             "error_message": self.error_message,
             "database_uri": NEO4J_CONFIG.uri,
             "database_name": NEO4J_CONFIG.database,
+            "read_mode": self.read_mode,
+            "shared_cache": (
+                CACHE_SETTINGS["shared_cache"]
+                if self.shared_cache is not None and not self.shared_cache.disabled
+                else None
+            ),
+            "data_versions": dict(self._versions or {}),
         }
 
     def close(self) -> None:
@@ -646,6 +1324,50 @@ class Neo4jConnection:
 
 
 # ------------------------------------------------------------------
+def _detached(value: Any) -> Any:
+    """Copy a cached read result so callers cannot change the cached value.
+
+    Lists and dicts (the rows of record reads) are copied. DataFrames get a
+    shallow copy: adding or replacing columns stays local, editing values in
+    place does not (except under pandas copy-on-write). Scalars and other
+    objects are returned as they are.
+    """
+
+    if isinstance(value, pd.DataFrame):
+        return value.copy(deep=False)
+    if isinstance(value, list):
+        return [_detached(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _detached(item) for key, item in value.items()}
+    return value
+
+
+def _tagged(query: str, token: Optional[str]) -> Union[str, Query]:
+    """Attach the run token as transaction metadata when there is one."""
+
+    if token is None:
+        return query
+    return Query(query, metadata={RUN_TOKEN_METADATA_KEY: token})
+
+
+def _typed_column(values: List[Any], dtype: str) -> pd.Series:
+    """Build one frame column; numeric nulls become zero."""
+
+    if dtype.startswith(("int", "uint")):
+        return pd.Series(values, dtype="float64").fillna(0).astype(dtype)
+    if dtype.startswith("float"):
+        return pd.Series(values, dtype=dtype).fillna(0.0)
+    return pd.Series(values, dtype=dtype)
+
+
+def _typed_frame(keys: List[str], values: List[List[Any]], columns: Optional[ColumnSpec]) -> pd.DataFrame:
+    """Assemble per-key value lists into a frame shaped by ``columns``."""
+
+    spec = columns or {key: (key, "object") for key in keys}
+    by_key = dict(zip(keys, values))
+    return pd.DataFrame({name: _typed_column(by_key.get(key, []), dtype) for key, (name, dtype) in spec.items()})
+
+
 def _parse_quarter_value(raw) -> int:
     """Convert quarter values like "Q3" or 3 to an integer."""
 
@@ -663,10 +1385,12 @@ def _parse_quarter_value(raw) -> int:
 
 
 @lru_cache(maxsize=1)
-def get_connection() -> Neo4jConnection:
-    """Return a cached connection instance."""
+def get_connection() -> "MetricsBackend":
+    """Return a cached instance of the configured metrics backend."""
+
+    from .backend import create_backend
 
-    connection = Neo4jConnection()
+    connection = create_backend()
     return connection
 
 
@@ -677,7 +1401,12 @@ def close_connection() -> None:
 
 
 __all__ = [
+    "READ_MODE_LIVE",
+    "READ_MODE_MATERIALIZED",
+    "ANALYTICS_BACKEND_NEO4J",
+    "ANALYTICS_BACKEND_DUCKDB",
     "Neo4jConnection",
+    "run_scope",
     "get_connection",
     "close_connection",
 ]
@@ -0,0 +1,285 @@
+"""
+Activity-based cost-to-serve over the business-model graph.
+Monthly CostData totals per CostStructure are pushed through sparse
+allocation matrices built from INCURS_COST, REQUIRES_RESOURCE /
+REQUIRES_ACTIVITY, REACHES_THROUGH, TARGETS and DEFINED_BY_JOB, giving the
+cost of every value proposition, customer segment and job-to-be-done per
+month in a handful of matrix products instead of per-entity traversals.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+SOURCE_LABELS: Tuple[str, ...] = ("KeyResource", "KeyActivity", "Channel")
+
+LEVEL_STRUCTURE = "structure"
+LEVEL_SOURCE = "source"
+LEVEL_VALUE_PROPOSITION = "value_proposition"
+LEVEL_SEGMENT = "segment"
+LEVEL_JOB = "job"
+LEVELS: Tuple[str, ...] = (LEVEL_STRUCTURE, LEVEL_SOURCE, LEVEL_VALUE_PROPOSITION, LEVEL_SEGMENT, LEVEL_JOB)
+
+# Allocation stages in order, each keeping the cost it cannot pass on.
+UNALLOCATED_STAGES: Tuple[str, ...] = (
+    "structure without INCURS_COST",
+    "source without value proposition or segment",
+    "value proposition without segment",
+    "segment without job",
+)
+# Level -> number of stages before it. Channel cost reaches segments without
+# passing a value proposition, so that level is checked through the segments.
+_RECONCILED_LEVELS: Dict[str, int] = {LEVEL_SOURCE: 1, LEVEL_SEGMENT: 3, LEVEL_JOB: 4}
+
+MONTHLY_STRUCTURE_COSTS_QUERY = """
+MATCH (cd:CostData)-[:COST_FOR_STRUCTURE]->(cs:CostStructure)
+MATCH (cd)-[:INCURRED_IN_PERIOD]->(tp:TimePeriod)
+RETURN coalesce(cs.id, elementId(cs)) AS structure, tp.id AS period, tp.year AS year, tp.month AS month, sum(cd.amount) AS amount
+"""
+
+# Labels that take part in the allocation. A node is keyed on the first of
+# these it carries, never on whichever label Neo4j happens to list first.
+ALLOCATION_LABELS: Tuple[str, ...] = (
+    ("CostStructure",) + SOURCE_LABELS + ("ValueProposition", "CustomerSegment", "JobToBeDone")
+)
+_LABEL_LIST = ", ".join(f"'{label}'" for label in ALLOCATION_LABELS)
+
+# Nodes without an id cannot be keyed or named, so their edges are skipped.
+ALLOCATION_EDGES_QUERY = f"""
+MATCH (a)-[r:INCURS_COST|REQUIRES_RESOURCE|REQUIRES_ACTIVITY|REACHES_THROUGH|TARGETS|DEFINED_BY_JOB]->(b)
+WHERE a.id IS NOT NULL AND b.id IS NOT NULL
+WITH a, r, b,
+     [label IN [{_LABEL_LIST}] WHERE label IN labels(a)][0] AS start_label,
+     [label IN [{_LABEL_LIST}] WHERE label IN labels(b)][0] AS end_label
+WHERE start_label IS NOT NULL AND end_label IS NOT NULL
+RETURN start_label, a.id AS start, type(r) AS type, end_label, b.id AS end, r.costDriver AS cost_driver
+"""
+
+ENTITY_NAMES_QUERY = """
+MATCH (n)
+WHERE n:CostStructure OR n:KeyResource OR n:KeyActivity OR n:Channel
+   OR n:ValueProposition OR n:CustomerSegment OR n:JobToBeDone
+RETURN n.id AS id, coalesce(n.name, n.title, n.jobStatement, n.id) AS name
+"""
+
+
+@dataclass
+class Allocation:
+    """Sparse ``targets x sources`` matrix in COO form; columns sum to 1 or 0."""
+
+    rows: np.ndarray
+    cols: np.ndarray
+    weights: np.ndarray
+    shape: Tuple[int, int]
+
+    @classmethod
+    def equal_split(cls, pairs: Sequence[Tuple[int, int]], shape: Tuple[int, int]) -> "Allocation":
+        """Split each source evenly over its targets; ``pairs`` are ``(target, source)``."""
+
+        unique = sorted(set(pairs))
+        rows = np.fromiter((target for target, _ in unique), dtype=np.int64, count=len(unique))
+        cols = np.fromiter((source for _, source in unique), dtype=np.int64, count=len(unique))
+        fan_out = np.bincount(cols, minlength=shape[1]).astype(float)
+        weights = 1.0 / fan_out[cols] if len(cols) else np.empty(0)
+        return cls(rows, cols, weights, shape)
+
+    def __matmul__(self, dense: np.ndarray) -> np.ndarray:
+        result = np.zeros((self.shape[0], dense.shape[1]))
+        np.add.at(result, self.rows, self.weights[:, None] * dense[self.cols])
+        return result
+
+    def allocated(self) -> np.ndarray:
+        """Boolean mask of sources that pass their cost on."""
+
+        mask = np.zeros(self.shape[1], dtype=bool)
+        mask[self.cols] = True
+        return mask
+
+
+@dataclass
+class CostToServe:
+    """Monthly cost per entity at every allocation level.
+
+    Shared by every caller of ``get_cost_to_serve()``; do not modify it.
+    """
+
+    periods: List[str]
+    ids: Dict[str, List[str]]
+    names: Dict[str, str]
+    costs: Dict[str, np.ndarray]  # level -> entities x periods
+    unallocated: Dict[str, np.ndarray] = field(default_factory=dict)  # stage -> per-period amount
+    cost_drivers: Dict[Tuple[str, str], str] = field(default_factory=dict)  # (source, structure) -> costDriver
+
+    def frame(self, level: str = LEVEL_SEGMENT) -> pd.DataFrame:
+        """Wide frame: one row per entity, one column per period, plus ``total``."""
+
+        if level not in LEVELS:
+            raise ValueError(f"Unknown level: {level} (choose from {', '.join(LEVELS)})")
+        frame = pd.DataFrame(self.costs[level], index=self.ids[level], columns=self.periods)
+        frame.insert(0, "name", [self.names.get(entity, entity) for entity in self.ids[level]])
+        frame["total"] = frame[self.periods].sum(axis=1)
+        return frame.sort_values("total", ascending=False, kind="stable")
+
+    def unallocated_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.unallocated, index=self.periods).T
+
+    def unreconciled_levels(self, tolerance: float = 1e-6) -> List[str]:
+        """Levels whose cost plus the earlier stages' remainders differs from the input cost."""
+
+        input_total = self.costs[LEVEL_STRUCTURE].sum(axis=0)
+        mismatched = []
+        for level, stages in _RECONCILED_LEVELS.items():
+            accounted = self.costs[level].sum(axis=0) + sum(
+                (self.unallocated.get(stage, 0.0) for stage in UNALLOCATED_STAGES[:stages]), np.zeros(len(self.periods))
+            )
+            if not np.allclose(input_total, accounted, rtol=tolerance, atol=tolerance):
+                mismatched.append(level)
+        return mismatched
+
+    def reconciles(self, tolerance: float = 1e-6) -> bool:
+        """Every level down to the jobs accounts for the input cost."""
+
+        return not self.unreconciled_levels(tolerance)
+
+
+def _index(values: Sequence[str]) -> Dict[str, int]:
+    return {value: position for position, value in enumerate(values)}
+
+
+def propagate_costs(
+    structure_costs: Sequence[Dict[str, Any]],
+    edges: Sequence[Dict[str, Any]],
+    names: Optional[Dict[str, str]] = None,
+) -> CostToServe:
+    """Allocate monthly CostStructure totals up to segments and jobs.
+
+    Each step splits an entity's cost evenly over the entities it is linked
+    to (``costDriver`` is descriptive text, not a weight):
+    CostStructure -> its INCURS_COST sources; KeyResource/KeyActivity -> the
+    value propositions requiring them; Channel -> the segments reaching
+    through it; ValueProposition -> the segments it targets; segment -> its
+    jobs. KeyActivity USES_RESOURCE is not followed, so resource cost is not
+    counted twice. Whatever a step cannot pass on is kept per stage in
+    ``unallocated``.
+    """
+
+    periods_sorted = sorted(
+        {(row["year"], row["month"], row["period"]) for row in structure_costs}, key=lambda item: (item[0], item[1])
+    )
+    periods = [period for _, _, period in periods_sorted]
+    period_index = _index(periods)
+
+    edges = [edge for edge in edges if edge["start"] is not None and edge["end"] is not None]
+    by_label: Dict[str, set] = {}
+    for edge in edges:
+        by_label.setdefault(edge["start_label"], set()).add(edge["start"])
+        by_label.setdefault(edge["end_label"], set()).add(edge["end"])
+    structures = sorted(by_label.get("CostStructure", set()) | {row["structure"] for row in structure_costs})
+    sources = sorted(set().union(*(by_label.get(label, set()) for label in SOURCE_LABELS)))
+    propositions = sorted(by_label.get("ValueProposition", set()))
+    segments = sorted(by_label.get("CustomerSegment", set()))
+    jobs = sorted(by_label.get("JobToBeDone", set()))
+    structure_index, source_index = _index(structures), _index(sources)
+    proposition_index, segment_index, job_index = _index(propositions), _index(segments), _index(jobs)
+
+    structure_cost = np.zeros((len(structures), len(periods)))
+    for row in structure_costs:
+        structure_cost[structure_index[row["structure"]], period_index[row["period"]]] += float(row["amount"] or 0.0)
+
+    incurs, requires, reaches, targets, defines = [], [], [], [], []
+    cost_drivers: Dict[Tuple[str, str], str] = {}
+    for edge in edges:
+        kind, start, end = edge["type"], edge["start"], edge["end"]
+        if kind == "INCURS_COST" and edge["end_label"] == "CostStructure" and start in source_index:
+            incurs.append((source_index[start], structure_index[end]))
+            if edge.get("cost_driver"):
+                cost_drivers[(start, end)] = edge["cost_driver"]
+        elif kind in ("REQUIRES_RESOURCE", "REQUIRES_ACTIVITY") and end in source_index and start in proposition_index:
+            requires.append((proposition_index[start], source_index[end]))
+        elif kind == "REACHES_THROUGH" and end in source_index and start in segment_index:
+            reaches.append((segment_index[start], source_index[end]))
+        elif kind == "TARGETS" and start in proposition_index and end in segment_index:
+            targets.append((segment_index[end], proposition_index[start]))
+        elif kind == "DEFINED_BY_JOB" and start in segment_index and end in job_index:
+            defines.append((job_index[end], segment_index[start]))
+
+    incur_matrix = Allocation.equal_split(incurs, (len(sources), len(structures)))
+    require_matrix = Allocation.equal_split(requires, (len(propositions), len(sources)))
+    reach_matrix = Allocation.equal_split(reaches, (len(segments), len(sources)))
+    target_matrix = Allocation.equal_split(targets, (len(segments), len(propositions)))
+    define_matrix = Allocation.equal_split(defines, (len(jobs), len(segments)))
+
+    source_cost = incur_matrix @ structure_cost
+    proposition_cost = require_matrix @ source_cost
+    segment_cost = target_matrix @ proposition_cost + reach_matrix @ source_cost
+    job_cost = define_matrix @ segment_cost
+
+    passed_on = require_matrix.allocated() | reach_matrix.allocated()
+    unallocated = dict(
+        zip(
+            UNALLOCATED_STAGES,
+            (
+                structure_cost[~incur_matrix.allocated()].sum(axis=0),
+                source_cost[~passed_on].sum(axis=0),
+                proposition_cost[~target_matrix.allocated()].sum(axis=0),
+                segment_cost[~define_matrix.allocated()].sum(axis=0),
+            ),
+        )
+    )
+    return CostToServe(
+        periods=periods,
+        ids={
+            LEVEL_STRUCTURE: structures,
+            LEVEL_SOURCE: sources,
+            LEVEL_VALUE_PROPOSITION: propositions,
+            LEVEL_SEGMENT: segments,
+            LEVEL_JOB: jobs,
+        },
+        names=dict(names or {}),
+        costs={
+            LEVEL_STRUCTURE: structure_cost,
+            LEVEL_SOURCE: source_cost,
+            LEVEL_VALUE_PROPOSITION: proposition_cost,
+            LEVEL_SEGMENT: segment_cost,
+            LEVEL_JOB: job_cost,
+        },
+        unallocated=unallocated,
+        cost_drivers=cost_drivers,
+    )
+
+
+def load_cost_to_serve(connection) -> CostToServe:
+    """Read the cost facts and allocation edges, then propagate in memory."""
+
+    structure_costs = connection.execute_query(MONTHLY_STRUCTURE_COSTS_QUERY)
+    edges = connection.execute_query(ALLOCATION_EDGES_QUERY)
+    names = {row["id"]: row["name"] for row in connection.execute_query(ENTITY_NAMES_QUERY)}
+    result = propagate_costs(structure_costs, edges, names)
+    mismatched = result.unreconciled_levels()
+    if mismatched:
+        logger.error("Cost-to-serve levels do not reconcile with the CostData totals: %s", ", ".join(mismatched))
+    return result
+
+
+__all__ = [
+    "ALLOCATION_LABELS",
+    "LEVELS",
+    "LEVEL_JOB",
+    "LEVEL_SEGMENT",
+    "LEVEL_SOURCE",
+    "LEVEL_STRUCTURE",
+    "LEVEL_VALUE_PROPOSITION",
+    "UNALLOCATED_STAGES",
+    "Allocation",
+    "CostToServe",
+    "load_cost_to_serve",
+    "propagate_costs",
+]
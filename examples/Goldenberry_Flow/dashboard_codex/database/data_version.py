@@ -0,0 +1,81 @@
+"""
+Per-domain data-version counters for cache invalidation.
+Every ingestion path bumps the ``DataVersion`` node of the domains it
+writes in the same transaction; readers compare versions instead of
+guessing with time-based expiry.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DOMAIN_REVENUE = "revenue"
+DOMAIN_COST = "cost"
+DOMAIN_MODEL = "model"
+DOMAINS: Tuple[str, ...] = (DOMAIN_REVENUE, DOMAIN_COST, DOMAIN_MODEL)
+
+BUMP_VERSIONS_QUERY = """
+UNWIND $domains AS domain
+MERGE (dv:DataVersion {domain: domain})
+SET dv.version = coalesce(dv.version, 0) + 1,
+    dv.updatedAt = datetime()
+RETURN dv.domain AS domain, dv.version AS version
+"""
+
+READ_VERSIONS_QUERY = """
+MATCH (dv:DataVersion)
+WHERE dv.domain IN $domains
+RETURN dv.domain AS domain, dv.version AS version
+"""
+
+
+def _validate(domains: Iterable[str]) -> List[str]:
+    requested = sorted(set(domains))
+    unknown = [domain for domain in requested if domain not in DOMAINS]
+    if unknown:
+        raise ValueError(f"Unknown data-version domain(s): {', '.join(unknown)}")
+    return requested
+
+
+def bump_statement(*domains: str) -> Tuple[str, Dict[str, Any]]:
+    """Return a ``(query, parameters)`` pair for ``execute_transaction``."""
+
+    return BUMP_VERSIONS_QUERY, {"domains": _validate(domains)}
+
+
+def bump_in_transaction(tx, *domains: str) -> Dict[str, int]:
+    """Bump versions inside an already open driver transaction."""
+
+    query, parameters = bump_statement(*domains)
+    return {record["domain"]: int(record["version"]) for record in tx.run(query, parameters)}
+
+
+def bump_versions(connection, *domains: str) -> Dict[str, int]:
+    """Bump versions in a transaction of their own (manual edits, repairs)."""
+
+    rows = connection.execute_transaction([bump_statement(*domains)])[0]
+    return {row["domain"]: int(row["version"]) for row in rows}
+
+
+def read_versions(connection, domains: Iterable[str] = DOMAINS) -> Dict[str, Optional[int]]:
+    """Return the current version per domain (None when never bumped)."""
+
+    requested = _validate(domains)
+    rows = connection.execute_query(READ_VERSIONS_QUERY, {"domains": requested})
+    versions: Dict[str, Optional[int]] = {domain: None for domain in requested}
+    for row in rows:
+        if row.get("version") is not None:
+            versions[row["domain"]] = int(row["version"])
+    return versions
+
+
+__all__ = [
+    "DOMAINS",
+    "DOMAIN_COST",
+    "DOMAIN_MODEL",
+    "DOMAIN_REVENUE",
+    "bump_in_transaction",
+    "bump_statement",
+    "bump_versions",
+    "read_versions",
+]
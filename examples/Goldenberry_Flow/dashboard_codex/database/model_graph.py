@@ -0,0 +1,314 @@
+"""
+In-process snapshot of the business-model graph.
+The non-fact nodes (canvas, products, ...) and their relationships are read
+once into CSR integer adjacency arrays with label and relationship-type
+codes, so multi-hop traversals, dependency chains and centrality run in
+memory instead of as repeated Bolt round trips. ``Neo4jConnection`` keeps
+the snapshot until the model or revenue DataVersion changes and hands the
+same instance to every caller, so it is immutable: only the lazily derived
+lookups inside it are ever filled in.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Time-series facts, their period dimension and bookkeeping nodes stay out of
+# the snapshot; everything else is business-model structure.
+EXCLUDED_LABELS: Tuple[str, ...] = (
+    "VolumeData",
+    "PriceData",
+    "CostData",
+    "TimePeriod",
+    "MonthlyFact",
+    "DataVersion",
+    "LoadCheckpoint",
+    "SemanticDefinition",
+)
+
+DIRECTION_OUT = "out"
+DIRECTION_IN = "in"
+DIRECTION_BOTH = "both"
+
+GRAPH_NODES_QUERY = """
+MATCH (n)
+WHERE NOT any(label IN labels(n) WHERE label IN $excluded)
+RETURN elementId(n) AS key, n.id AS id, labels(n)[0] AS label,
+       coalesce(n.name, n.title, n.partnerName, n.jobStatement, n.id) AS name
+"""
+
+GRAPH_RELATIONSHIPS_QUERY = """
+MATCH (a)-[r]->(b)
+WHERE NOT any(label IN labels(a) WHERE label IN $excluded)
+  AND NOT any(label IN labels(b) WHERE label IN $excluded)
+RETURN elementId(a) AS start, elementId(b) AS end, type(r) AS type
+"""
+
+
+def _csr(sources: np.ndarray, targets: np.ndarray, types: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    order = np.lexsort((targets, sources))
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=size), out=indptr[1:])
+    return indptr, targets[order].astype(np.int32), types[order].astype(np.int16)
+
+
+@dataclass
+class ModelGraph:
+    """CSR adjacency of the business-model graph (node indices are ``int``).
+
+    Shared by every caller of ``get_model_graph()``; do not modify it.
+    """
+
+    ids: np.ndarray  # node index -> business id (object)
+    names: np.ndarray  # node index -> display name (object)
+    label_codes: np.ndarray  # node index -> index into ``labels``
+    labels: Tuple[str, ...]
+    rel_types: Tuple[str, ...]
+    out_indptr: np.ndarray
+    out_indices: np.ndarray
+    out_types: np.ndarray  # edge -> index into ``rel_types``
+    in_indptr: np.ndarray
+    in_indices: np.ndarray
+    in_types: np.ndarray
+    built_at: float = 0.0
+    _positions: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
+    # Per-direction Python lists of (neighbour, type code), derived from the
+    # CSR arrays on first traversal: per-node numpy slicing costs more than
+    # the hop itself on graphs this small.
+    _lists: Dict[str, List[List[Tuple[int, int]]]] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_rows(cls, nodes: Sequence[Dict[str, object]], relationships: Sequence[Dict[str, object]]) -> "ModelGraph":
+        """Build from ``{key, id, label, name}`` node rows and ``{start, end, type}`` edge rows."""
+
+        position = {row["key"]: index for index, row in enumerate(nodes)}
+        labels = tuple(sorted({str(row["label"]) for row in nodes}))
+        label_index = {label: code for code, label in enumerate(labels)}
+        edges = [row for row in relationships if row["start"] in position and row["end"] in position]
+        rel_types = tuple(sorted({str(row["type"]) for row in edges}))
+        type_index = {rel_type: code for code, rel_type in enumerate(rel_types)}
+
+        sources = np.fromiter((position[row["start"]] for row in edges), dtype=np.int64, count=len(edges))
+        targets = np.fromiter((position[row["end"]] for row in edges), dtype=np.int64, count=len(edges))
+        types = np.fromiter((type_index[row["type"]] for row in edges), dtype=np.int64, count=len(edges))
+        size = len(nodes)
+        out_indptr, out_indices, out_types = _csr(sources, targets, types, size)
+        in_indptr, in_indices, in_types = _csr(targets, sources, types, size)
+        return cls(
+            ids=np.array([row["id"] for row in nodes], dtype=object),
+            names=np.array([row["name"] for row in nodes], dtype=object),
+            label_codes=np.array([label_index[row["label"]] for row in nodes], dtype=np.int16),
+            labels=labels,
+            rel_types=rel_types,
+            out_indptr=out_indptr,
+            out_indices=out_indices,
+            out_types=out_types,
+            in_indptr=in_indptr,
+            in_indices=in_indices,
+            in_types=in_types,
+            built_at=time.time(),
+        )
+
+    # Lookups -----------------------------------------------------------
+    @property
+    def node_count(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.out_indices)
+
+    def index(self, node_id: str) -> int:
+        if self._positions is None:
+            self._positions = {node_id: position for position, node_id in enumerate(self.ids)}
+        return self._positions[node_id]
+
+    def label_of(self, node: int) -> str:
+        return self.labels[self.label_codes[node]]
+
+    def nodes_with_label(self, label: str) -> np.ndarray:
+        if label not in self.labels:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(self.label_codes == self.labels.index(label))
+
+    def _type_codes(self, rel_types: Optional[Iterable[str]]) -> Optional[Set[int]]:
+        if rel_types is None:
+            return None
+        return {self.rel_types.index(name) for name in rel_types if name in self.rel_types}
+
+    def _adjacency(self, direction: str) -> List[List[Tuple[int, int]]]:
+        if direction not in self._lists:
+            if direction == DIRECTION_BOTH:
+                out, incoming = self._adjacency(DIRECTION_OUT), self._adjacency(DIRECTION_IN)
+                self._lists[direction] = [a + b for a, b in zip(out, incoming)]
+            else:
+                indptr, indices, types = (
+                    (self.out_indptr, self.out_indices, self.out_types)
+                    if direction == DIRECTION_OUT
+                    else (self.in_indptr, self.in_indices, self.in_types)
+                )
+                pairs = list(zip(indices.tolist(), types.tolist()))
+                bounds = indptr.tolist()
+                self._lists[direction] = [pairs[bounds[node] : bounds[node + 1]] for node in range(self.node_count)]
+        return self._lists[direction]
+
+    # Traversal ---------------------------------------------------------
+    def neighbors(self, node: int, rel_types: Optional[Iterable[str]] = None, direction: str = DIRECTION_OUT) -> List[int]:
+        codes = self._type_codes(rel_types)
+        targets = {target for target, code in self._adjacency(direction)[node] if codes is None or code in codes}
+        return sorted(targets)
+
+    def reachable(
+        self,
+        start: int,
+        rel_types: Optional[Iterable[str]] = None,
+        direction: str = DIRECTION_OUT,
+        max_depth: Optional[int] = None,
+    ) -> Dict[int, int]:
+        """Breadth-first search; returns ``{node: hops}`` excluding ``start``."""
+
+        codes = self._type_codes(rel_types)
+        adjacency = self._adjacency(direction)
+        depth = {start: 0}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            if max_depth is not None and depth[node] >= max_depth:
+                continue
+            for neighbor, code in adjacency[node]:
+                if (codes is None or code in codes) and neighbor not in depth:
+                    depth[neighbor] = depth[node] + 1
+                    queue.append(neighbor)
+        del depth[start]
+        return depth
+
+    def chains(self, start: int, *steps: str) -> List[Tuple[int, ...]]:
+        """Paths from ``start`` following one relationship type per hop.
+
+        ``graph.chains(vp, "REQUIRES_ACTIVITY", "INCURS_COST")`` lists the
+        ValueProposition -> KeyActivity -> CostStructure dependency chains.
+        """
+
+        paths: List[Tuple[int, ...]] = [(start,)]
+        for step in steps:
+            paths = [path + (target,) for path in paths for target in self.neighbors(path[-1], [step])]
+        return paths
+
+    # Structure and centrality ------------------------------------------
+    def label_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.label_codes, minlength=len(self.labels))
+        return {label: int(count) for label, count in zip(self.labels, counts)}
+
+    def relationship_counts(self) -> Dict[Tuple[str, str, str], int]:
+        """Edge count per ``(start label, type, end label)`` pattern."""
+
+        sources = np.repeat(np.arange(self.node_count), np.diff(self.out_indptr))
+        keys = np.stack([self.label_codes[sources], self.out_types, self.label_codes[self.out_indices]], axis=1)
+        patterns, counts = np.unique(keys, axis=0, return_counts=True)
+        return {
+            (self.labels[start], self.rel_types[rel_type], self.labels[end]): int(count)
+            for (start, rel_type, end), count in zip(patterns.tolist(), counts.tolist())
+        }
+
+    def degree(self, direction: str = DIRECTION_BOTH) -> np.ndarray:
+        out_degree, in_degree = np.diff(self.out_indptr), np.diff(self.in_indptr)
+        return {DIRECTION_OUT: out_degree, DIRECTION_IN: in_degree, DIRECTION_BOTH: out_degree + in_degree}[direction]
+
+    def pagerank(self, damping: float = 0.85, tolerance: float = 1e-10, max_iterations: int = 100) -> np.ndarray:
+        size = self.node_count
+        if size == 0:
+            return np.empty(0)
+        out_degree = np.diff(self.out_indptr).astype(float)
+        sources = np.repeat(np.arange(size), np.diff(self.out_indptr))
+        weights = 1.0 / out_degree[sources]
+        dangling = out_degree == 0
+        rank = np.full(size, 1.0 / size)
+        for _ in range(max_iterations):
+            spread = np.bincount(self.out_indices, weights=rank[sources] * weights, minlength=size)
+            updated = (1 - damping) / size + damping * (spread + rank[dangling].sum() / size)
+            if np.abs(updated - rank).sum() < tolerance:
+                return updated
+            rank = updated
+        return rank
+
+    def betweenness(self, directed: bool = False, normalized: bool = True) -> np.ndarray:
+        """Brandes betweenness centrality over unweighted edges."""
+
+        size = self.node_count
+        direction = DIRECTION_OUT if directed else DIRECTION_BOTH
+        adjacency = [self.neighbors(node, direction=direction) for node in range(size)]
+        centrality = [0.0] * size
+        for source in range(size):
+            stack: List[int] = []
+            predecessors: List[List[int]] = [[] for _ in range(size)]
+            paths = [0] * size
+            paths[source] = 1
+            distance = [-1] * size
+            distance[source] = 0
+            queue = deque([source])
+            while queue:
+                node = queue.popleft()
+                stack.append(node)
+                for neighbor in adjacency[node]:
+                    if distance[neighbor] < 0:
+                        distance[neighbor] = distance[node] + 1
+                        queue.append(neighbor)
+                    if distance[neighbor] == distance[node] + 1:
+                        paths[neighbor] += paths[node]
+                        predecessors[neighbor].append(node)
+            dependency = [0.0] * size
+            while stack:
+                node = stack.pop()
+                for predecessor in predecessors[node]:
+                    dependency[predecessor] += paths[predecessor] / paths[node] * (1 + dependency[node])
+                if node != source:
+                    centrality[node] += dependency[node]
+        centrality = np.array(centrality)
+        if not directed:
+            centrality /= 2
+        if normalized and size > 2:
+            centrality /= (size - 1) * (size - 2) / (1 if directed else 2)
+        return centrality
+
+    def ranking(self, scores: np.ndarray, top: int = 10) -> List[Dict[str, object]]:
+        order = np.argsort(-scores, kind="stable")[:top]
+        return [
+            {"id": self.ids[node], "label": self.label_of(node), "name": self.names[node], "score": float(scores[node])}
+            for node in order.tolist()
+        ]
+
+
+def load_model_graph(connection) -> ModelGraph:
+    """Read the non-fact graph into a ``ModelGraph``."""
+
+    started = time.perf_counter()
+    parameters = {"excluded": list(EXCLUDED_LABELS)}
+    nodes = connection.execute_query(GRAPH_NODES_QUERY, parameters)
+    relationships = connection.execute_query(GRAPH_RELATIONSHIPS_QUERY, parameters)
+    graph = ModelGraph.from_rows(nodes, relationships)
+    logger.info(
+        "Built model graph snapshot: %d nodes, %d relationships in %.2fs",
+        graph.node_count,
+        graph.edge_count,
+        time.perf_counter() - started,
+    )
+    return graph
+
+
+__all__ = [
+    "DIRECTION_BOTH",
+    "DIRECTION_IN",
+    "DIRECTION_OUT",
+    "EXCLUDED_LABELS",
+    "ModelGraph",
+    "load_model_graph",
+]
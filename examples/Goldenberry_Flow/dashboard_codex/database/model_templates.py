@@ -0,0 +1,336 @@
+"""
+Business-model instantiation from the canvas templates.
+Reads ``templates/node_templates.cypher`` and ``relationship_templates.cypher``
+for the properties, enumerations and allowed relationships of the twelve
+canvas labels, validates a YAML/JSON business-model spec against them, and
+turns it into one parameterised ``UNWIND $rows`` write per label and per
+relationship type, so every instance reuses the same cached plans. The
+label-level semantic texts are written once per label to a
+``SemanticDefinition`` node instead of being copied onto every node.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .connection import Neo4jConnection
+from .data_version import DOMAIN_MODEL, bump_statement
+from .phased_load import split_statements
+
+try:  # Optional dependency: JSON specs work without it.
+    import yaml
+except ImportError:  # pragma: no cover - depends on the environment
+    yaml = None
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+TEMPLATE_DIR = Path(__file__).resolve().parents[4] / "templates"
+NODE_TEMPLATES = TEMPLATE_DIR / "node_templates.cypher"
+RELATIONSHIP_TEMPLATES = TEMPLATE_DIR / "relationship_templates.cypher"
+
+RELATIONSHIPS_KEY = "relationships"
+_PLACEHOLDER = re.compile(r"^\[.*\]$")
+_CREATE_NODE = re.compile(r"^CREATE\s+\(\w+:(\w+)\s*\{")
+_PROPERTY_LINE = re.compile(
+    r'^\s*(\w+):\s*(?P<value>"(?:[^"\\]|\\.)*"|date\("[^"]*"\)|-?\d+(?:\.\d+)?)\s*,?\s*(?://\s*(?P<comment>.*))?$'
+)
+_TEMPLATE_RELATIONSHIP = re.compile(
+    r"MATCH\s+\((\w+):(\w+)[^)]*\),\s*\((\w+):(\w+)[^)]*\)\s*CREATE\s+\((\w+)\)-\[:(\w+)\s*(\{.*?\})?\]->\((\w+)\)",
+    re.DOTALL,
+)
+
+SEMANTICS_UPSERT = """
+UNWIND $rows AS row
+MERGE (sd:SemanticDefinition {label: row.label})
+SET sd += row.properties
+"""
+
+# Labels and relationship types come from the templates, never from the spec.
+NODE_UPSERT = """
+UNWIND $rows AS row
+MERGE (n:`{label}` {{id: row.id}})
+SET n += row.properties
+"""
+
+RELATIONSHIP_UPSERT = """
+UNWIND $rows AS row
+MATCH (a:`{start}` {{id: row.start}})
+MATCH (b:`{end}` {{id: row.end}})
+MERGE (a)-[r:`{type}`]->(b)
+SET r += row.properties
+"""
+
+
+@dataclass
+class LabelTemplate:
+    """Properties of one canvas label as declared by the node templates."""
+
+    label: str
+    properties: Dict[str, str] = field(default_factory=dict)  # name -> "string", "float", "int" or "date"
+    options: Dict[str, List[str]] = field(default_factory=dict)
+    semantics: Dict[str, str] = field(default_factory=dict)  # label-level semantic texts
+
+
+@dataclass
+class CanvasTemplates:
+    labels: Dict[str, LabelTemplate]
+    relationships: Dict[str, Set[Tuple[str, str]]]  # type -> {(start label, end label)}
+    relationship_properties: Dict[str, Set[str]]
+
+
+def _literal(raw: str) -> Tuple[str, Any]:
+    if raw.startswith("date("):
+        return "date", raw[6:-2]
+    if raw.startswith('"'):
+        return "string", json.loads(raw)
+    return ("float", float(raw)) if "." in raw else ("int", int(raw))
+
+
+@lru_cache(maxsize=4)
+def load_templates(
+    node_path: Path = NODE_TEMPLATES, relationship_path: Path = RELATIONSHIP_TEMPLATES
+) -> CanvasTemplates:
+    """Parse the template scripts; the first block of each label defines its semantics."""
+
+    labels: Dict[str, LabelTemplate] = {}
+    for _, statement in split_statements(Path(node_path).read_text(encoding="utf-8")):
+        match = _CREATE_NODE.match(statement)
+        if not match:
+            continue
+        first = match.group(1) not in labels
+        template = labels.setdefault(match.group(1), LabelTemplate(match.group(1)))
+        semantic = False
+        for line in statement.splitlines()[1:]:
+            if "Semantic Enhancement Properties" in line:
+                semantic = True
+                continue
+            prop = _PROPERTY_LINE.match(line)
+            if not prop:
+                continue
+            kind, value = _literal(prop.group("value"))
+            template.properties.setdefault(prop.group(1), kind)
+            comment = prop.group("comment") or ""
+            if comment.startswith("Options:"):
+                template.options[prop.group(1)] = [option.strip() for option in comment[8:].split(",")]
+            if semantic and first:
+                template.semantics[prop.group(1)] = value
+
+    relationships: Dict[str, Set[Tuple[str, str]]] = {}
+    relationship_properties: Dict[str, Set[str]] = {}
+    for _, statement in split_statements(Path(relationship_path).read_text(encoding="utf-8")):
+        match = _TEMPLATE_RELATIONSHIP.search(statement)
+        if not match:
+            continue
+        variables = {match.group(1): match.group(2), match.group(3): match.group(4)}
+        rel_type = match.group(6)
+        relationships.setdefault(rel_type, set()).add((variables[match.group(5)], variables[match.group(8)]))
+        names = re.findall(r"(\w+)\s*:", re.sub(r"//[^\n]*", "", match.group(7) or ""))
+        relationship_properties.setdefault(rel_type, set()).update(names)
+    return CanvasTemplates(labels, relationships, relationship_properties)
+
+
+def iter_node_literals(text: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ``(label, properties)`` for each one-node ``CREATE`` in a Cypher script."""
+
+    for _, statement in split_statements(text):
+        match = _CREATE_NODE.match(statement)
+        if not match:
+            continue
+        properties = {}
+        for line in statement.splitlines()[1:]:
+            prop = _PROPERTY_LINE.match(line)
+            if prop:
+                properties[prop.group(1)] = _literal(prop.group("value"))[1]
+        yield match.group(1), properties
+
+
+def load_spec(path: Path) -> Dict[str, Any]:
+    """Read a ``.json`` or ``.yaml``/``.yml`` business-model spec."""
+
+    text = Path(path).read_text(encoding="utf-8")
+    if Path(path).suffix.lower() in (".yaml", ".yml"):
+        if yaml is None:
+            raise RuntimeError("YAML specs require the 'pyyaml' package; use a .json spec instead")
+        return yaml.safe_load(text) or {}
+    return json.loads(text)
+
+
+@dataclass
+class ModelPlan:
+    """Parameterised statements that instantiate one business model."""
+
+    statements: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    nodes: Dict[str, int] = field(default_factory=dict)
+    relationships: Dict[str, int] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            [{"query": query.strip(), "parameters": parameters} for query, parameters in self.statements],
+            indent=2,
+            default=str,
+        )
+
+
+def _coerce(kind: str, value: Any) -> Any:
+    if kind == "date" and isinstance(value, str):
+        return dt.date.fromisoformat(value)
+    if kind == "float" and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _batches(rows: Sequence[Dict[str, Any]], size: int) -> Iterable[List[Dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield list(rows[start : start + size])
+
+
+def _relationship_rows(entries: Any) -> List[Dict[str, Any]]:
+    """Accept ``[start, end]`` pairs or ``{from, to, ...properties}`` mappings."""
+
+    rows = []
+    for entry in entries or []:
+        if isinstance(entry, Mapping):
+            properties = {key: value for key, value in entry.items() if key not in ("from", "to")}
+            rows.append({"start": entry.get("from"), "end": entry.get("to"), "properties": properties})
+        else:
+            start, end = entry
+            rows.append({"start": start, "end": end, "properties": {}})
+    return rows
+
+
+def build_plan(
+    spec: Mapping[str, Any],
+    templates: Optional[CanvasTemplates] = None,
+    batch_size: int = 500,
+    shared_semantics: bool = True,
+) -> ModelPlan:
+    """Validate ``spec`` against the templates and return the write plan.
+
+    With ``shared_semantics=False`` every node carries the full semantic
+    texts, as the seed scripts do, and no ``SemanticDefinition`` is written.
+
+    Raises ``ValueError`` listing every problem found (unknown labels or
+    relationship types, duplicate or unknown ids, unfilled ``[PLACEHOLDER]``
+    values, values outside a template's ``Options:``).
+    """
+
+    templates = templates or load_templates()
+    problems: List[str] = []
+    plan = ModelPlan()
+    node_labels: Dict[str, str] = {}
+    rows_by_label: Dict[str, List[Dict[str, Any]]] = {}
+
+    for section, entries in spec.items():
+        if section == RELATIONSHIPS_KEY:
+            continue
+        template = templates.labels.get(section)
+        if template is None:
+            problems.append(f"unknown node label section: {section}")
+            continue
+        for entry in [entries] if isinstance(entries, Mapping) else entries or []:
+            node_id = entry.get("id")
+            if not node_id:
+                problems.append(f"{section} entry without an id: {entry}")
+                continue
+            if node_id in node_labels:
+                problems.append(f"duplicate id {node_id} ({node_labels[node_id]} and {section})")
+                continue
+            node_labels[node_id] = section
+            properties: Dict[str, Any] = {} if shared_semantics else dict(template.semantics)
+            for name, value in entry.items():
+                if name == "id":
+                    continue
+                if isinstance(value, str) and _PLACEHOLDER.match(value.strip()):
+                    problems.append(f"{node_id}.{name} still holds the template placeholder {value}")
+                options = template.options.get(name)
+                if options and str(value).lower() not in {option.lower() for option in options}:
+                    problems.append(f"{node_id}.{name}={value!r} is not one of: {', '.join(options)}")
+                # Label-level semantics live on SemanticDefinition; only node-specific text stays inline.
+                if shared_semantics and name in template.semantics and value == template.semantics[name]:
+                    continue
+                properties[name] = _coerce(template.properties.get(name, "string"), value)
+            rows_by_label.setdefault(section, []).append({"id": node_id, "properties": properties})
+
+    relationship_specs: Dict[str, Any] = dict(spec.get(RELATIONSHIPS_KEY) or {})
+    business_models = [node_id for node_id, label in node_labels.items() if label == "BusinessModel"]
+    if len(business_models) == 1:
+        # The canvas hangs off its single BusinessModel unless the spec says otherwise.
+        for rel_type, label in (("HAS_VALUE_PROPOSITION", "ValueProposition"), ("HAS_CUSTOMER_SEGMENT", "CustomerSegment")):
+            if rel_type not in relationship_specs:
+                relationship_specs[rel_type] = [
+                    [business_models[0], node_id] for node_id, node_label in node_labels.items() if node_label == label
+                ]
+
+    rows_by_triple: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+    for rel_type, entries in relationship_specs.items():
+        allowed = templates.relationships.get(rel_type)
+        if allowed is None:
+            problems.append(f"unknown relationship type: {rel_type}")
+            continue
+        for row in _relationship_rows(entries):
+            start_label, end_label = node_labels.get(row["start"]), node_labels.get(row["end"])
+            if start_label is None or end_label is None:
+                missing = row["start"] if start_label is None else row["end"]
+                problems.append(f"{rel_type} refers to unknown node id {missing}")
+                continue
+            if (start_label, end_label) not in allowed:
+                problems.append(f"{rel_type} is not defined from {start_label} to {end_label}")
+                continue
+            unknown = set(row["properties"]) - templates.relationship_properties.get(rel_type, set())
+            if unknown:
+                problems.append(f"{rel_type} {row['start']}->{row['end']} has unknown properties: {sorted(unknown)}")
+            rows_by_triple.setdefault((start_label, rel_type, end_label), []).append(row)
+
+    if problems:
+        raise ValueError("Invalid business model spec:\n  " + "\n  ".join(problems))
+
+    semantics = [
+        {"label": label, "properties": dict(templates.labels[label].semantics)}
+        for label in templates.labels
+        if shared_semantics and label in rows_by_label and templates.labels[label].semantics
+    ]
+    if semantics:
+        plan.statements.append((SEMANTICS_UPSERT, {"rows": semantics}))
+    for label in templates.labels:  # template order keeps statements stable between runs
+        rows = rows_by_label.get(label, [])
+        for batch in _batches(rows, batch_size):
+            plan.statements.append((NODE_UPSERT.format(label=label), {"rows": batch}))
+        if rows:
+            plan.nodes[label] = len(rows)
+    for (start, rel_type, end), rows in sorted(rows_by_triple.items()):
+        for batch in _batches(rows, batch_size):
+            plan.statements.append((RELATIONSHIP_UPSERT.format(start=start, type=rel_type, end=end), {"rows": batch}))
+        plan.relationships[rel_type] = plan.relationships.get(rel_type, 0) + len(rows)
+    return plan
+
+
+def write_model(connection: Neo4jConnection, plan: ModelPlan) -> None:
+    """Apply a plan in one transaction together with the model DataVersion bump."""
+
+    connection.execute_transaction(plan.statements + [bump_statement(DOMAIN_MODEL)])
+    logger.info(
+        "Wrote %d nodes and %d relationships in %d statements",
+        sum(plan.nodes.values()),
+        sum(plan.relationships.values()),
+        len(plan.statements),
+    )
+
+
+__all__ = [
+    "CanvasTemplates",
+    "LabelTemplate",
+    "ModelPlan",
+    "build_plan",
+    "iter_node_literals",
+    "load_spec",
+    "load_templates",
+    "write_model",
+]
@@ -0,0 +1,113 @@
+"""
+On-disk cache for aggregates of closed fiscal periods.
+A TimePeriod flagged ``closed = true`` is not expected to change, so its
+monthly rows are computed once, written to disk and reused across
+restarts. Entries are keyed by read mode and by the period's own
+``closedVersion``, which only ``close_periods()`` bumps: writes to open
+months leave them in place, and closing a corrected month again switches
+that month to a fresh file instead of serving the old one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from .data_version import DOMAIN_COST, DOMAIN_REVENUE, bump_statement
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]")
+
+CLOSE_PERIODS_QUERY = """
+UNWIND $period_ids AS period_id
+MATCH (tp:TimePeriod {id: period_id})
+SET tp.closed = true,
+    tp.closedVersion = coalesce(tp.closedVersion, 0) + 1
+RETURN count(tp) AS closed
+"""
+
+
+class ClosedPeriodCache:
+    """JSON files keyed by dataset, read mode, TimePeriod id and its closedVersion under one namespace."""
+
+    def __init__(self, root: Path, namespace: str) -> None:
+        digest = hashlib.sha1(namespace.encode("utf-8")).hexdigest()[:12]
+        self.root = Path(root) / digest
+
+    def _directory(self, dataset: str, read_mode: str) -> Path:
+        return self.root / _SAFE_NAME.sub("_", dataset) / _SAFE_NAME.sub("_", read_mode)
+
+    @staticmethod
+    def _file_name(period_id: str, version: int) -> str:
+        return f"{_SAFE_NAME.sub('_', period_id)}.v{int(version)}.json"
+
+    def load(self, dataset: str, read_mode: str, periods: Mapping[str, int]) -> Dict[str, List[Dict[str, Any]]]:
+        """Return cached rows for the requested ``{period id: closedVersion}`` that are on disk."""
+
+        directory = self._directory(dataset, read_mode)
+        cached: Dict[str, List[Dict[str, Any]]] = {}
+        for period_id, version in periods.items():
+            path = directory / self._file_name(period_id, version)
+            if not path.exists():
+                continue
+            try:
+                cached[period_id] = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable closed-period cache entry %s: %s", path, exc)
+        return cached
+
+    def store(self, dataset: str, read_mode: str, period_id: str, version: int, rows: List[Dict[str, Any]]) -> None:
+        """Persist rows for one closed period (written atomically).
+
+        Entries of older closedVersions of the same period are dropped; other
+        periods are left alone.
+        """
+
+        directory = self._directory(dataset, read_mode)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / self._file_name(period_id, version)
+        handle, temp_name = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                json.dump(rows, stream, separators=(",", ":"))
+            os.replace(temp_name, path)
+        except OSError:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        for stale in directory.glob(f"{_SAFE_NAME.sub('_', period_id)}.v*.json"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+
+    def clear(self, dataset: Optional[str] = None) -> None:
+        """Drop one dataset, or the whole namespace when ``dataset`` is None."""
+
+        target = self.root / _SAFE_NAME.sub("_", dataset) if dataset else self.root
+        shutil.rmtree(target, ignore_errors=True)
+
+
+def close_periods(connection, period_ids: Iterable[str]) -> int:
+    """Flag TimePeriods as closed so their aggregates become cacheable.
+
+    Each call bumps the periods' ``closedVersion``: after correcting the
+    facts of a closed month, close it again to replace its cached entries.
+    """
+
+    results = connection.execute_transaction(
+        [
+            (CLOSE_PERIODS_QUERY, {"period_ids": list(period_ids)}),
+            bump_statement(DOMAIN_REVENUE, DOMAIN_COST),
+        ]
+    )
+    return int(results[0][0]["closed"]) if results[0] else 0
+
+
+__all__ = ["ClosedPeriodCache", "close_periods"]
@@ -0,0 +1,412 @@
+"""
+Checkpointed, concurrent loading of phased Cypher seed scripts.
+Splits a script on its ``// PHASE n: ...`` / ``// PHASE n VALIDATION``
+headers, runs independent data phases side by side in chunked write
+transactions, and records a ``LoadCheckpoint`` node in each chunk's own
+transaction so an interrupted load resumes where it stopped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .connection import Neo4jConnection
+from .data_version import DOMAIN_COST, bump_statement
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+_PHASE_HEADER = re.compile(r"^\s*//\s*PHASE\s+(\d+)\s*:\s*(.+?)\s*$")
+_VALIDATION_HEADER = re.compile(r"^\s*//\s*PHASE\s+(\d+)\s+VALIDATION\b")
+_END_HEADER = re.compile(r"^\s*//\s*END\s+OF\s+PHASE\s+(\d+)\b")
+_SCHEMA_COMMAND = re.compile(r"^\s*(CREATE|DROP)\s+(\w+\s+)?(CONSTRAINT|INDEX)\b", re.IGNORECASE)
+
+READ_CHECKPOINTS_QUERY = """
+MATCH (lc:LoadCheckpoint)
+WHERE lc.script = $script
+RETURN lc.id AS id, lc.checksum AS checksum
+"""
+
+WRITE_CHECKPOINT_QUERY = """
+MERGE (lc:LoadCheckpoint {id: $id})
+SET lc.script = $script,
+    lc.phase = $phase,
+    lc.chunk = $chunk,
+    lc.statements = $statements,
+    lc.checksum = $checksum,
+    lc.completedAt = datetime()
+"""
+
+RESET_CHECKPOINTS_QUERY = """
+MATCH (lc:LoadCheckpoint)
+WHERE lc.script = $script
+DELETE lc
+RETURN count(*) AS removed
+"""
+
+
+def mask_cypher(text: str) -> str:
+    """Blank out string literals and ``//`` comments, keeping every offset."""
+
+    out: List[str] = []
+    index = 0
+    length = len(text)
+    while index < length:
+        char = text[index]
+        if char in "'\"":
+            end = index + 1
+            while end < length and text[end] != char:
+                end += 2 if text[end] == "\\" else 1
+            out.append(char + "_" * (min(end, length) - index - 1) + (char if end < length else ""))
+            index = end + 1
+        elif text.startswith("//", index):
+            end = text.find("\n", index)
+            end = length if end == -1 else end
+            out.append(" " * (end - index))
+            index = end
+        else:
+            out.append(char)
+            index += 1
+    return "".join(out)
+
+
+def split_statements(text: str) -> List[Tuple[int, str]]:
+    """Split a script on top-level semicolons into ``(line, statement)`` pairs.
+
+    Leading comments are dropped from each statement; comment-only chunks
+    are skipped.
+    """
+
+    masked = mask_cypher(text)
+    statements: List[Tuple[int, str]] = []
+    start = 0
+    for index, char in enumerate(masked + ";"):
+        if char != ";":
+            continue
+        chunk = masked[start:index]
+        stripped = chunk.strip()
+        if stripped:
+            first = start + chunk.index(stripped[0])
+            statements.append((text[:first].count("\n") + 1, text[first:index].rstrip()))
+        start = index + 1
+    return statements
+
+
+def is_schema_statement(statement: str) -> bool:
+    return _SCHEMA_COMMAND.match(statement) is not None
+
+
+@dataclass
+class Phase:
+    """Write statements of one ``// PHASE n`` block and its validation queries."""
+
+    number: int
+    title: str
+    statements: List[Tuple[int, str]] = field(default_factory=list)
+    validations: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def schema(self) -> bool:
+        return bool(self.statements) and all(is_schema_statement(text) for _, text in self.statements)
+
+    @property
+    def label(self) -> str:
+        return f"Phase {self.number}: {self.title}"
+
+
+@dataclass
+class PhasedScript:
+    path: Path
+    phases: List[Phase]
+    epilogue: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    def phase(self, number: int) -> Phase:
+        for phase in self.phases:
+            if phase.number == number:
+                return phase
+        raise KeyError(f"{self.name} has no phase {number}")
+
+    def dependencies(self) -> Dict[int, Set[int]]:
+        """Schema phases are barriers; data phases only wait for earlier schema phases.
+
+        The data phases of the seed scripts create disjoint fact nodes and
+        only look up pre-existing model nodes, so they can run concurrently.
+        """
+
+        depends: Dict[int, Set[int]] = {}
+        seen: List[Phase] = []
+        for phase in self.phases:
+            if phase.schema:
+                depends[phase.number] = {earlier.number for earlier in seen}
+            else:
+                depends[phase.number] = {earlier.number for earlier in seen if earlier.schema}
+            seen.append(phase)
+        return depends
+
+
+def parse_phased_script(path: Path) -> PhasedScript:
+    """Assign every statement of ``path`` to the phase header above it."""
+
+    text = Path(path).read_text(encoding="utf-8-sig")
+    # (line, kind, phase number, title) for every header, in file order.
+    markers: List[Tuple[int, str, int, str]] = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        for kind, pattern in (("validation", _VALIDATION_HEADER), ("end", _END_HEADER), ("phase", _PHASE_HEADER)):
+            match = pattern.match(line)
+            if match:
+                title = match.group(2) if kind == "phase" else ""
+                markers.append((line_number, kind, int(match.group(1)), title))
+                break
+
+    phases: Dict[int, Phase] = {}
+    epilogue: List[Tuple[int, str]] = []
+    for line, statement in split_statements(text):
+        current = [marker for marker in markers if marker[0] < line]
+        if not current or current[-1][1] == "end":
+            if phases:
+                epilogue.append((line, statement))
+            else:
+                raise ValueError(f"{path}:{line}: statement outside any '// PHASE n:' block")
+            continue
+        _, kind, number, _ = current[-1]
+        if number not in phases:
+            title = next((m[3] for m in markers if m[1] == "phase" and m[2] == number), f"Phase {number}")
+            phases[number] = Phase(number, title)
+        target = phases[number].validations if kind == "validation" else phases[number].statements
+        target.append((line, statement))
+
+    return PhasedScript(Path(path), [phases[number] for number in sorted(phases)], epilogue)
+
+
+@dataclass
+class PhaseResult:
+    """Outcome and timings of one phase."""
+
+    phase: Phase
+    status: str = "pending"  # ok, warning, failed, blocked
+    chunks_written: int = 0
+    chunks_skipped: int = 0
+    statements_run: int = 0
+    write_seconds: float = 0.0
+    validation_seconds: float = 0.0
+    validation_rows: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class LoadReport:
+    script: str
+    results: List[PhaseResult]
+    wall_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(result.status in ("ok", "warning") for result in self.results)
+
+    @property
+    def serial_seconds(self) -> float:
+        """What the phases would have taken back to back."""
+
+        return sum(result.write_seconds + result.validation_seconds for result in self.results)
+
+
+def _checksum(statements: Sequence[Tuple[int, str]]) -> str:
+    digest = hashlib.sha1()
+    for _, statement in statements:
+        digest.update(statement.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _validation_status(rows: Iterable[Dict[str, Any]]) -> str:
+    """Read the seed scripts' status columns (✅ / ⚠️ / ❌)."""
+
+    values = [value for row in rows for value in row.values() if isinstance(value, str)]
+    if any(value.lstrip().startswith("❌") for value in values):
+        return "failed"
+    if any(value.lstrip().startswith("⚠") for value in values):
+        return "warning"
+    return "ok"
+
+
+class PhasedLoader:
+    """Run a ``PhasedScript`` against Neo4j with checkpoints and concurrency."""
+
+    def __init__(
+        self,
+        connection: Neo4jConnection,
+        script: PhasedScript,
+        chunk_size: int = 25,
+        workers: int = 3,
+        validate: bool = True,
+        domains: Sequence[str] = (DOMAIN_COST,),
+    ) -> None:
+        self.connection = connection
+        self.script = script
+        self.chunk_size = max(int(chunk_size), 1)
+        self.workers = max(int(workers), 1)
+        self.validate = validate
+        self.domains = tuple(domains)
+        self._checkpoints: Dict[str, str] = {}
+
+    def checkpoint_id(self, phase: Phase, chunk: int) -> str:
+        return f"{self.script.name}:phase{phase.number}:chunk{chunk}"
+
+    def chunks(self, phase: Phase) -> List[List[Tuple[int, str]]]:
+        if phase.schema:
+            # Schema commands cannot share a transaction with data writes.
+            return [phase.statements]
+        size = self.chunk_size
+        return [phase.statements[start : start + size] for start in range(0, len(phase.statements), size)]
+
+    def reset(self) -> int:
+        """Forget every checkpoint of this script (data already loaded stays)."""
+
+        rows = self.connection.execute_transaction([(RESET_CHECKPOINTS_QUERY, {"script": self.script.name})])[0]
+        return int(rows[0]["removed"]) if rows else 0
+
+    def load_checkpoints(self) -> Dict[str, str]:
+        rows = self.connection.execute_query(READ_CHECKPOINTS_QUERY, {"script": self.script.name})
+        self._checkpoints = {row["id"]: row["checksum"] for row in rows}
+        return dict(self._checkpoints)
+
+    def _checkpoint_statement(self, phase: Phase, chunk: int, statements: Sequence[Tuple[int, str]]):
+        return (
+            WRITE_CHECKPOINT_QUERY,
+            {
+                "id": self.checkpoint_id(phase, chunk),
+                "script": self.script.name,
+                "phase": phase.number,
+                "chunk": chunk,
+                "statements": len(statements),
+                "checksum": _checksum(statements),
+            },
+        )
+
+    def run_phase(self, phase: Phase) -> PhaseResult:
+        result = PhaseResult(phase)
+        started = time.perf_counter()
+        try:
+            for chunk, statements in enumerate(self.chunks(phase)):
+                checkpoint = self.checkpoint_id(phase, chunk)
+                recorded = self._checkpoints.get(checkpoint)
+                if recorded is not None:
+                    if recorded != _checksum(statements):
+                        raise RuntimeError(
+                            f"{checkpoint} was loaded from a different version of the script; "
+                            "clean up its nodes and rerun with --reset"
+                        )
+                    result.chunks_skipped += 1
+                    continue
+
+                if phase.schema:
+                    for _, statement in statements:
+                        self.connection.execute_query(statement)
+                    self.connection.execute_transaction([self._checkpoint_statement(phase, chunk, statements)])
+                else:
+                    # Data, checkpoint and DataVersion bump commit together: a chunk
+                    # is either fully loaded and recorded, or neither.
+                    self.connection.execute_transaction(
+                        [(statement, None) for _, statement in statements]
+                        + [self._checkpoint_statement(phase, chunk, statements), bump_statement(*self.domains)]
+                    )
+                result.chunks_written += 1
+                result.statements_run += len(statements)
+        except Exception as exc:
+            result.status = "failed"
+            result.error = str(exc)
+            result.write_seconds = time.perf_counter() - started
+            logger.error("%s failed: %s", phase.label, exc)
+            return result
+        result.write_seconds = time.perf_counter() - started
+
+        result.status = "ok"
+        if self.validate and phase.validations:
+            started = time.perf_counter()
+            try:
+                for _, query in phase.validations:
+                    result.validation_rows.extend(self.connection.execute_query(query))
+                result.status = _validation_status(result.validation_rows)
+            except RuntimeError as exc:
+                result.status = "failed"
+                result.error = str(exc)
+            result.validation_seconds = time.perf_counter() - started
+        logger.info(
+            "%s: %s (%d chunk(s) written, %d skipped, %.2fs)",
+            phase.label,
+            result.status,
+            result.chunks_written,
+            result.chunks_skipped,
+            result.write_seconds,
+        )
+        return result
+
+    def run(self, only: Optional[Iterable[int]] = None) -> LoadReport:
+        """Run the selected phases (all by default) respecting their dependencies."""
+
+        selected = set(only) if only is not None else {phase.number for phase in self.script.phases}
+        for number in selected:
+            self.script.phase(number)  # KeyError for unknown phases
+        # Dependencies outside the selection are assumed to be loaded already.
+        depends = {
+            number: requires & selected for number, requires in self.script.dependencies().items() if number in selected
+        }
+
+        started = time.perf_counter()
+        self.load_checkpoints()
+        results: Dict[int, PhaseResult] = {}
+        running: Dict[Future, int] = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="phased-load") as pool:
+            while len(results) < len(depends):
+                for number, requires in sorted(depends.items()):
+                    if number in results or number in running.values():
+                        continue
+                    failed = [dep for dep in requires if dep in results and results[dep].status == "failed"]
+                    failed += [dep for dep in requires if dep in results and results[dep].status == "blocked"]
+                    if failed:
+                        blocked = PhaseResult(self.script.phase(number), status="blocked")
+                        blocked.error = f"phase {min(failed)} did not complete"
+                        results[number] = blocked
+                    elif all(dep in results for dep in requires):
+                        running[pool.submit(self.run_phase, self.script.phase(number))] = number
+                if not running:
+                    continue
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+
+        report = LoadReport(self.script.name, [results[number] for number in sorted(results)])
+        if report.ok and only is None and any(result.chunks_written for result in report.results):
+            self._run_epilogue()
+        report.wall_seconds = time.perf_counter() - started
+        return report
+
+    def _run_epilogue(self) -> None:
+        # The chunks already bumped DataVersion in their own transactions.
+        statements = [(text, None) for _, text in self.script.epilogue if "DataVersion" not in text]
+        if statements:
+            self.connection.execute_transaction(statements)
+
+
+__all__ = [
+    "LoadReport",
+    "Phase",
+    "PhaseResult",
+    "PhasedLoader",
+    "PhasedScript",
+    "is_schema_statement",
+    "mask_cypher",
+    "parse_phased_script",
+    "split_statements",
+]
@@ -0,0 +1,291 @@
+"""
+Constraint and index provisioning for the Goldenberry knowledge graph.
+Declares every schema object the dashboard relies on, applies them
+idempotently, and verifies at startup that they are ONLINE and used.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+import re
+import textwrap
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..config import SCHEMA_SETTINGS
+from .connection import Neo4jConnection, get_connection
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+LABEL_SCAN_OPERATORS = ("NodeByLabelScan", "AllNodesScan")
+
+# Module whose Neo4jConnection read methods are EXPLAINed by verify_schema().
+CONNECTION_SOURCE = Path(__file__).with_name("connection.py")
+
+_READ_START = re.compile(r"^\s*(OPTIONAL\s+MATCH|MATCH|UNWIND|WITH|CALL)\b")
+_PARAMETER = re.compile(r"\$(\w+)")
+_SCAN_TARGET = re.compile(r"`?(\w+)`?\s*(?::\s*`?(\w+)`?)?")
+# ``(v:Label {prop: ...})`` or ``v.prop = $x`` / ``v.prop IN [...]``: the
+# variable is looked up by a property, so a scan of it is a fallback.
+_INLINE_LOOKUP = re.compile(r"\(\s*(\w+)\s*(?::\s*`?\w+`?\s*)+\{")
+_PREDICATE_LOOKUP = re.compile(
+    r"(?<!NOT )\b(\w+)\.\w+\s*(?:=|IN\b|STARTS\s+WITH)\s*[$'\"\d\[]", re.IGNORECASE
+)
+
+
+@dataclass(frozen=True)
+class SchemaObject:
+    """A uniqueness constraint or range index on one label."""
+
+    name: str
+    kind: str  # "constraint" or "index"
+    label: str
+    properties: Tuple[str, ...]
+
+    @property
+    def statement(self) -> str:
+        props = ", ".join(f"n.{prop}" for prop in self.properties)
+        if self.kind == "constraint":
+            return f"CREATE CONSTRAINT {self.name} IF NOT EXISTS FOR (n:{self.label}) REQUIRE {props} IS UNIQUE"
+        return f"CREATE INDEX {self.name} IF NOT EXISTS FOR (n:{self.label}) ON ({props})"
+
+
+def _constraint(name: str, label: str, prop: str) -> SchemaObject:
+    return SchemaObject(name, "constraint", label, (prop,))
+
+
+def _index(name: str, label: str, *props: str) -> SchemaObject:
+    return SchemaObject(name, "index", label, tuple(props))
+
+
+REQUIRED_SCHEMA: List[SchemaObject] = [
+    # Business model identity (goldenberry_complete_model.cypher)
+    _constraint("goldenberry_business_model_id", "BusinessModel", "id"),
+    _constraint("goldenberry_value_proposition_id", "ValueProposition", "id"),
+    _constraint("goldenberry_customer_segment_id", "CustomerSegment", "id"),
+    _constraint("goldenberry_job_executor_id", "JobExecutor", "id"),
+    _constraint("goldenberry_job_to_be_done_id", "JobToBeDone", "id"),
+    _constraint("goldenberry_channel_id", "Channel", "id"),
+    _constraint("goldenberry_customer_relationship_id", "CustomerRelationship", "id"),
+    _constraint("goldenberry_revenue_stream_id", "RevenueStream", "id"),
+    _constraint("goldenberry_key_resource_id", "KeyResource", "id"),
+    _constraint("goldenberry_key_activity_id", "KeyActivity", "id"),
+    _constraint("goldenberry_key_partnership_id", "KeyPartnership", "id"),
+    _constraint("goldenberry_cost_structure_id", "CostStructure", "id"),
+    # Fact identity (complete_12month_real_data.cypher, complete_cost_data_integration.cypher)
+    _constraint("goldenberry_product_id", "Product", "id"),
+    _constraint("goldenberry_time_period_id", "TimePeriod", "id"),
+    _constraint("goldenberry_volume_data_id", "VolumeData", "id"),
+    _constraint("goldenberry_price_data_id", "PriceData", "id"),
+    _constraint("cost_data_id", "CostData", "id"),
+    # Dashboard filter and group-by properties
+    _index("cost_data_period", "CostData", "period"),
+    _index("cost_data_cost_behavior", "CostData", "costBehavior"),
+    _index("product_name", "Product", "name"),
+    _index("cost_structure_name", "CostStructure", "name"),
+    _index("time_period_year", "TimePeriod", "year"),
+    _index("time_period_month", "TimePeriod", "month"),
+    _index("time_period_quarter", "TimePeriod", "quarter"),
+    _index("time_period_year_month", "TimePeriod", "year", "month"),
+    _index("time_period_closed", "TimePeriod", "closed"),
+    # Materialised aggregates (database/aggregates.py)
+    _constraint("monthly_fact_id", "MonthlyFact", "id"),
+    _index("monthly_fact_period_id", "MonthlyFact", "periodId"),
+    _index("monthly_fact_product_id", "MonthlyFact", "productId"),
+    _index("monthly_fact_product_name", "MonthlyFact", "productName"),
+    # Cache invalidation counters (database/data_version.py)
+    _constraint("data_version_domain", "DataVersion", "domain"),
+    # Resumable seed loads (database/phased_load.py)
+    _constraint("load_checkpoint_id", "LoadCheckpoint", "id"),
+    _index("load_checkpoint_script", "LoadCheckpoint", "script"),
+    # Label-level semantic texts (database/model_templates.py)
+    _constraint("semantic_definition_label", "SemanticDefinition", "label"),
+]
+
+
+@dataclass(frozen=True)
+class ReadQuery:
+    """A Cypher read issued by a ``Neo4jConnection`` method."""
+
+    method: str
+    line: int
+    query: str
+
+
+def connection_queries(path: Path = CONNECTION_SOURCE) -> List[ReadQuery]:
+    """Return the literal Cypher reads of ``Neo4jConnection``'s methods, in source order.
+
+    Both branches of a live/materialized ``_select_query`` are included;
+    queries assembled at runtime (f-strings) are not.
+    """
+
+    tree = ast.parse(path.read_text(encoding="utf-8-sig"), filename=str(path))
+    queries: List[ReadQuery] = []
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and node.name == "Neo4jConnection"):
+            continue
+        for method in node.body:
+            if not isinstance(method, ast.FunctionDef):
+                continue
+            templated = {
+                id(part) for child in ast.walk(method) if isinstance(child, ast.JoinedStr) for part in child.values
+            }
+            for child in ast.walk(method):
+                if id(child) in templated or not (isinstance(child, ast.Constant) and isinstance(child.value, str)):
+                    continue
+                if _READ_START.match(child.value):
+                    queries.append(ReadQuery(method.name, child.lineno, textwrap.dedent(child.value).strip()))
+    return sorted(queries, key=lambda read: read.line)
+
+
+@dataclass
+class SchemaReport:
+    """Outcome of a schema verification pass.
+
+    ``label_scans`` lists, per connection method, scans of a variable the
+    query looks up by property (an index should have served it);
+    ``full_scans`` are scans of variables the query never filters, which
+    no index can avoid and which are reported for information only.
+    """
+
+    missing: List[str] = field(default_factory=list)
+    not_online: Dict[str, str] = field(default_factory=dict)
+    label_scans: Dict[str, List[str]] = field(default_factory=dict)
+    full_scans: Dict[str, List[str]] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def healthy(self) -> bool:
+        return not (self.missing or self.not_online or self.label_scans or self.errors)
+
+    def problems(self) -> List[str]:
+        messages = list(self.errors)
+        messages += [f"Missing schema object: {name}" for name in self.missing]
+        messages += [f"Schema object {name} is {state}, not ONLINE" for name, state in self.not_online.items()]
+        messages += [
+            f"Label scan fallback in {method}: {', '.join(scans)}" for method, scans in self.label_scans.items()
+        ]
+        return messages
+
+
+def apply_schema(connection: Neo4jConnection, objects: Iterable[SchemaObject] = REQUIRED_SCHEMA) -> List[str]:
+    """Create every declared constraint and index; return the statements run."""
+
+    statements: List[str] = []
+    for schema_object in objects:
+        connection.execute_query(schema_object.statement)
+        statements.append(schema_object.statement)
+    logger.info("Applied %d schema statements", len(statements))
+    return statements
+
+
+def _plan_operators(plan: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Return ``(operatorType, details)`` for every operator of a plan tree."""
+
+    args = plan.get("args") or {}
+    operators = [(str(plan.get("operatorType", "")), str(args.get("Details") or args.get("details") or ""))]
+    for child in plan.get("children", []) or []:
+        operators.extend(_plan_operators(child))
+    return operators
+
+
+def _scan_operators(connection: Neo4jConnection, query: str, parameters: Optional[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    return [
+        (operator, details)
+        for operator, details in _plan_operators(connection.explain_query(query, parameters))
+        if any(operator.startswith(scan) for scan in LABEL_SCAN_OPERATORS)
+    ]
+
+
+def find_label_scans(connection: Neo4jConnection, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Return label/all-node scan operators the planner chose for a query."""
+
+    return [operator for operator, _ in _scan_operators(connection, query, parameters)]
+
+
+def _looked_up_variables(query: str) -> Set[str]:
+    return set(_INLINE_LOOKUP.findall(query)) | {match.group(1) for match in _PREDICATE_LOOKUP.finditer(query)}
+
+
+def verify_schema(
+    connection: Neo4jConnection,
+    objects: Iterable[SchemaObject] = REQUIRED_SCHEMA,
+    queries: Optional[Iterable[ReadQuery]] = None,
+) -> SchemaReport:
+    """Check that each declared object exists and is ONLINE, then EXPLAIN the dashboard's reads.
+
+    Every read of ``Neo4jConnection`` (``connection_queries()`` by default)
+    is planned with null parameters; a label or all-node scan of a variable
+    the query looks up by property is reported under the method's name.
+    """
+
+    objects = list(objects)
+    rows = connection.execute_query("SHOW INDEXES YIELD name, state RETURN name, state")
+    states = {row.get("name"): str(row.get("state") or "").upper() for row in rows}
+
+    report = SchemaReport()
+    for schema_object in objects:
+        state = states.get(schema_object.name)
+        if state is None:
+            report.missing.append(schema_object.name)
+        elif state != "ONLINE":
+            report.not_online[schema_object.name] = state
+
+    reads = list(connection_queries() if queries is None else queries)
+    for read in reads:
+        parameters = {name: None for name in _PARAMETER.findall(read.query)}
+        try:
+            scans = _scan_operators(connection, read.query, parameters)
+        except RuntimeError as exc:
+            report.errors.append(f"Could not EXPLAIN {read.method} (line {read.line}): {exc}")
+            continue
+        looked_up = _looked_up_variables(read.query)
+        for operator, details in scans:
+            target = _SCAN_TARGET.match(details)
+            variable = target.group(1) if target else ""
+            scans_of = report.label_scans if variable in looked_up else report.full_scans
+            scans_of.setdefault(read.method, []).append(f"{operator}({details})" if details else operator)
+
+    for message in report.problems():
+        logger.warning("SCHEMA CHECK: %s", message)
+    for method, scans in report.full_scans.items():
+        logger.info("SCHEMA CHECK: %s scans without a lookup: %s", method, ", ".join(scans))
+    if report.healthy:
+        logger.info("Schema verified: %d objects ONLINE, %d reads without label-scan fallbacks", len(objects), len(reads))
+    return report
+
+
+@lru_cache(maxsize=1)
+def ensure_schema() -> Optional[SchemaReport]:
+    """Apply and verify the schema once per process according to settings."""
+
+    connection = get_connection()
+    if not connection.connected:
+        return None
+
+    try:
+        if SCHEMA_SETTINGS["apply_on_startup"]:
+            apply_schema(connection)
+        if SCHEMA_SETTINGS["verify_on_startup"]:
+            return verify_schema(connection)
+    except Exception as exc:  # pragma: no cover - startup must not crash the app
+        logger.warning("SCHEMA CHECK: verification failed: %s", exc)
+        return SchemaReport(errors=[f"Schema verification failed: {exc}"])
+    return None
+
+
+__all__ = [
+    "REQUIRED_SCHEMA",
+    "ReadQuery",
+    "SchemaObject",
+    "SchemaReport",
+    "apply_schema",
+    "connection_queries",
+    "ensure_schema",
+    "find_label_scans",
+    "verify_schema",
+]
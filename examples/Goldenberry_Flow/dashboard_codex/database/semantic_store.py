@@ -0,0 +1,226 @@
+"""
+Shared storage for the canvas labels' semantic texts.
+``semanticDescription``, ``theoreticalFoundation`` and the label-specific
+texts (``valueElements``, ``odiRelevance``, ...) are identical on most nodes
+of a label. The migration keeps one copy per label on a
+``SemanticDefinition {label}`` node, leaves only deviating texts inline, and
+reports the store and bytes-on-wire savings.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .data_version import DOMAIN_MODEL, bump_statement
+from .model_templates import SEMANTICS_UPSERT, iter_node_literals, load_templates
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Dynamic string store records hold 120 bytes of payload in a 128-byte record.
+STRING_BLOCK_PAYLOAD = 120
+STRING_BLOCK_SIZE = 128
+
+DEFINITIONS_QUERY = """
+MATCH (sd:SemanticDefinition)
+RETURN sd.label AS label, properties(sd) AS properties
+"""
+
+LABEL_SEMANTICS_QUERY = """
+MATCH (n:`{label}`)
+RETURN n.id AS id, n {{{fields}}} AS semantics
+"""
+
+CLEAR_SEMANTICS = """
+UNWIND $rows AS row
+MATCH (n:`{label}` {{id: row.id}})
+SET n += row.cleared
+"""
+
+INLINE_SEMANTICS = """
+MATCH (sd:SemanticDefinition {{label: $label}})
+MATCH (n:`{label}`)
+SET {assignments}
+"""
+
+
+def semantic_fields() -> Dict[str, Tuple[str, ...]]:
+    """Semantic property names per canvas label, from the node templates."""
+
+    return {
+        label: tuple(template.semantics)
+        for label, template in load_templates().labels.items()
+        if template.semantics
+    }
+
+
+def resolve_semantics(definitions: Mapping[str, Mapping[str, Any]], label: str, node: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return ``node`` with its label's shared texts filled in; inline texts win."""
+
+    resolved = {key: value for key, value in (definitions.get(label) or {}).items() if key != "label"}
+    resolved.update({key: value for key, value in node.items() if value is not None})
+    return resolved
+
+
+def _stored_bytes(text: Any) -> int:
+    size = len(str(text).encode("utf-8"))
+    return math.ceil(size / STRING_BLOCK_PAYLOAD) * STRING_BLOCK_SIZE
+
+
+@dataclass
+class LabelSemantics:
+    label: str
+    nodes: int
+    defaults: Dict[str, Any] = field(default_factory=dict)
+    cleared: Dict[str, List[str]] = field(default_factory=dict)  # node id -> fields moved to the definition
+    overrides: int = 0
+    wire_bytes_before: int = 0
+    wire_bytes_after: int = 0
+    store_bytes_before: int = 0
+    store_bytes_after: int = 0
+
+
+@dataclass
+class SemanticReport:
+    labels: List[LabelSemantics] = field(default_factory=list)
+    applied: bool = False
+
+    @property
+    def wire_bytes_saved(self) -> int:
+        """UTF-8 text no longer returned by a ``RETURN n`` over every canvas node."""
+
+        return sum(item.wire_bytes_before - item.wire_bytes_after for item in self.labels)
+
+    @property
+    def store_bytes_saved(self) -> int:
+        """Estimated dynamic string store reduction (120-byte payload records)."""
+
+        return sum(item.store_bytes_before - item.store_bytes_after for item in self.labels)
+
+
+def plan_deduplication(
+    nodes: Mapping[str, List[Dict[str, Any]]],
+    definitions: Mapping[str, Mapping[str, Any]],
+    fields: Optional[Mapping[str, Tuple[str, ...]]] = None,
+) -> SemanticReport:
+    """Work out per-label defaults and which inline copies can be dropped.
+
+    ``nodes`` maps a label to ``{"id", "semantics"}`` rows. An existing
+    ``SemanticDefinition`` value stays the default, since nodes without the
+    property already resolve to it; otherwise the most common inline text is
+    promoted.
+    """
+
+    fields = fields or semantic_fields()
+    report = SemanticReport()
+    for label, rows in nodes.items():
+        item = LabelSemantics(label, len(rows))
+        existing = definitions.get(label) or {}
+        for name in fields.get(label, ()):
+            values = [row["semantics"].get(name) for row in rows if row["semantics"].get(name) is not None]
+            default = existing.get(name)
+            if default is None and values:
+                default = Counter(values).most_common(1)[0][0]
+            if default is None:
+                continue
+            item.defaults[name] = default
+            item.store_bytes_after += _stored_bytes(default)
+            item.wire_bytes_after += len(str(default).encode("utf-8"))  # fetched once per label
+            for row, value in ((row, row["semantics"].get(name)) for row in rows):
+                if value is None:
+                    continue
+                size = len(str(value).encode("utf-8"))
+                item.wire_bytes_before += size
+                item.store_bytes_before += _stored_bytes(value)
+                if value == default:
+                    item.cleared.setdefault(row["id"], []).append(name)
+                else:
+                    item.overrides += 1
+                    item.wire_bytes_after += size
+                    item.store_bytes_after += _stored_bytes(value)
+            if name in existing:
+                item.store_bytes_before += _stored_bytes(default)
+        report.labels.append(item)
+    return report
+
+
+def estimate_script(path: Path) -> SemanticReport:
+    """Estimate the savings for the nodes a seed script creates, without a database."""
+
+    fields = semantic_fields()
+    nodes: Dict[str, List[Dict[str, Any]]] = {}
+    for label, properties in iter_node_literals(Path(path).read_text(encoding="utf-8")):
+        if label in fields:
+            semantics = {name: properties.get(name) for name in fields[label]}
+            nodes.setdefault(label, []).append({"id": properties.get("id"), "semantics": semantics})
+    return plan_deduplication(nodes, {}, fields)
+
+
+def read_semantic_definitions(connection) -> Dict[str, Dict[str, Any]]:
+    return {row["label"]: dict(row["properties"]) for row in connection.execute_query(DEFINITIONS_QUERY)}
+
+
+def deduplicate_semantics(connection, apply: bool = True) -> SemanticReport:
+    """Move shared semantic texts onto ``SemanticDefinition`` nodes.
+
+    With ``apply=False`` only the savings estimate is computed. The writes
+    run in one transaction that bumps the ``model`` DataVersion.
+    """
+
+    fields = semantic_fields()
+    definitions = read_semantic_definitions(connection)
+    nodes = {
+        label: connection.execute_query(
+            LABEL_SEMANTICS_QUERY.format(label=label, fields=", ".join(f".{name}" for name in names))
+        )
+        for label, names in fields.items()
+    }
+    report = plan_deduplication({label: rows for label, rows in nodes.items() if rows}, definitions, fields)
+    if not apply:
+        return report
+
+    statements: List[Tuple[str, Dict[str, Any]]] = [
+        (
+            SEMANTICS_UPSERT,
+            {"rows": [{"label": item.label, "properties": item.defaults} for item in report.labels if item.defaults]},
+        )
+    ]
+    for item in report.labels:
+        if item.cleared:
+            rows = [{"id": node_id, "cleared": {name: None for name in names}} for node_id, names in item.cleared.items()]
+            statements.append((CLEAR_SEMANTICS.format(label=item.label), {"rows": rows}))
+    statements.append(bump_statement(DOMAIN_MODEL))
+    connection.execute_transaction(statements)
+    report.applied = True
+    logger.info("Deduplicated semantic texts; about %d bytes fewer per full canvas read", report.wire_bytes_saved)
+    return report
+
+
+def inline_semantics(connection) -> int:
+    """Reverse the migration: copy the shared texts back onto every node."""
+
+    statements: List[Tuple[str, Dict[str, Any]]] = []
+    for label, names in semantic_fields().items():
+        assignments = ", ".join(f"n.{name} = coalesce(n.{name}, sd.{name})" for name in names)
+        statements.append((INLINE_SEMANTICS.format(label=label, assignments=assignments), {"label": label}))
+    statements.append(bump_statement(DOMAIN_MODEL))
+    connection.execute_transaction(statements)
+    return len(statements) - 1
+
+
+__all__ = [
+    "LabelSemantics",
+    "SemanticReport",
+    "deduplicate_semantics",
+    "estimate_script",
+    "inline_semantics",
+    "plan_deduplication",
+    "read_semantic_definitions",
+    "resolve_semantics",
+    "semantic_fields",
+]
@@ -0,0 +1,299 @@
+"""
+Cross-process result cache shared by several dashboard server processes.
+Backends implement a small key-value interface with per-key TTLs and a
+lease lock used for stampede protection; SQLite covers a single host and
+an in-memory store stands in for tests or single-process deployments.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+LOCK_POLL_SECONDS = 0.05
+
+
+def serialize(value: Any) -> bytes:
+    """Pickle (latest protocol) and zlib-compress a query result."""
+
+    return zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def deserialize(payload: bytes) -> Any:
+    # Only this dashboard writes the store; it must not be shared with untrusted writers.
+    return pickle.loads(zlib.decompress(payload))
+
+
+class KeyValueStore(ABC):
+    """Byte-valued store with per-key expiry and a cross-process lease lock."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value, or None when missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        """Store ``value``; ``ttl`` seconds until expiry (None keeps it until replaced)."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def try_lock(self, key: str, owner: str, lease: float) -> bool:
+        """Take the lock on ``key`` unless another owner holds an unexpired lease."""
+
+    @abstractmethod
+    def unlock(self, key: str, owner: str) -> None:
+        """Release the lock on ``key`` if ``owner`` still holds it."""
+
+    @contextmanager
+    def lock(self, key: str, lease: float, wait: float) -> Iterator[bool]:
+        """Hold the lock on ``key`` for at most ``lease`` seconds.
+
+        Waits up to ``wait`` seconds and yields whether the lock was taken;
+        callers that time out proceed without it rather than block forever.
+        """
+
+        owner = uuid.uuid4().hex
+        deadline = time.monotonic() + wait
+        acquired = self.try_lock(key, owner, lease)
+        while not acquired and time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_SECONDS)
+            acquired = self.try_lock(key, owner, lease)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                try:
+                    self.unlock(key, owner)
+                except Exception as exc:  # the lease expires on its own
+                    logger.warning("Shared cache unlock failed: %s", exc)
+
+
+class MemoryStore(KeyValueStore):
+    """Process-local stand-in with the same semantics as the shared backends."""
+
+    def __init__(self) -> None:
+        self._values: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._locks: Dict[str, Tuple[str, float]] = {}
+        self._mutex = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._mutex:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        with self._mutex:
+            self._values[key] = (value, time.time() + ttl if ttl else None)
+
+    def delete(self, key: str) -> None:
+        with self._mutex:
+            self._values.pop(key, None)
+
+    def try_lock(self, key: str, owner: str, lease: float) -> bool:
+        with self._mutex:
+            holder = self._locks.get(key)
+            if holder is not None and holder[1] > time.time():
+                return False
+            self._locks[key] = (owner, time.time() + lease)
+            return True
+
+    def unlock(self, key: str, owner: str) -> None:
+        with self._mutex:
+            if self._locks.get(key, ("", 0.0))[0] == owner:
+                del self._locks[key]
+
+
+class SQLiteStore(KeyValueStore):
+    """Single-host store in one SQLite file (WAL mode, memory-mapped reads)."""
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)",
+        "CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)",
+    )
+
+    def __init__(
+        self, path: os.PathLike | str, mmap_bytes: int = 256 * 1024 * 1024, busy_timeout: float = 2.0
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.mmap_bytes = mmap_bytes
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        with self._connect() as db:
+            for statement in self.SCHEMA:
+                db.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections are per thread; each process opens its own.
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(f"PRAGMA mmap_size={int(self.mmap_bytes)}")
+            self._local.db = db
+        return db
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._connect().execute(
+            "SELECT value FROM entries WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        now = time.time()
+        db = self._connect()
+        db.execute(
+            "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, sqlite3.Binary(value), now + ttl if ttl else None),
+        )
+        db.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+
+    def delete(self, key: str) -> None:
+        self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def try_lock(self, key: str, owner: str, lease: float) -> bool:
+        """False while another owner holds the lease; raises ``sqlite3.Error``
+        when the file cannot be written or stays busy past ``busy_timeout``."""
+
+        now = time.time()
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute("DELETE FROM locks WHERE key = ? AND expires_at <= ?", (key, now))
+            inserted = db.execute(
+                "INSERT OR IGNORE INTO locks (key, owner, expires_at) VALUES (?, ?, ?)",
+                (key, owner, now + lease),
+            ).rowcount
+            db.execute("COMMIT")
+        except sqlite3.Error:
+            if db.in_transaction:
+                db.execute("ROLLBACK")
+            raise
+        return inserted == 1
+
+    def unlock(self, key: str, owner: str) -> None:
+        self._connect().execute("DELETE FROM locks WHERE key = ? AND owner = ?", (key, owner))
+
+
+def create_store(backend: str, path: Optional[str] = None) -> Optional[KeyValueStore]:
+    """Build the configured store: ``sqlite``, ``memory``, ``module:factory`` or none."""
+
+    if not backend or backend == "none":
+        return None
+    if backend == "sqlite":
+        return SQLiteStore(path or "shared_cache.sqlite3")
+    if backend == "memory":
+        return MemoryStore()
+    module_name, _, attribute = backend.partition(":")
+    if not attribute:
+        raise ValueError(f"Unknown shared cache backend: {backend}")
+    factory: Callable[..., KeyValueStore] = getattr(importlib.import_module(module_name), attribute)
+    return factory()
+
+
+class SharedResultCache:
+    """Read-through cache of query results with single-flight loading across processes.
+
+    The cache never fails a read: the first store error (unwritable file,
+    lock that stays busy, broken backend) is logged, the store is disabled
+    for the rest of the process and every read goes straight to ``load``.
+    """
+
+    def __init__(
+        self,
+        store: KeyValueStore,
+        namespace: str,
+        ttl: Optional[float] = None,
+        lease: float = 60.0,
+        wait: float = 30.0,
+    ) -> None:
+        self.store = store
+        self.namespace = hashlib.sha1(namespace.encode("utf-8")).hexdigest()[:12]
+        self.ttl = ttl
+        self.lease = lease
+        self.wait = wait
+        self.disabled = False
+
+    def key(self, parts: Tuple[Any, ...]) -> str:
+        return f"{self.namespace}:{hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()}"
+
+    def get_or_load(self, parts: Tuple[Any, ...], load: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Return the shared value for ``parts``; only one process runs ``load`` per key."""
+
+        if self.disabled:
+            return load()
+        key = self.key(parts)
+        payload = self._get(key)
+        if payload is not None:
+            return deserialize(payload)
+        if self.disabled:
+            return load()
+
+        with ExitStack() as stack:
+            try:
+                acquired = stack.enter_context(self.store.lock(key, self.lease, self.wait))
+            except Exception as exc:
+                self._disable(exc)
+                return load()
+            if not acquired:
+                logger.warning("Shared cache lock wait timed out for %s; loading locally", parts[0])
+            # Another process may have filled the key while we waited.
+            payload = self._get(key)
+            if payload is not None:
+                return deserialize(payload)
+            value = load()
+            if not self.disabled:
+                try:
+                    self.store.set(key, serialize(value), ttl if ttl is not None else self.ttl)
+                except Exception as exc:
+                    self._disable(exc)
+            return value
+
+    def _get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.store.get(key)
+        except Exception as exc:
+            self._disable(exc)
+            return None
+
+    def _disable(self, exc: Exception) -> None:
+        if not self.disabled:
+            self.disabled = True
+            logger.error("Shared result cache disabled after a store failure, reading without it: %s", exc)
+
+
+__all__ = [
+    "KeyValueStore",
+    "MemoryStore",
+    "SQLiteStore",
+    "SharedResultCache",
+    "create_store",
+    "deserialize",
+    "serialize",
+]
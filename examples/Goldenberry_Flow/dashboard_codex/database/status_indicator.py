@@ -4,15 +4,19 @@ Database connectivity status helpers for the Codex dashboard variant.
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Optional
 
 from .connection import get_connection
 
+if TYPE_CHECKING:  # pragma: no cover - for type checkers only
+    from .backend import MetricsBackend
 
-def get_compact_database_status() -> Dict[str, str]:
+
+def get_compact_database_status(connection: Optional["MetricsBackend"] = None) -> Dict[str, str]:
     """Return status metadata for the database connection."""
 
-    connection = get_connection()
+    if connection is None:
+        connection = get_connection()
 
     if not connection.connected:
         return {
@@ -39,10 +43,10 @@ def get_compact_database_status() -> Dict[str, str]:
         }
 
 
-def render_status_pill() -> str:
+def render_status_pill(connection: Optional["MetricsBackend"] = None) -> str:
     """Return HTML markup for the header status pill."""
 
-    info = get_compact_database_status()
+    info = get_compact_database_status(connection)
     status = info.get("status", "ready")
     return (
         f"<span class='status-pill' data-status='{status}'>"
@@ -2,24 +2,43 @@
 
 from __future__ import annotations
 
+import functools
+import logging
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 import streamlit as st
 
 if __package__ in (None, ""):
     package_root = Path(__file__).resolve().parents[1]
     sys.path.insert(0, str(package_root.parent))
-    from dashboard_codex.database import render_status_pill
+    from dashboard_codex.config import UI_SETTINGS
+    from dashboard_codex.database import MetricsBackend, render_status_pill
 else:  # pragma: no cover - executed in package context
-    from ..database import render_status_pill
+    from ..config import UI_SETTINGS
+    from ..database import MetricsBackend, render_status_pill
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
-def render_page_header(title: str, description: Optional[str] = None, *, show_status: bool = True) -> None:
+F = TypeVar("F", bound=Callable[..., None])
+
+# st.fragment (1.37+) or its experimental predecessor; None on older releases.
+_FRAGMENT = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+def render_page_header(
+    title: str,
+    description: Optional[str] = None,
+    *,
+    show_status: bool = True,
+    connection: Optional[MetricsBackend] = None,
+) -> None:
     """Render a consistent page header block."""
 
-    status_html = render_status_pill() if show_status else ""
+    status_html = render_status_pill(connection) if show_status else ""
     description_html = f"<p class='page-subtitle'>{description}</p>" if description else ""
 
     st.markdown(
@@ -36,6 +55,35 @@ def render_page_header(title: str, description: Optional[str] = None, *, show_st
         unsafe_allow_html=True,
     )
 
+def record_render_time(section: str, started: float) -> float:
+    """Log (and optionally show) how long a section took since ``started``."""
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info("Rendered %s in %.1f ms", section, elapsed_ms)
+    if UI_SETTINGS["render_timings"]:
+        st.caption(f"{section}: {elapsed_ms:,.1f} ms")
+    return elapsed_ms
+
+
+def isolated_fragment(func: F) -> F:
+    """Render ``func`` as a Streamlit fragment so its widgets rerun only that section.
+
+    Fragment reruns replay the arguments of the last full run, so sections
+    work against the frames loaded then. Falls back to a plain call on
+    Streamlit releases without fragments.
+    """
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record_render_time(func.__name__.lstrip("_"), started)
+
+    return _FRAGMENT(timed) if _FRAGMENT is not None else timed  # type: ignore[return-value]
+
+
 def render_empty_state(message: str) -> None:
     """Render a shared empty-state block."""
 
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from ..database import get_connection
-from ..database.connection import Neo4jConnection
+from ..database import MetricsBackend, get_connection
 from ..styles import COLORS
-from .components import render_empty_state, render_page_header
+from .components import isolated_fragment, render_empty_state, render_page_header
+from .downsampling import bucket_bars, downsample_lines, line_render_mode
+from .frames import FrameAggregator, member_mask, period_index, period_mask, prepare_frame
 
 
 PRODUCT_DISPLAY_NAMES = {
@@ -54,10 +56,11 @@ STRUCTURE_COLORS = {
 }
 
 
-def render() -> None:
+def render(connection: Optional[MetricsBackend] = None) -> None:
     """Render the Cost Overview page."""
 
-    connection = get_connection()
+    if connection is None:
+        connection = get_connection()
     variable_df = _load_variable_costs(connection)
     fixed_df = _load_fixed_costs(connection)
     totals = _load_cost_totals(connection)
@@ -65,6 +68,7 @@ def render() -> None:
     render_page_header(
         title="Cost Overview",
         description="Track spending patterns and identify cost optimization opportunities.",
+        connection=connection,
     )
 
     _render_variable_timeline_section(variable_df)
@@ -78,33 +82,31 @@ def render() -> None:
     _render_cost_structure_section(totals)
 
 
-def _load_variable_costs(connection: Neo4jConnection) -> pd.DataFrame:
-    records = connection.get_variable_cost_timeseries()
-    if not records:
+def _load_variable_costs(connection: MetricsBackend) -> pd.DataFrame:
+    df = connection.get_variable_cost_timeseries_frame()
+    if df.empty:
         return pd.DataFrame(columns=["product", "display_name", "date", "cost"])
 
-    df = pd.DataFrame(records)
     df["display_name"] = df["product"].map(PRODUCT_DISPLAY_NAMES).fillna(df["product"])
     df["date"] = pd.to_datetime(dict(year=df["year"].astype(int), month=df["month"].astype(int), day=1))
     df = df.sort_values("date").reset_index(drop=True)
-    return df[["product", "display_name", "date", "cost"]]
+    return prepare_frame(df[["product", "display_name", "date", "cost"]], ("product", "display_name"))
 
 
-def _load_fixed_costs(connection: Neo4jConnection) -> pd.DataFrame:
-    records = connection.get_fixed_cost_timeseries()
-    if not records:
+def _load_fixed_costs(connection: MetricsBackend) -> pd.DataFrame:
+    df = connection.get_fixed_cost_timeseries_frame()
+    if df.empty:
         return pd.DataFrame(columns=["category", "display_name", "date", "cost"])
 
-    df = pd.DataFrame(records)
     df["display_name"] = df["category"].map(FIXED_STRUCTURE_TO_CATEGORY)
     df = df.dropna(subset=["display_name"])
     df["date"] = pd.to_datetime(dict(year=df["year"].astype(int), month=df["month"].astype(int), day=1))
     df = df.sort_values("date").reset_index(drop=True)
     df["category"] = df["display_name"]
-    return df[["category", "display_name", "date", "cost"]]
+    return prepare_frame(df[["category", "display_name", "date", "cost"]], ("category", "display_name"))
 
 
-def _load_cost_totals(connection: Neo4jConnection) -> Dict[str, float]:
+def _load_cost_totals(connection: MetricsBackend) -> Dict[str, float]:
     totals = connection.get_cost_totals_by_behavior()
     return {
         "variable": float(totals.get("variable", 0.0)),
@@ -113,10 +115,14 @@ def _load_cost_totals(connection: Neo4jConnection) -> Dict[str, float]:
 
 
 def _build_month_options(df: pd.DataFrame) -> List[Tuple[int, int, str]]:
-    unique = df[["date"]].drop_duplicates().sort_values("date")
-    return [(row.date.year, row.date.month, row.date.strftime("%b %Y")) for row in unique.itertuples()]
+    options: List[Tuple[int, int, str]] = []
+    for period in np.unique(df["period"].to_numpy()):
+        year, month = int(period // 12), int(period % 12) + 1
+        options.append((year, month, pd.Timestamp(year=year, month=month, day=1).strftime("%b %Y")))
+    return options
 
 
+@isolated_fragment
 def _render_variable_timeline_section(df: pd.DataFrame) -> None:
     st.markdown(
         """
@@ -172,26 +178,18 @@ def _render_variable_timeline_section(df: pd.DataFrame) -> None:
         format_func=lambda raw: PRODUCT_DISPLAY_NAMES.get(raw, raw),
     )
 
-    start_year, start_month = start_option[:2]
-    end_year, end_month = end_option[:2]
-
-    start_date = pd.Timestamp(year=start_year, month=start_month, day=1)
-    end_date = pd.Timestamp(year=end_year, month=end_month, day=1)
-
-    if start_date > end_date:
-        start_date, end_date = end_date, start_date
-
-    filtered_df = df[(df["date"] >= start_date) & (df["date"] <= end_date)]
+    mask = period_mask(df, period_index(*start_option[:2]), period_index(*end_option[:2]))
 
     if selected_products:
-        filtered_df = filtered_df[filtered_df["product"].isin(selected_products)]
+        mask &= member_mask(df, "product", selected_products)
+    filtered = FrameAggregator(df[mask], "cost")
 
-    if filtered_df.empty:
+    if filtered.empty:
         render_empty_state("No cost data matches the selected filters yet.")
         return
 
-    summary_total = filtered_df["cost"].sum()
-    month_count = filtered_df["date"].dt.to_period("M").nunique()
+    summary_total = filtered.total()
+    month_count = filtered.frame["period"].nunique()
     selection_caption = (
         f"{month_count} month{'s' if month_count != 1 else ''} selected &middot; "
         f"Total cost <strong>${summary_total:,.0f}</strong>"
@@ -203,9 +201,7 @@ def _render_variable_timeline_section(df: pd.DataFrame) -> None:
         unsafe_allow_html=True,
     )
 
-    chart_df = (
-        filtered_df.groupby(["date", "display_name"], as_index=False)["cost"].sum().sort_values("date")
-    )
+    chart_df = downsample_lines(filtered.by("date", "display_name"), "date", "cost", "display_name")
 
     palette = {
         name: PRODUCT_COLORS.get(name, COLORS["primary"])
@@ -219,6 +215,7 @@ def _render_variable_timeline_section(df: pd.DataFrame) -> None:
         color="display_name",
         color_discrete_map=palette,
         markers=True,
+        render_mode=line_render_mode(len(chart_df)),
     )
     fig.update_traces(mode="lines+markers", line=dict(width=3), marker=dict(size=7))
     fig.update_layout(
@@ -244,7 +241,7 @@ def _render_variable_timeline_section(df: pd.DataFrame) -> None:
 
     st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
-    summary_series = filtered_df.groupby("display_name")["cost"].sum().sort_values(ascending=False)
+    summary_series = filtered.totals_by("display_name")
     if summary_series.empty:
         st.info("No cost values available.")
     else:
@@ -254,6 +251,7 @@ def _render_variable_timeline_section(df: pd.DataFrame) -> None:
         columns[-1].metric(label="Total Variable Cost", value="${:,.0f}".format(summary_total))
 
 
+@isolated_fragment
 def _render_fixed_cost_section(df: pd.DataFrame) -> None:
     st.markdown(
         """
@@ -316,26 +314,18 @@ def _render_fixed_cost_section(df: pd.DataFrame) -> None:
         key=mode_key,
     )
 
-    start_year, start_month = start_option[:2]
-    end_year, end_month = end_option[:2]
-
-    start_date = pd.Timestamp(year=start_year, month=start_month, day=1)
-    end_date = pd.Timestamp(year=end_year, month=end_month, day=1)
-
-    if start_date > end_date:
-        start_date, end_date = end_date, start_date
-
-    filtered_df = df[(df["date"] >= start_date) & (df["date"] <= end_date)]
+    mask = period_mask(df, period_index(*start_option[:2]), period_index(*end_option[:2]))
 
     if selected_categories:
-        filtered_df = filtered_df[filtered_df["category"].isin(selected_categories)]
+        mask &= member_mask(df, "category", selected_categories)
+    filtered = FrameAggregator(df[mask], "cost")
 
-    if filtered_df.empty:
+    if filtered.empty:
         render_empty_state("No fixed cost data matches the selected filters yet.")
         return
 
-    summary_total = filtered_df["cost"].sum()
-    month_count = filtered_df["date"].dt.to_period("M").nunique()
+    summary_total = filtered.total()
+    month_count = filtered.frame["period"].nunique()
     selection_caption = (
         f"{month_count} month{'s' if month_count != 1 else ''} selected &middot; "
         f"Total fixed cost <strong>${summary_total:,.0f}</strong>"
@@ -347,9 +337,7 @@ def _render_fixed_cost_section(df: pd.DataFrame) -> None:
         unsafe_allow_html=True,
     )
 
-    chart_df = (
-        filtered_df.groupby(["date", "category"], as_index=False)["cost"].sum().sort_values("date")
-    )
+    chart_df, months_per_bar = bucket_bars(filtered.by("date", "category"), "date", "cost", "category")
 
     palette = {
         name: FIXED_CATEGORY_COLORS.get(name, "#1E3A8A")
@@ -387,8 +375,10 @@ def _render_fixed_cost_section(df: pd.DataFrame) -> None:
     )
 
     st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+    if months_per_bar > 1:
+        st.caption(f"Each bar sums {months_per_bar} consecutive months, starting at the month shown.")
 
-    summary_series = filtered_df.groupby("category")["cost"].sum().sort_values(ascending=False)
+    summary_series = filtered.totals_by("category")
     if summary_series.empty:
         st.info("No fixed cost values available.")
     else:
@@ -0,0 +1,122 @@
+"""
+Server-side downsampling for the timeline charts.
+Line traces are reduced with Largest-Triangle-Three-Buckets to a point
+budget derived from the chart width; stacked bars are summed into coarser
+period buckets so totals stay exact. Payload size no longer grows with
+history length.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.config import UI_SETTINGS
+else:  # pragma: no cover - executed in package context
+    from ..config import UI_SETTINGS
+
+LINE_PX_PER_POINT = 2
+BAR_PX_PER_BAR = 8
+MIN_POINTS = 3
+
+
+def point_budget(px_per_point: int = LINE_PX_PER_POINT, width_px: Optional[int] = None) -> int:
+    """Return how many x positions a chart of ``width_px`` can usefully show."""
+
+    width = width_px or UI_SETTINGS["chart_width_px"]
+    return max(int(width // px_per_point), MIN_POINTS)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Return the indices LTTB keeps out of ``x``/``y`` (``x`` sorted ascending).
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previous
+    pick and the next bucket's mean.
+    """
+
+    size = len(x)
+    if threshold >= size or threshold < MIN_POINTS:
+        return np.arange(size)
+
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    edges = np.linspace(1, size - 1, threshold - 1).astype("int64")
+    picked = np.empty(threshold, dtype="int64")
+    picked[0], picked[-1] = 0, size - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else size
+        next_start = stop if bucket + 2 < len(edges) else size - 1
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+        ax, ay = x[previous], y[previous]
+        areas = np.abs((ax - avg_x) * (y[start:stop] - ay) - (ax - x[start:stop]) * (avg_y - ay))
+        previous = start + int(areas.argmax())
+        picked[bucket + 1] = previous
+    return picked
+
+
+def downsample_lines(df: pd.DataFrame, x: str, y: str, group: str, budget: Optional[int] = None) -> pd.DataFrame:
+    """Apply LTTB per ``group`` trace so each keeps at most ``budget`` points."""
+
+    budget = budget or point_budget()
+    if df.empty or df.groupby(group, sort=False).size().max() <= budget:
+        return df
+
+    parts = []
+    for _, trace in df.sort_values([group, x], kind="stable").groupby(group, sort=False):
+        xs = trace[x].to_numpy()
+        if np.issubdtype(xs.dtype, np.datetime64):
+            xs = xs.astype("datetime64[s]").astype("int64")
+        parts.append(trace.iloc[lttb_indices(xs, trace[y].to_numpy(), budget)])
+    return pd.concat(parts).sort_values(x, kind="stable").reset_index(drop=True)
+
+
+def bucket_bars(
+    df: pd.DataFrame, x: str, y: str, group: str, budget: Optional[int] = None
+) -> Tuple[pd.DataFrame, int]:
+    """Sum consecutive ``x`` values into buckets so at most ``budget`` bars remain.
+
+    Returns the bucketed frame (each bucket labelled by its first ``x``) and
+    how many original periods each bucket spans (1 when nothing changed).
+    """
+
+    budget = budget or point_budget(BAR_PX_PER_BAR)
+    positions, uniques = pd.factorize(df[x], sort=True)
+    if len(uniques) <= budget:
+        return df, 1
+
+    span = math.ceil(len(uniques) / budget)
+    first_in_bucket = np.asarray(uniques)[(positions // span) * span]
+    bucketed = (
+        df.assign(**{x: first_in_bucket})
+        .groupby([x, group], as_index=False, observed=True, sort=True)[y]
+        .sum()
+    )
+    return bucketed, span
+
+
+def line_render_mode(points: int) -> str:
+    """Return the ``render_mode`` for ``px.line``: WebGL above the configured threshold."""
+
+    return "webgl" if points > UI_SETTINGS["webgl_threshold"] else "svg"
+
+
+__all__ = [
+    "bucket_bars",
+    "downsample_lines",
+    "line_render_mode",
+    "lttb_indices",
+    "point_budget",
+]
@@ -6,7 +6,7 @@ import html
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import pandas as pd
 import plotly.express as px
@@ -15,22 +15,21 @@ import streamlit as st
 if __package__ in (None, ""):
     package_root = Path(__file__).resolve().parents[1]
     sys.path.insert(0, str(package_root.parent))
-    from dashboard_codex.database import get_connection
+    from dashboard_codex.database import MetricsBackend, get_connection
     from dashboard_codex.pages.components import render_page_header
+    from dashboard_codex.pages.frames import split_minor_shares
     from dashboard_codex.styles import COLORS
 else:  # pragma: no cover - executed in package context
-    from ..database import get_connection
+    from ..database import MetricsBackend, get_connection
     from ..styles import COLORS
     from .components import render_page_header
-
-if TYPE_CHECKING:  # pragma: no cover - for type checkers only
-    from dashboard_codex.database.connection import Neo4jConnection
+    from .frames import split_minor_shares
 
 
 @dataclass
 class MetricDefinition:
     label: str
-    fetch: Callable[["Neo4jConnection"], float]
+    fetch: Callable[[MetricsBackend], float]
     formatter: Callable[[float], str]
     footnote: Optional[str] = None
 
@@ -81,7 +80,7 @@ def _format_percentage(value: Optional[float], *, decimals: int = 1) -> str:
     return f"{value:.{decimals}f}%"
 
 
-def _calculate_cost_overview(connection: "Neo4jConnection") -> dict:
+def _calculate_cost_overview(connection: MetricsBackend) -> dict:
     total_costs = float(connection.get_total_costs() or 0.0)
     variable_costs = float(connection.get_variable_costs() or 0.0)
     fixed_costs = float(connection.get_fixed_costs() or 0.0)
@@ -117,7 +116,7 @@ def _calculate_cost_overview(connection: "Neo4jConnection") -> dict:
     }
 
 
-def _render_cost_metrics(connection: "Neo4jConnection") -> None:
+def _render_cost_metrics(connection: MetricsBackend) -> None:
     try:
         summary = _calculate_cost_overview(connection)
     except Exception as exc:  # pragma: no cover - display fallback
@@ -197,14 +196,16 @@ def _render_cost_metrics(connection: "Neo4jConnection") -> None:
     st.markdown("".join(cards_html), unsafe_allow_html=True)
 
 
-def render() -> None:
+def render(connection: Optional[MetricsBackend] = None) -> None:
     """Render the executive dashboard page."""
 
-    connection = get_connection()
+    if connection is None:
+        connection = get_connection()
 
     render_page_header(
         "Executive Dashboard",
         "Critical revenue metrics and top product performance at a glance.",
+        connection=connection,
     )
     _render_metrics(connection)
     _render_cost_metrics(connection)
@@ -216,7 +217,7 @@ def render() -> None:
     st.caption("Additional executive insights, charts, and filters will arrive in the next phase.")
 
 
-def _render_metrics(connection: "Neo4jConnection") -> None:
+def _render_metrics(connection: MetricsBackend) -> None:
     metrics: List[MetricResult] = []
 
     for definition in METRIC_DEFINITIONS:
@@ -267,7 +268,7 @@ def _render_metrics(connection: "Neo4jConnection") -> None:
     st.markdown("".join(cards_html), unsafe_allow_html=True)
 
 
-def _render_product_highlights(connection: "Neo4jConnection") -> List[dict]:
+def _render_product_highlights(connection: MetricsBackend) -> List[dict]:
     st.markdown(
         """
         <div class="section-header">
@@ -343,7 +344,7 @@ VARIABLE_BEHAVIOR_COLORS = ["#1E3A8A", "#3730A3", "#4338CA", "#1D4ED8"]
 FIXED_BEHAVIOR_COLORS = ["#60A5FA", "#93C5FD", "#BFDBFE", "#DBEAFE"]
 
 
-def _render_distribution_section(connection: "Neo4jConnection", product_metrics: List[dict]) -> None:
+def _render_distribution_section(connection: MetricsBackend, product_metrics: List[dict]) -> None:
     st.markdown(
         """
         <div class="section-header">
@@ -426,7 +427,7 @@ def _render_revenue_distribution_chart(product_metrics: List[dict]) -> None:
     st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
 
-def _render_cost_distribution_chart(connection: "Neo4jConnection") -> None:
+def _render_cost_distribution_chart(connection: MetricsBackend) -> None:
     st.markdown("<h3 style='margin:0 0 0.75rem;'>Cost Distribution by Category</h3>", unsafe_allow_html=True)
 
     try:
@@ -462,43 +463,37 @@ def _render_cost_distribution_chart(connection: "Neo4jConnection") -> None:
         )
         return
 
-    total_cost = df["total_cost"].sum()
     share_threshold = 3.0
+    grouped_df, minor_df, total_cost = split_minor_shares(
+        df[["category", "total_cost", "behavior"]], "total_cost", share_threshold
+    )
 
-    grouped_rows = []
-    other_total = 0.0
-    other_details: List[str] = []
-
-    for _, row in df.iterrows():
-        share_pct = (row["total_cost"] / total_cost) * 100 if total_cost else 0.0
-        if share_pct >= share_threshold or not grouped_rows:
-            grouped_rows.append(
+    other_total = float(minor_df["total_cost"].sum())
+    other_details = (
+        minor_df["category"].astype(str)
+        + " ("
+        + minor_df["share_pct"].map("{:.1f}".format)
+        + "%, $"
+        + minor_df["total_cost"].map("{:,.0f}".format)
+        + ")"
+    ).tolist()
+
+    grouped_df["details"] = None
+    if other_total > 0:
+        other_row = pd.DataFrame(
+            [
                 {
-                    "category": row["category"],
-                    "total_cost": float(row["total_cost"]),
-                    "behavior": row["behavior"],
-                    "share_pct": share_pct,
+                    "category": "Other Costs",
+                    "total_cost": other_total,
+                    "behavior": "fixed",
+                    "share_pct": (other_total / total_cost) * 100 if total_cost else 0.0,
+                    "details": other_details,
                 }
-            )
-        else:
-            other_total += float(row["total_cost"])
-            other_details.append(
-                f"{row['category']} ({share_pct:.1f}%, ${row['total_cost']:,.0f})"
-            )
-
-    if other_total > 0:
-        grouped_rows.append(
-            {
-                "category": "Other Costs",
-                "total_cost": other_total,
-                "behavior": "fixed",
-                "share_pct": (other_total / total_cost) * 100 if total_cost else 0.0,
-                "details": list(other_details),
-            }
+            ]
         )
+        grouped_df = pd.concat([grouped_df, other_row], ignore_index=True)
 
-    grouped_df = pd.DataFrame(grouped_rows)
-    grouped_df = grouped_df.sort_values("total_cost", ascending=False).reset_index(drop=True)
+    grouped_df = grouped_df.sort_values("total_cost", ascending=False, kind="stable").reset_index(drop=True)
 
     color_map = {}
     variable_index = 0
@@ -513,19 +508,17 @@ def _render_cost_distribution_chart(connection: "Neo4jConnection") -> None:
             fixed_index += 1
         color_map[category] = color
 
-    formatted_costs = grouped_df["total_cost"].map(lambda value: f"${value:,.0f}")
-    hover_text: List[str] = []
-    for index, row in grouped_df.iterrows():
-        lines = [
-            f"<b>{row['category']}</b>",
-            f"Type: {'Variable' if row['behavior'] == 'variable' else 'Fixed'}",
-            f"Cost: {formatted_costs.loc[index]}",
-            f"Share: {row['share_pct']:.1f}%",
-        ]
-        if row["category"] == "Other Costs" and row.get("details"):
-            detail_lines = "<br>".join(f"- {detail}" for detail in row["details"])
-            lines.insert(2, f"Includes:<br>{detail_lines}")
-        hover_text.append("<br>".join(lines))
+    type_labels = grouped_df["behavior"].eq("variable").map({True: "Variable", False: "Fixed"})
+    includes = grouped_df["details"].map(
+        lambda details: "Includes:<br>" + "<br>".join(f"- {detail}" for detail in details) + "<br>" if details else ""
+    )
+    hover_text: List[str] = (
+        "<b>" + grouped_df["category"].astype(str) + "</b><br>"
+        + "Type: " + type_labels + "<br>"
+        + includes
+        + "Cost: " + grouped_df["total_cost"].map("${:,.0f}".format) + "<br>"
+        + "Share: " + grouped_df["share_pct"].map("{:.1f}".format) + "%"
+    ).tolist()
 
     fig = px.pie(
         grouped_df,
@@ -574,7 +567,7 @@ def _format_ratio(value: Optional[float]) -> str:
     return f"{value:.2f}×"
 
 
-def _calculate_business_performance(connection: "Neo4jConnection", product_metrics: List[dict]) -> dict:
+def _calculate_business_performance(connection: MetricsBackend, product_metrics: List[dict]) -> dict:
     if not product_metrics:
         return {
             "metrics": {},
@@ -656,7 +649,7 @@ def _calculate_business_performance(connection: "Neo4jConnection", product_metri
     }
 
 
-def _calculate_toc_metrics(connection: "Neo4jConnection") -> Dict[str, Any]:
+def _calculate_toc_metrics(connection: MetricsBackend) -> Dict[str, Any]:
     """Collect core TOC metrics and derived ratios."""
 
     throughput = float(connection.get_throughput() or 0.0)
@@ -777,7 +770,7 @@ def _render_business_performance(data: dict) -> None:
     st.markdown(table_html, unsafe_allow_html=True)
 
 
-def _render_toc_core_metrics(connection: "Neo4jConnection") -> None:
+def _render_toc_core_metrics(connection: MetricsBackend) -> None:
     metrics = _calculate_toc_metrics(connection)
     roi_ratio = metrics["roi_ratio"]
     roi_pct = roi_ratio * 100
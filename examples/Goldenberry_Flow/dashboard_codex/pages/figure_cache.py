@@ -0,0 +1,157 @@
+"""
+LRU cache of serialized Plotly figures keyed by their inputs.
+A key hashes the input frame slice (or summary values) together with the
+widget state, so a repeat view rebuilds the figure from JSON and skips
+both the pandas transforms and the figure construction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.config import UI_SETTINGS
+else:  # pragma: no cover - executed in package context
+    from ..config import UI_SETTINGS
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Page frames are loaded once per script run and not mutated afterwards, so
+# their content hash is memoised per object while that object is alive.
+_fingerprints: Dict[int, Tuple[weakref.ref, str]] = {}
+_fingerprint_lock = threading.Lock()
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Return a content hash of ``df`` (values, columns and dtypes)."""
+
+    with _fingerprint_lock:
+        entry = _fingerprints.get(id(df))
+        if entry is not None and entry[0]() is df:
+            return entry[1]
+
+    digest = hashlib.sha1()
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in df.dtypes.items()]).encode("utf-8"))
+    if not df.empty:
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    fingerprint = digest.hexdigest()
+
+    key = id(df)
+    with _fingerprint_lock:
+        _fingerprints[key] = (weakref.ref(df, lambda _ref, key=key: _fingerprints.pop(key, None)), fingerprint)
+    return fingerprint
+
+
+def _normalise(part: Any) -> Any:
+    if isinstance(part, pd.DataFrame):
+        return {"frame": frame_fingerprint(part)}
+    if isinstance(part, (set, frozenset)):
+        return sorted((_normalise(item) for item in part), key=repr)
+    if isinstance(part, (list, tuple)):
+        return [_normalise(item) for item in part]
+    if isinstance(part, dict):
+        return {str(key): _normalise(value) for key, value in part.items()}
+    return part
+
+
+def figure_key(name: str, *parts: Any) -> str:
+    """Hash a chart name plus its inputs (frames, widget values) into a key."""
+
+    payload = json.dumps([name, _normalise(list(parts))], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class FigureCache:
+    """Thread-safe LRU of figure JSON strings."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = max(int(maxsize), 0)
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[go.Figure]:
+        """Return a fresh figure for ``key`` or None on a miss."""
+
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pio.from_json(payload)
+
+    def put(self, key: str, fig: go.Figure) -> None:
+        """Store ``fig`` serialized, evicting the least recently used entries."""
+
+        if self.maxsize == 0:
+            return
+        payload = fig.to_json()
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_CACHE = FigureCache(UI_SETTINGS["figure_cache_size"])
+
+
+def get_figure_cache() -> FigureCache:
+    """Return the process-wide figure cache shared by all sessions."""
+
+    return _CACHE
+
+
+def cached_figure(
+    name: str, parts: Tuple[Any, ...], build: Callable[[], Optional[go.Figure]]
+) -> Optional[go.Figure]:
+    """Return the cached figure for ``parts`` or ``build()`` and store it.
+
+    ``build`` should contain the chart's pandas transforms as well as the
+    figure construction; neither runs on a hit. It may return None when
+    there is nothing to plot, which is not cached. Figures are deserialised
+    per call, so callers may mutate the returned object freely.
+    """
+
+    key = figure_key(name, *parts)
+    fig = _CACHE.get(key)
+    if fig is not None:
+        return fig
+    fig = build()
+    if fig is None:
+        return None
+    try:
+        _CACHE.put(key, fig)
+    except (TypeError, ValueError) as exc:  # pragma: no cover - unserialisable trace data
+        logger.warning("Figure %s was not cached: %s", name, exc)
+    return fig
+
+
+__all__ = ["FigureCache", "cached_figure", "figure_key", "frame_fingerprint", "get_figure_cache"]
@@ -0,0 +1,165 @@
+"""
+Vectorised filtering and aggregation shared by the revenue and cost pages.
+Frames carry categorical dimension columns and integer period indexes so
+filters are boolean masks over codes, and group-by results are memoised so
+charts and summaries reuse the same aggregation.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+PERIOD_COLUMN = "period"
+QUARTER_COLUMN = "quarter_index"
+
+
+def period_index(year, month):
+    """Return a monotonically increasing month index (scalar or vectorised)."""
+
+    return year * 12 + (month - 1)
+
+
+def quarter_index(year, quarter):
+    """Return a monotonically increasing quarter index (scalar or vectorised)."""
+
+    return year * 4 + (quarter - 1)
+
+
+def prepare_frame(
+    df: pd.DataFrame,
+    dimensions: Sequence[str] = (),
+    orders: Optional[Dict[str, Sequence[str]]] = None,
+) -> pd.DataFrame:
+    """Return a copy with categorical dimensions and integer period indexes.
+
+    ``orders`` fixes the category order per dimension; values missing from
+    it are appended so nothing is dropped. A ``date`` column yields
+    ``period``; ``year`` plus ``quarter`` yield ``quarter_index`` and a
+    ``quarter_label`` such as ``"Q3 2025"``.
+    """
+
+    frame = df.copy()
+    orders = orders or {}
+    for column in dimensions:
+        if column not in frame:
+            continue
+        present = frame[column].dropna().unique().tolist()
+        categories = list(dict.fromkeys([*orders.get(column, ()), *sorted(present, key=str)]))
+        frame[column] = pd.Categorical(frame[column], categories=categories)
+
+    if "date" in frame:
+        dates = frame["date"].dt
+        frame[PERIOD_COLUMN] = period_index(dates.year.astype("int64"), dates.month.astype("int64"))
+    if "year" in frame and "quarter" in frame:
+        years = frame["year"].astype("int64")
+        quarters = frame["quarter"].astype("int64")
+        frame[QUARTER_COLUMN] = quarter_index(years, quarters)
+        # Format each distinct quarter once instead of once per row.
+        codes, uniques = pd.factorize(frame[QUARTER_COLUMN], sort=True)
+        labels = [f"Q{index % 4 + 1} {index // 4}" for index in uniques]
+        frame["quarter_label"] = pd.Categorical.from_codes(codes, categories=labels)
+    return frame
+
+
+def period_mask(frame: pd.DataFrame, start: int, end: int) -> np.ndarray:
+    """Select rows whose month index falls in ``[start, end]`` (order-insensitive)."""
+
+    low, high = min(start, end), max(start, end)
+    periods = frame[PERIOD_COLUMN].to_numpy()
+    return (periods >= low) & (periods <= high)
+
+
+def quarter_mask(frame: pd.DataFrame, quarters: Iterable[Tuple[int, int]]) -> np.ndarray:
+    """Select rows in any of the given ``(year, quarter)`` pairs."""
+
+    wanted = [quarter_index(year, quarter) for year, quarter in quarters]
+    return np.isin(frame[QUARTER_COLUMN].to_numpy(), wanted)
+
+
+def member_mask(frame: pd.DataFrame, column: str, values: Iterable[str]) -> np.ndarray:
+    """Select rows whose categorical ``column`` is one of ``values``."""
+
+    series = frame[column]
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.isin(list(values)).to_numpy()
+    codes = series.cat.categories.get_indexer(list(values))
+    return np.isin(series.cat.codes.to_numpy(), codes[codes >= 0])
+
+
+class FrameAggregator:
+    """Memoised sums of one value column over a filtered frame."""
+
+    def __init__(self, frame: pd.DataFrame, value: str) -> None:
+        self.frame = frame
+        self.value = value
+        self._groups: Dict[Tuple[str, ...], pd.DataFrame] = {}
+
+    @property
+    def empty(self) -> bool:
+        return self.frame.empty
+
+    def total(self) -> float:
+        return float(self.frame[self.value].sum())
+
+    def by(self, *keys: str) -> pd.DataFrame:
+        """Return sums grouped by ``keys`` (sorted, observed combinations only).
+
+        Categorical keys come back as plain values so plotting code sees the
+        same dtypes as before.
+        """
+
+        if keys not in self._groups:
+            source = self._finest_group_containing(keys)
+            grouped = source.groupby(list(keys), as_index=False, observed=True, sort=True)[self.value].sum()
+            for key in keys:
+                if isinstance(grouped[key].dtype, pd.CategoricalDtype):
+                    grouped[key] = grouped[key].astype(object)
+            self._groups[keys] = grouped
+        return self._groups[keys]
+
+    def totals_by(self, key: str, ascending: bool = False) -> pd.Series:
+        """Return a sorted Series of sums per ``key`` for summaries."""
+
+        return self.by(key).set_index(key)[self.value].sort_values(ascending=ascending)
+
+    def _finest_group_containing(self, keys: Tuple[str, ...]) -> pd.DataFrame:
+        # Re-aggregate an existing, smaller group-by when one covers the keys.
+        candidates: List[pd.DataFrame] = [
+            grouped for cached_keys, grouped in self._groups.items() if set(keys) <= set(cached_keys)
+        ]
+        if candidates:
+            return min(candidates, key=len)
+        return self.frame
+
+
+def split_minor_shares(
+    df: pd.DataFrame, value: str, threshold_pct: float
+) -> Tuple[pd.DataFrame, pd.DataFrame, float]:
+    """Split rows into major and minor shares of the ``value`` total.
+
+    Rows are sorted descending; the largest row is always major. Returns
+    ``(major, minor, total)`` with a ``share_pct`` column on both frames.
+    """
+
+    ordered = df.sort_values(value, ascending=False, kind="stable").reset_index(drop=True)
+    total = float(ordered[value].sum())
+    ordered["share_pct"] = ordered[value] / total * 100 if total else 0.0
+    keep = ordered["share_pct"].to_numpy() >= threshold_pct
+    if len(keep):
+        keep[0] = True
+    return ordered[keep].reset_index(drop=True), ordered[~keep].reset_index(drop=True), total
+
+
+__all__ = [
+    "FrameAggregator",
+    "member_mask",
+    "period_index",
+    "period_mask",
+    "prepare_frame",
+    "quarter_index",
+    "quarter_mask",
+    "split_minor_shares",
+]
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import html
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -17,12 +17,14 @@ import streamlit as st
 if __package__ in (None, ""):
     package_root = Path(__file__).resolve().parents[1]
     sys.path.insert(0, str(package_root.parent))
-    from dashboard_codex.database import get_connection
-    from dashboard_codex.pages.components import render_page_header, render_empty_state
+    from dashboard_codex.database import MetricsBackend, get_connection
+    from dashboard_codex.pages.components import isolated_fragment, render_page_header, render_empty_state
+    from dashboard_codex.pages.figure_cache import cached_figure
     from dashboard_codex.styles import COLORS
 else:  # pragma: no cover - executed in package context
-    from ..database import get_connection
-    from .components import render_page_header, render_empty_state
+    from ..database import MetricsBackend, get_connection
+    from .components import isolated_fragment, render_page_header, render_empty_state
+    from .figure_cache import cached_figure
     from ..styles import COLORS
 
 
@@ -67,12 +69,35 @@ COST_CARD_CONFIG = [
     ("Profit per KG", "profit_per_kg", "currency_per_kg"),
 ]
 
+BUNDLE_STATE_KEY = "product-performance-bundle"
+SWITCH_FLAG_KEY = "product-performance-switching"
+
+
+@dataclass
+class ProductBundle:
+    """Everything the page renders, for all products, indexed by product name."""
+
+    metrics: List[Dict[str, float]]
+    total_revenue: float
+    performance_df: pd.DataFrame
+    cost_summaries: Dict[str, Dict[str, float | None]] = field(default_factory=dict)
+    trends: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    def metrics_for(self, product: str) -> Optional[Dict[str, float]]:
+        return next((record for record in self.metrics if record.get("Product") == product), None)
+
+    def cost_summary_for(self, product: str) -> Dict[str, float | None]:
+        return self.cost_summaries.get(product) or _empty_cost_summary()
+
+    def trend_for(self, product: str) -> pd.DataFrame:
+        return self.trends.get(product, pd.DataFrame())
+
+
 def _get_display_name(raw_name: str) -> str:
     return PRODUCT_LABELS.get(raw_name, raw_name)
 
 
-def _load_product_metrics() -> List[Dict[str, float]]:
-    connection = get_connection()
+def _load_product_metrics(connection: MetricsBackend) -> List[Dict[str, float]]:
     try:
         return connection.get_product_metrics()
     except Exception as exc:  # pragma: no cover - runtime fallback
@@ -80,19 +105,16 @@ def _load_product_metrics() -> List[Dict[str, float]]:
         return []
 
 
-def _load_monthly_performance(connection=None) -> pd.DataFrame:
-    if connection is None:
-        connection = get_connection()
+def _load_monthly_performance(connection: MetricsBackend) -> pd.DataFrame:
     try:
-        records = connection.get_product_monthly_performance()
+        df = connection.get_product_monthly_performance_frame()
     except Exception as exc:  # pragma: no cover - runtime fallback
         st.error(f"Unable to load monthly performance: {exc}")
         return pd.DataFrame()
 
-    if not records:
+    if df.empty:
         return pd.DataFrame()
 
-    df = pd.DataFrame(records)
     df["date"] = pd.to_datetime({"year": df["year"].astype(int), "month": df["month"].astype(int), "day": 1})
     df["display_name"] = df["product"].map(PRODUCT_LABELS).fillna(df["product"])
     return df[["product", "display_name", "date", "revenue", "volume"]]
@@ -142,24 +164,26 @@ def _render_cost_analysis_cards(summary: Dict[str, float | None]) -> None:
 
 
 
-def _calculate_cost_metrics(connection: Neo4jConnection, product: str, metrics: Dict[str, float], total_revenue_all: float) -> Dict[str, float | None]:
-    try:
-        variable_cost = connection.get_product_variable_cost(product)
-    except Exception as exc:  # pragma: no cover - runtime fallback
-        st.error(f"Unable to load cost metrics: {exc}")
-        return {
-            "variable_cost": None,
-            "cost_per_kg": None,
-            "gross_profit": None,
-            "gross_margin": None,
-            "profit_per_kg": None,
-        }
+def _empty_cost_summary() -> Dict[str, float | None]:
+    return {
+        "variable_cost": None,
+        "cost_per_kg": None,
+        "gross_profit": None,
+        "gross_margin": None,
+        "profit_per_kg": None,
+    }
 
+
+def _calculate_cost_metrics(
+    metrics: Dict[str, float],
+    total_revenue_all: float,
+    variable_cost: float,
+    cost_lookup: Dict[str, float],
+    total_fixed_costs: float,
+) -> Dict[str, float | None]:
     revenue = float(metrics.get("TotalRevenue") or 0.0)
     volume = float(metrics.get("TotalVolume") or 0.0)
 
-    product_cost_rows = connection.get_product_costs(product)
-    cost_lookup = {row.get("category"): float(row.get("cost") or 0.0) for row in product_cost_rows}
     procurement_cost = cost_lookup.get("Fruit Procurement", 0.0)
     packaging_cost = max(variable_cost - procurement_cost, 0.0)
 
@@ -168,8 +192,6 @@ def _calculate_cost_metrics(connection: Neo4jConnection, product: str, metrics:
     gross_margin = (gross_profit / revenue * 100) if revenue else None
     profit_per_kg = (gross_profit / volume) if volume else None
 
-    totals_behavior = connection.get_cost_totals_by_behavior()
-    total_fixed_costs = float(totals_behavior.get("fixed", 0.0))
     revenue_share = (revenue / total_revenue_all) if total_revenue_all else 0.0
     allocated_fixed = total_fixed_costs * revenue_share
     net_profit = gross_profit - allocated_fixed
@@ -242,29 +264,21 @@ SPARKLINE_METRICS = [
 ]
 
 
-def _prepare_cost_trend_dataframe(connection: Neo4jConnection, performance_df: pd.DataFrame, product: str) -> pd.DataFrame:
-    if performance_df.empty:
-        return pd.DataFrame()
-
-    product_df = performance_df[performance_df["product"] == product][["date", "revenue", "volume"]].copy()
-    if product_df.empty:
-        return pd.DataFrame()
+def _load_cost_trend_inputs(connection: MetricsBackend) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Return (variable cost by product and date, total fixed cost by date) for all products."""
 
-    variable_records = connection.get_variable_cost_timeseries()
-    variable_df = pd.DataFrame(variable_records)
+    variable_df = connection.get_variable_cost_timeseries_frame()
     if not variable_df.empty:
         variable_df["date"] = pd.to_datetime(
             {"year": variable_df["year"].astype(int), "month": variable_df["month"].astype(int), "day": 1}
         )
-        variable_df = variable_df[variable_df["product"] == product][["date", "cost"]]
-        variable_df = variable_df.rename(columns={"cost": "variable_cost"})
+        variable_df = variable_df[["product", "date", "cost"]].rename(columns={"cost": "variable_cost"})
     else:
-        variable_df = pd.DataFrame(columns=["date", "variable_cost"])
+        variable_df = pd.DataFrame(columns=["product", "date", "variable_cost"])
 
-    fixed_records = connection.get_fixed_cost_timeseries()
+    fixed_df = connection.get_fixed_cost_timeseries_frame()
     fixed_totals = pd.DataFrame(columns=["date", "total_fixed_cost"])
-    if fixed_records:
-        fixed_df = pd.DataFrame(fixed_records)
+    if not fixed_df.empty:
         fixed_df["date"] = pd.to_datetime(
             {"year": fixed_df["year"].astype(int), "month": fixed_df["month"].astype(int), "day": 1}
         )
@@ -273,14 +287,26 @@ def _prepare_cost_trend_dataframe(connection: Neo4jConnection, performance_df: p
             .sum()
             .rename(columns={"cost": "total_fixed_cost"})
         )
+    return variable_df, fixed_totals
 
-    revenue_totals = (
-        performance_df.groupby("date", as_index=False)["revenue"]
-        .sum()
-        .rename(columns={"revenue": "total_revenue"})
-    )
 
-    trend_df = product_df.merge(variable_df, on="date", how="outer")
+def _prepare_cost_trend_dataframe(
+    performance_df: pd.DataFrame,
+    variable_df: pd.DataFrame,
+    fixed_totals: pd.DataFrame,
+    revenue_totals: pd.DataFrame,
+    product: str,
+) -> pd.DataFrame:
+    if performance_df.empty:
+        return pd.DataFrame()
+
+    product_df = performance_df[performance_df["product"] == product][["date", "revenue", "volume"]].copy()
+    if product_df.empty:
+        return pd.DataFrame()
+
+    product_variable = variable_df[variable_df["product"] == product][["date", "variable_cost"]]
+
+    trend_df = product_df.merge(product_variable, on="date", how="outer")
     trend_df = trend_df.merge(revenue_totals, on="date", how="left")
     trend_df = trend_df.merge(fixed_totals, on="date", how="left")
 
@@ -447,14 +473,22 @@ def _render_single_sparkline_card(trend_df: pd.DataFrame, metric_config: Dict[st
 
 
 def _render_combination_chart(df: pd.DataFrame, product: str) -> None:
-    filtered = df[df["product"] == product].sort_values("date")
-    if filtered.empty:
+    fig = cached_figure("product-combination", (df, product), lambda: _build_combination_chart(df, product))
+    if fig is None:
         st.markdown(
             "<div class='empty-state'>No monthly revenue or volume data is available for this product.</div>",
             unsafe_allow_html=True,
         )
         return
 
+    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+
+
+def _build_combination_chart(df: pd.DataFrame, product: str) -> Optional[go.Figure]:
+    filtered = df[df["product"] == product].sort_values("date")
+    if filtered.empty:
+        return None
+
     filtered["month_label"] = filtered["date"].dt.strftime("%b %Y")
 
     fig = go.Figure()
@@ -501,8 +535,7 @@ def _render_combination_chart(df: pd.DataFrame, product: str) -> None:
         ),
         xaxis=dict(showgrid=True, gridcolor="#E2E8F0"),
     )
-
-    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+    return fig
 
 
 def _render_market_share(total_revenue: float, selected_metrics: Dict[str, float], display_name: str) -> None:
@@ -549,6 +582,19 @@ def _render_cost_breakdown_donut(summary: Dict[str, float | None]) -> None:
     procurement_cost = float(summary.get("procurement_cost") or 0.0)
     allocated_fixed = float(summary.get("allocated_fixed") or 0.0)
 
+    fig = cached_figure(
+        "product-cost-donut",
+        (procurement_cost, allocated_fixed),
+        lambda: _build_cost_breakdown_donut(procurement_cost, allocated_fixed),
+    )
+    if fig is None:
+        render_empty_state("Cost breakdown is not available for this product yet.")
+        return
+
+    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+
+
+def _build_cost_breakdown_donut(procurement_cost: float, allocated_fixed: float) -> Optional[go.Figure]:
     slices = [
         {"category": "Fruit Procurement", "value": procurement_cost},
         {"category": "Allocated Fixed Costs", "value": allocated_fixed},
@@ -556,8 +602,7 @@ def _render_cost_breakdown_donut(summary: Dict[str, float | None]) -> None:
     total_cost = sum(item["value"] for item in slices)
 
     if total_cost <= 0:
-        render_empty_state("Cost breakdown is not available for this product yet.")
-        return
+        return None
 
     chart_df = pd.DataFrame(slices)
 
@@ -590,8 +635,7 @@ def _render_cost_breakdown_donut(summary: Dict[str, float | None]) -> None:
             )
         ],
     )
-
-    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+    return fig
 
 
 def _render_profitability_waterfall(summary: Dict[str, float | None], display_name: str) -> None:
@@ -604,6 +648,18 @@ def _render_profitability_waterfall(summary: Dict[str, float | None], display_na
         render_empty_state("Waterfall data is not available for this product yet.")
         return
 
+    fig = cached_figure(
+        "product-waterfall",
+        (revenue, variable_cost, allocated_fixed, net_profit, display_name),
+        lambda: _build_profitability_waterfall(revenue, variable_cost, allocated_fixed, net_profit, display_name),
+    )
+    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+    st.caption("*Fixed costs allocated proportionally by revenue")
+
+
+def _build_profitability_waterfall(
+    revenue: float, variable_cost: float, allocated_fixed: float, net_profit: float, display_name: str
+) -> go.Figure:
     steps = [
         ("Revenue", revenue, "relative"),
         ("Variable Costs", -variable_cost, "relative"),
@@ -634,21 +690,87 @@ def _render_profitability_waterfall(summary: Dict[str, float | None], display_na
         paper_bgcolor="#FFFFFF",
         plot_bgcolor="#FFFFFF",
     )
+    return fig
+
+
+def _load_product_bundle(connection: MetricsBackend) -> ProductBundle:
+    """Load metrics, monthly performance and cost data for every product in one pass."""
+
+    metrics = _load_product_metrics(connection)
+    total_revenue = sum(float(record.get("TotalRevenue") or 0.0) for record in metrics)
+    performance_df = _load_monthly_performance(connection)
+    bundle = ProductBundle(metrics=metrics, total_revenue=total_revenue, performance_df=performance_df)
+
+    try:
+        breakdown = connection.get_product_cost_breakdown()
+        variable_costs = connection.get_product_variable_costs()
+        totals_behavior = connection.get_cost_totals_by_behavior()
+        variable_df, fixed_totals = _load_cost_trend_inputs(connection)
+    except Exception as exc:  # pragma: no cover - runtime fallback
+        st.error(f"Unable to load cost metrics: {exc}")
+        return bundle
+
+    total_fixed_costs = float(totals_behavior.get("fixed", 0.0))
+    cost_lookups: Dict[str, Dict[str, float]] = {}
+    for row in breakdown:
+        lookup = cost_lookups.setdefault(row["product"], {})
+        lookup[row["category"]] = lookup.get(row["category"], 0.0) + row["cost"]
+
+    revenue_totals = pd.DataFrame(columns=["date", "total_revenue"])
+    if not performance_df.empty:
+        revenue_totals = (
+            performance_df.groupby("date", as_index=False)["revenue"]
+            .sum()
+            .rename(columns={"revenue": "total_revenue"})
+        )
+
+    for record in metrics:
+        product = record.get("Product")
+        if not product:
+            continue
+        bundle.cost_summaries[product] = _calculate_cost_metrics(
+            record,
+            total_revenue,
+            variable_costs.get(product, 0.0),
+            cost_lookups.get(product, {}),
+            total_fixed_costs,
+        )
+        bundle.trends[product] = _prepare_cost_trend_dataframe(
+            performance_df, variable_df, fixed_totals, revenue_totals, product
+        )
+    return bundle
+
+
+def _mark_product_switch() -> None:
+    st.session_state[SWITCH_FLAG_KEY] = True
 
-    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-    st.caption("*Fixed costs allocated proportionally by revenue")
 
+def _get_product_bundle(connection: MetricsBackend) -> ProductBundle:
+    """Reuse the session bundle when the rerun came from the product selector."""
 
-def render() -> None:
+    switching = st.session_state.pop(SWITCH_FLAG_KEY, False)
+    bundle = st.session_state.get(BUNDLE_STATE_KEY)
+    if switching and bundle is not None:
+        return bundle
+    bundle = _load_product_bundle(connection)
+    st.session_state[BUNDLE_STATE_KEY] = bundle
+    return bundle
+
+
+def render(connection: Optional[MetricsBackend] = None) -> None:
     """Render the product performance page with selector and metrics."""
 
+    if connection is None:
+        connection = get_connection()
+
     render_page_header(
         "Product Performance",
         "Choose a product to review revenue, volume, and pricing metrics.",
+        connection=connection,
     )
 
-    connection = get_connection()
-    metrics = _load_product_metrics()
+    bundle = _get_product_bundle(connection)
+    metrics = bundle.metrics
     if not metrics:
         st.markdown(
             """
@@ -660,6 +782,17 @@ def render() -> None:
         )
         return
 
+    _render_product_detail(bundle)
+
+
+@isolated_fragment
+def _render_product_detail(bundle: ProductBundle) -> None:
+    """Selector plus every product-specific section, rerun on its own when switching."""
+
+    # The switch flag only matters for full reruns; a fragment rerun already
+    # renders from the bundle passed in.
+    st.session_state.pop(SWITCH_FLAG_KEY, None)
+    metrics = bundle.metrics
     available_products = [record.get("Product", "") for record in metrics if record.get("Product")]
     if not available_products:
         st.markdown(
@@ -670,7 +803,7 @@ def render() -> None:
         )
         return
 
-    total_revenue = sum(float(record.get("TotalRevenue") or 0.0) for record in metrics)
+    total_revenue = bundle.total_revenue
 
     preferred_default = "Goldenberries (Physalis)"
     default_product = (
@@ -686,13 +819,11 @@ def render() -> None:
         options=available_products,
         format_func=_get_display_name,
         key=selector_key,
+        on_change=_mark_product_switch,
         help="Select a product to update the metrics below.",
     )
 
-    selected_metrics = next(
-        (record for record in metrics if record.get("Product") == selected_product),
-        None,
-    )
+    selected_metrics = bundle.metrics_for(selected_product)
 
     if not selected_metrics:
         st.warning("No metrics were found for the selected product.")
@@ -709,7 +840,7 @@ def render() -> None:
 
     st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
 
-    performance_df = _load_monthly_performance(connection)
+    performance_df = bundle.performance_df
     st.markdown(
         """
         <div class='section-header'>
@@ -741,8 +872,8 @@ def render() -> None:
     _render_market_share(total_revenue, selected_metrics, display_name)
 
     st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
-    cost_summary = _calculate_cost_metrics(connection, selected_product, selected_metrics, total_revenue)
-    trend_df = _prepare_cost_trend_dataframe(connection, performance_df, selected_product)
+    cost_summary = bundle.cost_summary_for(selected_product)
+    trend_df = bundle.trend_for(selected_product)
 
     st.markdown(
         """
@@ -6,22 +6,37 @@ import calendar
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
 if __package__ in (None, ""):
     package_root = Path(__file__).resolve().parents[1]
     sys.path.insert(0, str(package_root.parent))
-    from dashboard_codex.database import get_connection
-    from dashboard_codex.pages.components import render_page_header
+    from dashboard_codex.database import MetricsBackend, get_connection
+    from dashboard_codex.pages.components import isolated_fragment, render_page_header
+    from dashboard_codex.pages.downsampling import downsample_lines, line_render_mode
+    from dashboard_codex.pages.figure_cache import cached_figure
+    from dashboard_codex.pages.frames import (
+        FrameAggregator,
+        member_mask,
+        period_index,
+        period_mask,
+        prepare_frame,
+        quarter_mask,
+    )
     from dashboard_codex.styles import COLORS
 else:  # pragma: no cover - executed in package context
-    from ..database import get_connection
+    from ..database import MetricsBackend, get_connection
     from ..styles import COLORS
-    from .components import render_page_header
+    from .components import isolated_fragment, render_page_header
+    from .downsampling import downsample_lines, line_render_mode
+    from .figure_cache import cached_figure
+    from .frames import FrameAggregator, member_mask, period_index, period_mask, prepare_frame, quarter_mask
 
 PRODUCT_LABELS: Dict[str, str] = {
     "Goldenberries (Physalis)": "Goldenberries",
@@ -65,16 +80,18 @@ class QuarterOption:
 
 
 
-def render() -> None:
+def render(connection: Optional[MetricsBackend] = None) -> None:
     """Render the Revenue Overview page."""
 
-    connection = get_connection()
+    if connection is None:
+        connection = get_connection()
     timeline_df = _load_timeline_dataframe(connection)
     quarter_df = _load_quarterly_dataframe(connection)
 
     render_page_header(
         "Revenue Overview",
         "Interactive filters highlight how revenue evolves across months and products.",
+        connection=connection,
     )
     _render_timeline_section(timeline_df)
 
@@ -82,19 +99,22 @@ def render() -> None:
     _render_quarterly_section(quarter_df)
 
 
-def _load_timeline_dataframe(connection) -> pd.DataFrame:
-    records = connection.get_revenue_timeseries()
-    if not records:
+def _load_timeline_dataframe(connection: MetricsBackend) -> pd.DataFrame:
+    df = connection.get_revenue_timeseries_frame()
+    if df.empty:
         return pd.DataFrame(columns=["product", "display_name", "date", "revenue"])
 
-    df = pd.DataFrame(records)
     df["date"] = pd.to_datetime(dict(year=df["year"].astype(int), month=df["month"].astype(int), day=1))
     df["display_name"] = df["product"].map(PRODUCT_LABELS).fillna(df["product"])
     df = df.sort_values("date").reset_index(drop=True)
-    return df[["product", "display_name", "date", "revenue"]]
+    return prepare_frame(
+        df[["product", "display_name", "date", "revenue"]],
+        ("product", "display_name"),
+        {"product": list(PRODUCT_LABELS)},
+    )
 
 
-def _load_quarterly_dataframe(connection) -> pd.DataFrame:
+def _load_quarterly_dataframe(connection: MetricsBackend) -> pd.DataFrame:
     records = connection.get_quarterly_revenue()
     if not records:
         return pd.DataFrame(columns=["product", "display_name", "year", "quarter", "revenue"])
@@ -102,21 +122,26 @@ def _load_quarterly_dataframe(connection) -> pd.DataFrame:
     df = pd.DataFrame(records)
     df["display_name"] = df["product"].map(PRODUCT_LABELS).fillna(df["product"])
     df = df.sort_values(["year", "quarter"]).reset_index(drop=True)
-    return df[["product", "display_name", "year", "quarter", "revenue"]]
+    return prepare_frame(
+        df[["product", "display_name", "year", "quarter", "revenue"]],
+        ("product", "display_name"),
+        {"product": list(PRODUCT_LABELS)},
+    )
 
 
 def _build_month_options(df: pd.DataFrame) -> List[MonthOption]:
-    unique = df[["date"]].drop_duplicates().sort_values("date")
-    return [MonthOption(row.date.year, row.date.month) for row in unique.itertuples()]  # type: ignore[attr-defined]
+    periods = np.unique(df["period"].to_numpy())
+    return [MonthOption(int(period // 12), int(period % 12) + 1) for period in periods]
 
 
 def _build_quarter_options(df: pd.DataFrame) -> List[QuarterOption]:
-    unique = df[["year", "quarter"]].drop_duplicates().sort_values(["year", "quarter"])
-    return [QuarterOption(int(row.year), int(row.quarter)) for row in unique.itertuples()]  # type: ignore[attr-defined]
+    quarters = np.unique(df["quarter_index"].to_numpy())
+    return [QuarterOption(int(index // 4), int(index % 4) + 1) for index in quarters]
 
 
 
 
+@isolated_fragment
 def _render_timeline_section(df: pd.DataFrame) -> None:
     st.markdown(
         """
@@ -191,14 +216,12 @@ def _render_timeline_section(df: pd.DataFrame) -> None:
         st.warning("The end month must be later than or equal to the start month.")
         return
 
-    start_date = pd.Timestamp(start_option.year, start_option.month, 1)
-    end_date = pd.Timestamp(end_option.year, end_option.month, 1)
-
-    filtered = df[
-        (df["date"] >= start_date)
-        & (df["date"] <= end_date)
-        & (df["product"].isin(selected_products))
-    ].copy()
+    mask = period_mask(
+        df,
+        period_index(start_option.year, start_option.month),
+        period_index(end_option.year, end_option.month),
+    ) & member_mask(df, "product", selected_products)
+    filtered = FrameAggregator(df[mask], "revenue")
 
     if filtered.empty:
         st.markdown(
@@ -207,11 +230,8 @@ def _render_timeline_section(df: pd.DataFrame) -> None:
         )
         return
 
-    filtered["label"] = filtered["date"].dt.strftime("%b %Y")
-    filtered["display_name"] = filtered["product"].map(PRODUCT_LABELS).fillna(filtered["product"])
-
-    summary_total = filtered["revenue"].sum()
-    month_count = filtered["date"].dt.to_period("M").nunique()
+    summary_total = filtered.total()
+    month_count = filtered.frame["period"].nunique()
     selection_caption = (
         f"{month_count} month{'s' if month_count != 1 else ''} selected &middot; "
         f"Total revenue <strong>${summary_total:,.0f}</strong>"
@@ -221,9 +241,7 @@ def _render_timeline_section(df: pd.DataFrame) -> None:
         unsafe_allow_html=True,
     )
 
-    chart_df = (
-        filtered.groupby(["date", "display_name"], as_index=False)["revenue"].sum().sort_values("date")
-    )
+    chart_df = downsample_lines(filtered.by("date", "display_name"), "date", "revenue", "display_name")
 
     fig = px.line(
         chart_df,
@@ -232,6 +250,7 @@ def _render_timeline_section(df: pd.DataFrame) -> None:
         color="display_name",
         color_discrete_map=PRODUCT_PALETTE,
         markers=True,
+        render_mode=line_render_mode(len(chart_df)),
     )
     fig.update_traces(mode="lines+markers", line=dict(width=3), marker=dict(size=7))
     fig.update_layout(
@@ -257,9 +276,7 @@ def _render_timeline_section(df: pd.DataFrame) -> None:
 
     st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
 
-    summary = (
-        filtered.groupby("display_name")["revenue"].sum().sort_values(ascending=False)
-    )
+    summary = filtered.totals_by("display_name")
     summary_rows = "".join(
         f"<div style='display:flex; justify-content:space-between; color:{COLORS['text_primary']};'>"
         f"<span>{name}</span><span>${value:,.0f}</span></div>"
@@ -278,6 +295,7 @@ def _render_timeline_section(df: pd.DataFrame) -> None:
     st.markdown(container_html, unsafe_allow_html=True)
 
 
+@isolated_fragment
 def _render_quarterly_section(df: pd.DataFrame) -> None:
     st.markdown(
         """
@@ -396,10 +414,8 @@ def _render_quarterly_section(df: pd.DataFrame) -> None:
         key=display_mode_key,
     )
 
-    filtered = df[
-        df["product"].isin(selected_products)
-        & df.apply(lambda row: (int(row["year"]), int(row["quarter"])) in selected_quarters, axis=1)
-    ].copy()
+    mask = member_mask(df, "product", selected_products) & quarter_mask(df, selected_quarters)
+    filtered = FrameAggregator(df[mask], "revenue")
 
     if filtered.empty:
         st.markdown(
@@ -408,15 +424,7 @@ def _render_quarterly_section(df: pd.DataFrame) -> None:
         )
         return
 
-    filtered["quarter_label"] = filtered.apply(
-        lambda row: f"Q{int(row['quarter'])} {int(row['year'])}", axis=1
-    )
-
-    quarter_order = (
-        filtered.sort_values(["year", "quarter"])["quarter_label"].drop_duplicates().tolist()
-    )
-
-    total_revenue = filtered["revenue"].sum()
+    total_revenue = filtered.total()
     summary_bar = (
         f"<div style=\"display:flex; flex-wrap:wrap; gap:12px; margin:12px 0; color:{COLORS['text_muted']}; font-size:0.9rem;\">"
         f"<span style=\"font-weight:600; color:{COLORS['text_primary']};\">{display_mode} mode</span>"
@@ -427,14 +435,38 @@ def _render_quarterly_section(df: pd.DataFrame) -> None:
     )
     st.markdown(summary_bar, unsafe_allow_html=True)
 
-    chart_df = (
-        filtered.groupby(["quarter_label", "display_name"], as_index=False)["revenue"].sum()
+    fig = cached_figure(
+        "revenue-quarterly-bars",
+        (df, sorted(selected_quarters), sorted(selected_products), display_mode),
+        lambda: _build_quarterly_chart(filtered, display_mode),
     )
-    chart_df["revenue_display"] = chart_df["revenue"].map(lambda value: f"${value:,.0f}")
+    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+
+    summary = filtered.totals_by("display_name")
+    summary_rows = "".join(
+        f"<div style='display:flex; justify-content:space-between; color:{COLORS['text_primary']};'>"
+        f"<span>{name}</span><span>${value:,.0f}</span></div>"
+        for name, value in summary.items()
+    )
+    empty_summary_html = summary_rows or (
+        f"<span style=\"color:{COLORS['text_muted']};\">No revenue values available.</span>"
+    )
+    container_html = (
+        f"<div style=\"background-color:{COLORS['surface']}; border:1px solid {COLORS['border']}; "
+        f"border-radius:12px; padding:16px; margin-top:12px;\">"
+        f"<p style=\"margin:0 0 8px 0; color:{COLORS['text_muted']}; font-size:0.85rem;\">Revenue by product</p>"
+        f"{empty_summary_html}"
+        "</div>"
+    )
+    st.markdown(container_html, unsafe_allow_html=True)
+
+
+def _build_quarterly_chart(filtered: FrameAggregator, display_mode: str) -> go.Figure:
+    quarter_totals = filtered.by("quarter_index", "quarter_label", "display_name")
+    quarter_order = quarter_totals["quarter_label"].drop_duplicates().tolist()
 
-    quarter_position = {label: idx for idx, label in enumerate(quarter_order)}
-    chart_df["quarter_index"] = chart_df["quarter_label"].map(quarter_position)
-    chart_df = chart_df.sort_values(["quarter_index", "display_name"]).drop(columns=["quarter_index"])
+    chart_df = quarter_totals.drop(columns=["quarter_index"])
+    chart_df["revenue_display"] = chart_df["revenue"].map(lambda value: f"${value:,.0f}")
 
     color_map = {
         name: PRODUCT_PALETTE.get(name, COLORS["primary"])
@@ -474,28 +506,7 @@ def _render_quarterly_section(df: pd.DataFrame) -> None:
 
     fig.update_xaxes(title="", showgrid=True, gridcolor=COLORS["border"], tickangle=-15)
     fig.update_yaxes(title="Revenue (USD)", showgrid=True, gridcolor=COLORS["border"], zeroline=False)
-
-    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-
-    summary = (
-        filtered.groupby("display_name")["revenue"].sum().sort_values(ascending=False)
-    )
-    summary_rows = "".join(
-        f"<div style='display:flex; justify-content:space-between; color:{COLORS['text_primary']};'>"
-        f"<span>{name}</span><span>${value:,.0f}</span></div>"
-        for name, value in summary.items()
-    )
-    empty_summary_html = summary_rows or (
-        f"<span style=\"color:{COLORS['text_muted']};\">No revenue values available.</span>"
-    )
-    container_html = (
-        f"<div style=\"background-color:{COLORS['surface']}; border:1px solid {COLORS['border']}; "
-        f"border-radius:12px; padding:16px; margin-top:12px;\">"
-        f"<p style=\"margin:0 0 8px 0; color:{COLORS['text_muted']}; font-size:0.85rem;\">Revenue by product</p>"
-        f"{empty_summary_html}"
-        "</div>"
-    )
-    st.markdown(container_html, unsafe_allow_html=True)
+    return fig
 
 
 
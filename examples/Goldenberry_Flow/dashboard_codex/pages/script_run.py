@@ -0,0 +1,46 @@
+"""
+Per-session script-run tokens for cancelling abandoned queries.
+Streamlit starts a new run as soon as a widget changes, while the previous
+run may still be blocked on Neo4j; its reads are killed when the next run
+of the same session begins.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import uuid
+from pathlib import Path
+
+import streamlit as st
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import MetricsBackend
+else:  # pragma: no cover - executed in package context
+    from ..database import MetricsBackend
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+RUN_TOKEN_STATE_KEY = "script-run-token"
+
+
+def begin_script_run(connection: MetricsBackend) -> str:
+    """Cancel this session's previous run's reads and return a token for this run.
+
+    Wrap the run in ``run_scope(token)`` so its reads are tagged. A previous
+    run that completed normally has nothing in flight, so this is a no-op.
+    """
+
+    previous = st.session_state.get(RUN_TOKEN_STATE_KEY)
+    token = uuid.uuid4().hex
+    st.session_state[RUN_TOKEN_STATE_KEY] = token
+    cancel_run = getattr(connection, "cancel_run", None)
+    if previous and connection.connected and cancel_run is not None:
+        cancel_run(previous)
+    return token
+
+
+__all__ = ["begin_script_run"]
@@ -0,0 +1,506 @@
+"""
+Offline fixtures: a small Goldenberry fact graph served by a fake Neo4j driver.
+
+The fake driver answers the statements the DuckDB mirror and the
+connection's bookkeeping send to Neo4j (connection test, DataVersion,
+period catalog, mirror sync). With ``answers_reads`` set it also answers
+every mirrored metric read by walking the fixture rows the way the
+statement's Cypher pattern does, so the parity test can compare the
+mirror against Cypher without a Neo4j server. Any other Cypher fails the
+test, so reads that should come from the mirror cannot silently reach the
+graph.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytest.importorskip("neo4j")
+
+from dashboard_codex.config import CACHE_SETTINGS  # noqa: E402
+from dashboard_codex.database import connection as connection_module  # noqa: E402
+from dashboard_codex.database.data_version import READ_VERSIONS_QUERY  # noqa: E402
+
+PERIODS = [
+    {"id": "tp_2024_01", "year": 2024, "month": 1, "quarter": "Q1", "closed": True, "closed_version": 1},
+    {"id": "tp_2024_02", "year": 2024, "month": 2, "quarter": "Q1", "closed": True, "closed_version": 1},
+    {"id": "tp_2024_04", "year": 2024, "month": 4, "quarter": "Q2", "closed": False, "closed_version": 0},
+]
+PRODUCTS = [{"id": "prod_alpha", "name": "Alpha"}, {"id": "prod_beta", "name": "Beta"}]
+COST_STRUCTURES = [{"id": "cs_packaging", "name": "Packaging"}, {"id": "cs_facilities", "name": "Facilities"}]
+# rs_export sells both products, so stream and product joins give different totals.
+STREAM_PRODUCTS = [
+    {"revenue_stream_id": "rs_export", "product_id": "prod_alpha"},
+    {"revenue_stream_id": "rs_export", "product_id": "prod_beta"},
+]
+
+
+def _revenue_facts() -> Dict[str, List[Dict[str, Any]]]:
+    volumes, prices = [], []
+    for index, period in enumerate(PERIODS):
+        for offset, product in enumerate(PRODUCTS):
+            suffix = f"{product['id']}_{period['id']}"
+            base = {"period_id": period["id"], "product_id": product["id"], "revenue_stream_id": "rs_export"}
+            volumes.append({"id": f"vd_{suffix}", "volume": 100.0 + 10 * index + 5 * offset, **base})
+            prices.append({"id": f"pd_{suffix}", "price": 4.0 + index + 0.5 * offset, **base})
+    return {"volume_data": volumes, "price_data": prices}
+
+
+def _cost_facts() -> List[Dict[str, Any]]:
+    facts = []
+    for index, period in enumerate(PERIODS):
+        for offset, product in enumerate(PRODUCTS):
+            facts.append(
+                {
+                    "id": f"cd_var_{product['id']}_{period['id']}",
+                    "amount": 80.0 + 7 * index + 3 * offset,
+                    "cost_behavior": "variable",
+                    "unit": "EUR",
+                    "description": "Packaging",
+                    "period_id": period["id"],
+                    "product_id": product["id"],
+                    "structure_id": "cs_packaging",
+                }
+            )
+        facts.append(
+            {
+                "id": f"cd_fix_{period['id']}",
+                "amount": 500.0 + 25 * index,
+                "cost_behavior": "fixed",
+                "unit": "EUR",
+                "description": "Rent",
+                "period_id": period["id"],
+                "product_id": None,
+                "structure_id": "cs_facilities",
+            }
+        )
+    return facts
+
+
+def _sum_by(rows, key: Callable[[Any], Any], value: Callable[[Any], Any]) -> Dict[Any, Any]:
+    """Cypher ``SUM`` per grouping key: nulls are skipped and an all-null group sums to 0."""
+
+    totals: Dict[Any, Any] = {}
+    for row in rows:
+        group, amount = key(row), value(row)
+        totals[group] = totals.get(group, 0) + (amount if amount is not None else 0)
+    return totals
+
+
+class _CypherReads:
+    """The mirrored Cypher reads evaluated over a ``FixtureGraph``, keyed by method."""
+
+    def __init__(self, graph: "FixtureGraph", parameters: Dict[str, Any]) -> None:
+        self.parameters = parameters
+        self.periods = {row["id"]: row for row in graph.periods}
+        self.products = {row["id"]: row for row in graph.products}
+        self.structures = {row["id"]: row for row in graph.cost_structures}
+        self.volumes = graph.facts["volume_data"]
+        self.prices = graph.facts["price_data"]
+        self.costs = graph.facts["cost_data"]
+
+    def _pairs(self, key: str) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]:
+        """(volume, price, period) matched on ``key`` and period, like a two-path MATCH."""
+
+        for volume in self.volumes:
+            period = self.periods.get(volume["period_id"])
+            if period is None or volume[key] is None:
+                continue
+            for price in self.prices:
+                if price[key] == volume[key] and price["period_id"] == volume["period_id"]:
+                    yield volume, price, period
+
+    def _stream_pairs(self):
+        return self._pairs("revenue_stream_id")
+
+    def _product_pairs(self):
+        for volume, price, period in self._pairs("product_id"):
+            if volume["product_id"] in self.products:
+                yield self.products[volume["product_id"]], volume, price, period
+
+    def _in_window(self, period: Dict[str, Any]) -> bool:
+        period_ids = self.parameters.get("period_ids")
+        return (period_ids is None or period["id"] in period_ids) and period["id"] not in self.parameters.get(
+            "excluded_period_ids", []
+        )
+
+    def _cost_lines(self):
+        """(cost, period, structure, product or None) after the ``$product``/``$category`` filters."""
+
+        product_name, category = self.parameters.get("product"), self.parameters.get("category")
+        for cost in self.costs:
+            period, structure = self.periods.get(cost["period_id"]), self.structures.get(cost["structure_id"])
+            if period is None or structure is None:
+                continue
+            product = self.products.get(cost["product_id"])
+            if product_name is not None and (product is None or product["name"] != product_name):
+                continue
+            if category is not None and structure["name"] != category:
+                continue
+            yield cost, period, structure, product
+
+    def _structure_name(self, cost: Dict[str, Any]) -> Optional[str]:
+        structure = self.structures.get(cost["structure_id"])
+        return structure["name"] if structure else None
+
+    def _product_costs(self, behavior: Optional[str] = None):
+        for cost in self.costs:
+            product = self.products.get(cost["product_id"])
+            if product is not None and behavior in (None, cost["cost_behavior"]):
+                yield cost, product
+
+    def get_product_count(self):
+        return [{"product_count": len(self.products)}]
+
+    def get_total_revenue(self):
+        return [{"totalRevenue": sum(v["volume"] * p["price"] for v, p, _ in self._stream_pairs())}]
+
+    def get_total_volume(self):
+        return [{"totalVolume": sum(row["volume"] for row in self.volumes)}]
+
+    def get_average_monthly_revenue(self):
+        monthly = _sum_by(
+            self._stream_pairs(), lambda pair: pair[2]["id"], lambda pair: pair[0]["volume"] * pair[1]["price"]
+        )
+        return [{"avgMonthlyRevenue": sum(monthly.values()) / len(monthly) if monthly else None}]
+
+    def get_average_price_per_kg(self):
+        pairs = list(self._stream_pairs())
+        volume = sum(v["volume"] for v, _, _ in pairs)
+        return [{"avgPricePerKg": sum(v["volume"] * p["price"] for v, p, _ in pairs) / volume}]
+
+    def get_total_costs(self):
+        return [{"totalCosts": sum(row["amount"] for row in self.costs)}]
+
+    def get_variable_costs(self):
+        return [{"variableCosts": sum(cost["amount"] for cost, _ in self._product_costs())}]
+
+    def get_fixed_costs(self):
+        return [{"fixedCosts": sum(row["amount"] for row in self.costs if row["product_id"] not in self.products)}]
+
+    def _cost_series(self, period_key: str, period_column: str):
+        totals = _sum_by(
+            self._cost_lines(),
+            lambda line: (line[3]["name"] if line[3] else None, line[2]["name"], line[1]["year"], line[1][period_key]),
+            lambda line: line[0]["amount"],
+        )
+        return [
+            {"product": product, "category": category, "year": year, period_column: period, "cost": cost}
+            for (product, category, year, period), cost in totals.items()
+        ]
+
+    def get_cost_timeseries(self):
+        return self._cost_series("month", "month")
+
+    def get_quarterly_costs(self):
+        return self._cost_series("quarter", "quarter")
+
+    def get_cost_categories(self):
+        names = {self._structure_name(row) for row in self.costs} - {None}
+        return [{"name": name} for name in sorted(names)]
+
+    def iter_cost_line_items(self):
+        return [
+            {
+                "id": cost["id"],
+                "period_id": period["id"],
+                "year": period["year"],
+                "month": period["month"],
+                "category": structure["name"],
+                "product": product["name"] if product else None,
+                "behavior": cost["cost_behavior"],
+                "amount": cost["amount"],
+                "unit": cost["unit"],
+                "description": cost["description"],
+            }
+            for cost, period, structure, product in self._cost_lines()
+        ]
+
+    def get_product_costs(self):
+        rows = []
+        for product in self.products.values():
+            if product["name"] != self.parameters["product_name"]:
+                continue
+            costs = [cost for cost in self.costs if cost["product_id"] == product["id"]]
+            rows.extend(costs or [{"amount": None, "structure_id": None}])  # OPTIONAL MATCH keeps the product
+        if not rows:
+            return []
+        totals = _sum_by(rows, self._structure_name, lambda cost: cost["amount"])
+        return [{"category": category, "totalCost": total} for category, total in totals.items()]
+
+    def get_product_cost_breakdown(self):
+        totals = _sum_by(
+            self._product_costs(),
+            lambda pair: (pair[1]["name"], self._structure_name(pair[0]), pair[0]["cost_behavior"]),
+            lambda pair: pair[0]["amount"],
+        )
+        return [
+            {"product": product, "category": category, "behavior": behavior, "totalCost": total}
+            for (product, category, behavior), total in totals.items()
+        ]
+
+    def get_product_variable_cost(self):
+        name = self.parameters["product_name"]
+        return [
+            {
+                "variableCost": sum(
+                    cost["amount"] for cost, product in self._product_costs("variable") if product["name"] == name
+                )
+            }
+        ]
+
+    def get_product_variable_costs(self):
+        totals = _sum_by(self._product_costs("variable"), lambda pair: pair[1]["name"], lambda pair: pair[0]["amount"])
+        return [{"product": product, "variableCost": total} for product, total in totals.items()]
+
+    def get_average_cost_per_kg(self):
+        pairs = [
+            (cost, volume)
+            for cost, _ in self._product_costs()
+            if cost["period_id"] in self.periods
+            for volume in self.volumes
+            if volume["product_id"] == cost["product_id"] and volume["period_id"] == cost["period_id"]
+        ]
+        total_volume = sum(volume["volume"] for _, volume in pairs)
+        total_costs = sum(cost["amount"] for cost, _ in pairs)
+        return [{"avgCostPerKg": 0 if total_volume == 0 else total_costs / total_volume}]
+
+    def _period_costs(self, behavior: str):
+        for cost in self.costs:
+            period = self.periods.get(cost["period_id"])
+            if cost["cost_behavior"] == behavior and period is not None and self._in_window(period):
+                yield cost, period
+
+    def get_variable_cost_timeseries_frame(self):
+        totals = _sum_by(
+            ((cost, period) for cost, period in self._period_costs("variable") if cost["product_id"] in self.products),
+            lambda pair: (
+                self.products[pair[0]["product_id"]]["name"], pair[1]["id"], pair[1]["year"], pair[1]["month"]
+            ),
+            lambda pair: pair[0]["amount"],
+        )
+        return [
+            {"product": product, "period_id": period_id, "year": year, "month": month, "cost": cost}
+            for (product, period_id, year, month), cost in totals.items()
+        ]
+
+    def get_fixed_cost_timeseries_frame(self):
+        totals = _sum_by(
+            ((cost, period) for cost, period in self._period_costs("fixed") if cost["structure_id"] in self.structures),
+            lambda pair: (self._structure_name(pair[0]), pair[1]["id"], pair[1]["year"], pair[1]["month"]),
+            lambda pair: pair[0]["amount"],
+        )
+        return [
+            {"category": category, "period_id": period_id, "year": year, "month": month, "cost": cost}
+            for (category, period_id, year, month), cost in totals.items()
+        ]
+
+    def get_cost_totals_by_behavior(self):
+        totals = _sum_by(self.costs, lambda cost: cost["cost_behavior"], lambda cost: cost["amount"])
+        return [{"behavior": behavior, "total": total} for behavior, total in totals.items()]
+
+    def get_cost_totals_by_category(self):
+        def behavior(cost):
+            linked = cost["product_id"] in self.products
+            return "variable" if linked or cost["cost_behavior"] == "variable" else "fixed"
+
+        totals = _sum_by(
+            (cost for cost in self.costs if cost["structure_id"] in self.structures),
+            lambda cost: (self._structure_name(cost), behavior(cost)),
+            lambda cost: cost["amount"],
+        )
+        return [
+            {"category": category, "totalCost": total, "behavior": kind} for (category, kind), total in totals.items()
+        ]
+
+    def get_product_metrics(self):
+        pairs = list(self._product_pairs())
+        rows = []
+        for product in self.products.values():
+            matched = [(volume, price) for owner, volume, price, _ in pairs if owner is product]
+            revenue = sum(volume["volume"] * price["price"] for volume, price in matched)
+            volume_total = sum(volume["volume"] for volume, _ in matched)
+            rows.append(
+                {
+                    "Product": product["name"],
+                    "TotalRevenue": revenue,
+                    "TotalVolume": volume_total,
+                    "AvgPrice": None if volume_total == 0 else revenue / volume_total,
+                }
+            )
+        return rows
+
+    def get_product_monthly_performance_frame(self):
+        pairs = [pair for pair in self._product_pairs() if self._in_window(pair[3])]
+        key = lambda pair: (pair[0]["name"], pair[3]["id"], pair[3]["year"], pair[3]["month"])  # noqa: E731
+        revenue = _sum_by(pairs, key, lambda pair: pair[2]["price"] * pair[1]["volume"])
+        volume = _sum_by(pairs, key, lambda pair: pair[1]["volume"])
+        columns = ("Product", "PeriodId", "Year", "Month")
+        return [
+            {**dict(zip(columns, group)), "MonthlyRevenue": revenue[group], "MonthlyVolume": volume[group]}
+            for group in revenue
+        ]
+
+    def get_revenue_timeseries_frame(self):
+        return [
+            {key: row[key] for key in ("Product", "PeriodId", "Year", "Month", "MonthlyRevenue")}
+            for row in self.get_product_monthly_performance_frame()
+        ]
+
+    def get_quarterly_revenue(self):
+        totals = _sum_by(
+            self._product_pairs(),
+            lambda pair: (pair[0]["name"], pair[3]["year"], pair[3]["quarter"]),
+            lambda pair: pair[2]["price"] * pair[1]["volume"],
+        )
+        return [
+            {"Product": product, "Year": year, "Quarter": quarter, "QuarterlyRevenue": total}
+            for (product, year, quarter), total in totals.items()
+        ]
+
+
+class FixtureGraph:
+    """The fact graph as plain rows plus DataVersion counters."""
+
+    def __init__(self, versions: Optional[Dict[str, Optional[int]]] = None) -> None:
+        self.periods = [dict(period) for period in PERIODS]
+        self.products = [dict(product) for product in PRODUCTS]
+        self.cost_structures = [dict(structure) for structure in COST_STRUCTURES]
+        self.stream_products = [dict(row) for row in STREAM_PRODUCTS]
+        self.facts = {**_revenue_facts(), "cost_data": _cost_facts()}
+        self.versions: Dict[str, Optional[int]] = dict(versions or {"revenue": 1, "cost": 1, "model": 1})
+        self.queries: List[str] = []
+        self.answers_reads = False
+
+    def run(self, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        from dashboard_codex.database.analytical_mirror import (
+            DIMENSION_QUERIES,
+            FACT_SOURCES,
+            _fact_query,
+            mirrored_statements,
+        )
+
+        text = " ".join(str(query).split())
+        self.queries.append(text)
+        if text == "RETURN 1 as ok":
+            return [{"ok": 1}]
+        if text == " ".join(READ_VERSIONS_QUERY.split()):
+            return [
+                {"domain": domain, "version": version}
+                for domain, version in self.versions.items()
+                if domain in parameters["domains"] and version is not None
+            ]
+        if text.startswith("MATCH (tp:TimePeriod) RETURN tp.id AS id") and "ORDER BY year, month" in text:
+            return [dict(period) for period in self.periods]  # get_period_catalog()
+        dimensions = {
+            "time_period": self.periods,
+            "product": self.products,
+            "cost_structure": self.cost_structures,
+            "revenue_stream_product": self.stream_products,
+        }
+        for table, dimension_query in DIMENSION_QUERIES.items():
+            if text == " ".join(dimension_query.split()):
+                return [dict(row) for row in dimensions[table]]
+        for table, (_, label, relationship, returns) in FACT_SOURCES.items():
+            if text == " ".join(_fact_query(label, relationship, returns, False).split()):
+                wanted = set(parameters["period_ids"])
+                return [dict(row) for row in self.facts[table] if row["period_id"] in wanted]
+            if text == " ".join(_fact_query(label, relationship, returns, True).split()):
+                return []
+        read = mirrored_statements().get(text)
+        if read is not None and self.answers_reads:
+            return getattr(_CypherReads(self, parameters), read)()
+        raise AssertionError(f"Unexpected Cypher sent to the fixture graph: {text}")
+
+
+class _Record:
+    def __init__(self, row: Dict[str, Any]) -> None:
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        return self._row[key]
+
+    def data(self) -> Dict[str, Any]:
+        return dict(self._row)
+
+    def values(self) -> List[Any]:
+        return list(self._row.values())
+
+
+class _Result:
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self._rows = rows
+
+    def __iter__(self):
+        return (_Record(row) for row in self._rows)
+
+    def keys(self) -> List[str]:
+        return list(self._rows[0]) if self._rows else []
+
+    def single(self) -> Optional[_Record]:
+        return _Record(self._rows[0]) if self._rows else None
+
+
+class _Session:
+    def __init__(self, graph: FixtureGraph) -> None:
+        self._graph = graph
+
+    def __enter__(self) -> "_Session":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def run(self, query: Any, parameters: Optional[Dict[str, Any]] = None) -> _Result:
+        return _Result(self._graph.run(getattr(query, "text", query), parameters or {}))
+
+
+class _Driver:
+    def __init__(self, graph: FixtureGraph) -> None:
+        self._graph = graph
+
+    def session(self, **_: Any) -> _Session:
+        return _Session(self._graph)
+
+    def close(self) -> None:
+        return None
+
+
+@pytest.fixture
+def fixture_graph() -> FixtureGraph:
+    return FixtureGraph()
+
+
+@pytest.fixture
+def fake_neo4j(monkeypatch, tmp_path, fixture_graph):
+    """Point ``Neo4jConnection`` at ``fixture_graph`` with caches under ``tmp_path``."""
+
+    class _GraphDatabase:
+        @staticmethod
+        def driver(*_: Any, **__: Any) -> _Driver:
+            return _Driver(fixture_graph)
+
+    monkeypatch.setattr(connection_module, "GraphDatabase", _GraphDatabase)
+    monkeypatch.setitem(CACHE_SETTINGS, "closed_period_dir", str(tmp_path / "closed_periods"))
+    monkeypatch.setitem(CACHE_SETTINGS, "shared_cache", "none")
+    monkeypatch.setitem(CACHE_SETTINGS, "version_poll_seconds", 0.0)
+    return fixture_graph
+
+
+@pytest.fixture
+def mirror_connection(fake_neo4j, tmp_path):
+    """A live-mode ``MirrorConnection`` over ``fake_neo4j`` with its DuckDB file in ``tmp_path``."""
+
+    pytest.importorskip("duckdb")
+    from dashboard_codex.database.analytical_mirror import MirrorConnection
+
+    connection = MirrorConnection(read_mode="live", path=tmp_path / "analytics.duckdb")
+    assert connection.connected and connection.mirror is not None
+    yield connection
+    connection.close()
@@ -0,0 +1,52 @@
+"""MirrorConnection routing: only mirrored statements are answered with SQL."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from dashboard_codex.database.period_cache import ClosedPeriodCache  # noqa: E402
+
+
+def _expected_monthly_revenue(graph):
+    prices = {(row["product_id"], row["period_id"]): row["price"] for row in graph.facts["price_data"]}
+    names = {product["id"]: product["name"] for product in graph.products}
+    return {
+        (names[row["product_id"]], row["period_id"]): row["volume"] * prices[(row["product_id"], row["period_id"])]
+        for row in graph.facts["volume_data"]
+    }
+
+
+def test_frame_read_with_period_cache_keeps_nested_reads_on_neo4j(mirror_connection, fake_neo4j, tmp_path):
+    mirror_connection.period_cache = ClosedPeriodCache(tmp_path / "closed_periods", "fixture")
+
+    frame = mirror_connection.get_revenue_timeseries_frame()
+
+    expected = _expected_monthly_revenue(fake_neo4j)
+    assert len(frame) == len(expected)
+    assert {(row["product"], row["period_id"]): row["revenue"] for row in frame.to_dict("records")} == pytest.approx(
+        expected
+    )
+    # The nested catalog read went to Neo4j and was cached with its own rows.
+    catalog = mirror_connection.get_period_catalog()
+    assert [row["id"] for row in catalog] == [period["id"] for period in fake_neo4j.periods]
+    assert any(text.startswith("MATCH (tp:TimePeriod) RETURN tp.id AS id") for text in fake_neo4j.queries)
+    # Closed periods were written to the on-disk cache under their real ids.
+    closed = [period["id"] for period in fake_neo4j.periods if period["closed"]]
+    cached = mirror_connection.period_cache.load("revenue_timeseries", "live", {period_id: 1 for period_id in closed})
+    assert sorted(cached) == closed
+
+    quarterly = mirror_connection.get_quarterly_revenue()
+    totals = {}
+    for (product, period_id), revenue in expected.items():
+        quarter = 1 if period_id in ("tp_2024_01", "tp_2024_02") else 2
+        totals[(product, quarter)] = totals.get((product, quarter), 0.0) + revenue
+    assert {(row["product"], row["quarter"]): row["revenue"] for row in quarterly} == pytest.approx(totals)
+
+
+def test_unmirrored_statements_go_to_neo4j(mirror_connection, fake_neo4j):
+    assert mirror_connection.get_data_versions() == fake_neo4j.versions
+    assert mirror_connection.get_product_count() == len(fake_neo4j.products)
+    # get_product_count is answered by the mirror, so no Product scan reached the graph.
+    assert not any("count(p) AS product_count" in text for text in fake_neo4j.queries)
@@ -0,0 +1,57 @@
+"""Cost-to-serve allocation keeps every euro at every level."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from dashboard_codex.database.cost_propagation import LEVEL_JOB, LEVEL_SEGMENT, propagate_costs
+
+STRUCTURE_COSTS = [
+    {"structure": "cs_ops", "period": "tp_2024_01", "year": 2024, "month": 1, "amount": 120.0},
+    {"structure": "cs_ops", "period": "tp_2024_02", "year": 2024, "month": 2, "amount": 60.0},
+    {"structure": "cs_ads", "period": "tp_2024_01", "year": 2024, "month": 1, "amount": 40.0},
+]
+
+
+def _edge(start_label, start, kind, end_label, end):
+    return {"start_label": start_label, "start": start, "type": kind, "end_label": end_label, "end": end}
+
+
+EDGES = [
+    _edge("KeyActivity", "ka_pack", "INCURS_COST", "CostStructure", "cs_ops"),
+    _edge("Channel", "ch_web", "INCURS_COST", "CostStructure", "cs_ads"),
+    _edge("ValueProposition", "vp_fresh", "REQUIRES_ACTIVITY", "KeyActivity", "ka_pack"),
+    _edge("ValueProposition", "vp_fresh", "TARGETS", "CustomerSegment", "seg_retail"),
+    _edge("ValueProposition", "vp_fresh", "TARGETS", "CustomerSegment", "seg_horeca"),
+    _edge("CustomerSegment", "seg_retail", "REACHES_THROUGH", "Channel", "ch_web"),
+    # seg_horeca has no DEFINED_BY_JOB, so its share stops at the segment level.
+    _edge("CustomerSegment", "seg_retail", "DEFINED_BY_JOB", "JobToBeDone", "job_snack"),
+]
+
+
+def test_segment_without_job_is_kept_as_unallocated():
+    result = propagate_costs(STRUCTURE_COSTS, EDGES)
+
+    horeca = result.frame(LEVEL_SEGMENT).loc["seg_horeca", result.periods].to_numpy()
+    assert result.unallocated["segment without job"] == pytest.approx(horeca)
+    assert result.frame(LEVEL_JOB)["total"].sum() == pytest.approx(180.0 + 40.0 - horeca.sum())
+    assert result.unreconciled_levels() == []
+    assert result.reconciles()
+
+
+def test_reconciles_checks_every_level():
+    result = propagate_costs(STRUCTURE_COSTS, EDGES)
+    result.costs[LEVEL_JOB] = np.zeros_like(result.costs[LEVEL_JOB])
+
+    assert result.unreconciled_levels() == [LEVEL_JOB]
+    assert not result.reconciles()
+
+
+def test_edges_without_ids_are_ignored():
+    result = propagate_costs(
+        STRUCTURE_COSTS, EDGES + [_edge("CustomerSegment", None, "DEFINED_BY_JOB", "JobToBeDone", "job_snack")]
+    )
+
+    assert None not in result.ids[LEVEL_SEGMENT]
+    assert result.reconciles()
@@ -0,0 +1,57 @@
+"""Closed-period entries survive open-month writes and are replaced when a period is closed again."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from dashboard_codex.database.period_cache import ClosedPeriodCache  # noqa: E402
+
+
+@pytest.fixture
+def period_cache(mirror_connection, tmp_path):
+    mirror_connection.period_cache = ClosedPeriodCache(tmp_path / "closed_periods", "fixture")
+    return mirror_connection.period_cache
+
+
+def _snapshot(cache):
+    return {path.relative_to(cache.root): path.stat().st_mtime_ns for path in cache.root.rglob("*.json")}
+
+
+def test_revenue_bump_on_open_period_keeps_closed_period_files(mirror_connection, fixture_graph, period_cache):
+    mirror_connection.get_revenue_timeseries_frame()
+    before = _snapshot(period_cache)
+    assert len(before) == 2
+
+    open_period = next(period["id"] for period in fixture_graph.periods if not period["closed"])
+    for row in fixture_graph.facts["volume_data"]:
+        if row["period_id"] == open_period:
+            row["volume"] += 50.0
+    fixture_graph.versions["revenue"] += 1
+
+    frame = mirror_connection.get_revenue_timeseries_frame()
+
+    assert _snapshot(period_cache) == before
+    volumes = {(row["product_id"], row["period_id"]): row["volume"] for row in fixture_graph.facts["volume_data"]}
+    prices = {(row["product_id"], row["period_id"]): row["price"] for row in fixture_graph.facts["price_data"]}
+    open_rows = frame[frame["period_id"] == open_period]
+    assert open_rows["revenue"].sum() == pytest.approx(
+        sum(volumes[key] * prices[key] for key in volumes if key[1] == open_period)
+    )
+
+
+def test_closing_a_period_again_replaces_only_its_entry(mirror_connection, fixture_graph, period_cache):
+    mirror_connection.get_revenue_timeseries_frame()
+    before = _snapshot(period_cache)
+
+    corrected = fixture_graph.periods[0]
+    corrected["closed_version"] += 1
+    fixture_graph.versions["revenue"] += 1  # close_periods() bumps the domains with closedVersion
+    mirror_connection.get_revenue_timeseries_frame()
+
+    after = _snapshot(period_cache)
+    names = sorted(path.name for path in after)
+    assert names == [f"{corrected['id']}.v2.json", f"{fixture_graph.periods[1]['id']}.v1.json"]
+    untouched = next(path for path in after if path.name.startswith(fixture_graph.periods[1]["id"]))
+    assert after[untouched] == before[untouched]
@@ -0,0 +1,30 @@
+"""The batched per-product variable cost follows the read mode like the single-product read."""
+
+from __future__ import annotations
+
+import pytest
+
+from dashboard_codex.database.connection import Neo4jConnection
+
+
+@pytest.mark.parametrize("read_mode, source", [("live", "CostData"), ("materialized", "MonthlyFact")])
+def test_batched_variable_costs_use_the_read_mode(monkeypatch, fake_neo4j, read_mode, source):
+    connection = Neo4jConnection(read_mode=read_mode)
+    graph_query = connection.execute_query
+    queries = []
+
+    def execute_query(query, parameters=None):
+        if "DataVersion" in query:
+            return graph_query(query, parameters)
+        queries.append(query)
+        if parameters and "product_name" in parameters:
+            return [{"variableCost": {"Alpha": 120.0, "Beta": 80.0}[parameters["product_name"]]}]
+        return [{"product": "Alpha", "variableCost": 120.0}, {"product": "Beta", "variableCost": 80.0}]
+
+    monkeypatch.setattr(connection, "execute_query", execute_query)
+
+    batched = connection.get_product_variable_costs()
+
+    assert source in queries[-1]
+    assert batched == {name: connection.get_product_variable_cost(name) for name in ("Alpha", "Beta")}
+    assert all(source in query for query in queries)
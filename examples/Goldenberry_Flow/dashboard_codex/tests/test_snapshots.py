@@ -0,0 +1,41 @@
+"""In-memory model snapshots are built once per DataVersion stamp and shared."""
+
+from __future__ import annotations
+
+import pytest
+
+from dashboard_codex.database import cost_propagation, model_graph
+from dashboard_codex.database.connection import Neo4jConnection
+
+
+@pytest.fixture
+def connection(fake_neo4j):
+    connection = Neo4jConnection(read_mode="live")
+    assert connection.connected
+    yield connection
+    connection.close()
+
+
+@pytest.mark.parametrize(
+    "module, loader, method, domain",
+    [
+        (model_graph, "load_model_graph", "get_model_graph", "revenue"),
+        (cost_propagation, "load_cost_to_serve", "get_cost_to_serve", "cost"),
+    ],
+)
+def test_snapshot_is_shared_until_its_version_moves(monkeypatch, connection, fake_neo4j, module, loader, method, domain):
+    built = []
+    monkeypatch.setattr(module, loader, lambda _: built.append(object()) or built[-1])
+
+    first = getattr(connection, method)()
+    assert getattr(connection, method)() is first
+    assert len(built) == 1
+
+    fake_neo4j.versions[domain] += 1
+    second = getattr(connection, method)()
+    assert second is not first and getattr(connection, method)() is second
+    assert len(built) == 2
+
+    # Graphs without DataVersion nodes give no way to tell, so every call rebuilds.
+    fake_neo4j.versions["model"] = None
+    assert getattr(connection, method)() is not getattr(connection, method)()
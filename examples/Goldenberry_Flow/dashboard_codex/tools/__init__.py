@@ -0,0 +1 @@
+"""Command-line tooling (benchmarks, loaders, analysers) for the Codex dashboard."""
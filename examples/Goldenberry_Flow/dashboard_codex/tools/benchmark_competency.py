@@ -0,0 +1,347 @@
+"""
+Acceptance benchmark for the knowledge graph's competency questions.
+
+Parses every query block of ``validation_queries.cypher`` (named after its
+``// 12. ...`` / ``-- Query 22: ...`` / ``// Query 29 Part B: ...`` header)
+and any fenced ``cypher`` block placed under a question in
+``competency_questions.md``. Each query is profiled once for db hits and
+then timed; result rows, row count, db hits and median latency are compared
+with a golden file and written to a regression report.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.benchmark_competency --list
+    python -m dashboard_codex.tools.benchmark_competency --record      # accept the current results
+    python -m dashboard_codex.tools.benchmark_competency [--report report.md] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.config import NEO4J_CONFIG
+    from dashboard_codex.database.phased_load import split_statements
+else:  # pragma: no cover - executed in package context
+    from ..config import NEO4J_CONFIG
+    from ..database.phased_load import split_statements
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_QUERIES = BASE_DIR / "validation_queries.cypher"
+DEFAULT_QUESTIONS = BASE_DIR / "competency_questions.md"
+DEFAULT_GOLDEN = BASE_DIR / "competency_golden.json"
+
+_NUMBERED_HEADER = re.compile(r"^//\s*(\d+)\.\s*(.+?)\s*$")
+_QUERY_HEADER = re.compile(r"^//\s*Query\s+(\d+)(?:\s+Part\s+(\w+))?\s*:\s*(.+?)\s*$", re.IGNORECASE)
+_PART_HEADER = re.compile(r"^//\s*Part\s+(\w+)\s*:\s*(.+?)\s*$", re.IGNORECASE)
+_CATEGORY = re.compile(r"^##\s+(Category\s+\d+:.*?)\s*$")
+_QUESTION = re.compile(r"^(\d+)\.\s+\*\*(.+?)\*\*")
+_EXPECTED = re.compile(r"^\s*-\s*Expected:\s*(.+?)\s*$")
+_WRITE_CLAUSE = re.compile(r"\b(CREATE|MERGE|DELETE|SET|REMOVE|DROP)\b", re.IGNORECASE)
+
+STATUS_OK = "ok"
+STATUS_NEW = "new"
+STATUS_CHANGED = "changed"
+STATUS_SLOWER = "slower"
+STATUS_REGRESSED = "regressed"
+STATUS_ERROR = "error"
+FAILING = (STATUS_CHANGED, STATUS_REGRESSED, STATUS_ERROR)
+
+
+@dataclass
+class CompetencyQuery:
+    id: str
+    title: str
+    source: str
+    line: int
+    query: str
+    question: Optional[str] = None
+    expected: Optional[str] = None
+
+    @property
+    def ordered(self) -> bool:
+        return "ORDER BY" in self.query.upper()
+
+
+@dataclass
+class Measurement:
+    query: CompetencyQuery
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    db_hits: int = 0
+    median_ms: float = 0.0
+    error: Optional[str] = None
+    status: str = STATUS_NEW
+    notes: List[str] = field(default_factory=list)
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows)
+
+
+def _normalise_comments(text: str) -> str:
+    """Treat the SQL-style ``--`` lines some blocks use as Cypher comments."""
+
+    return re.sub(r"(?m)^(\s*)--", r"\1//", text)
+
+
+def parse_validation_queries(path: Path) -> List[CompetencyQuery]:
+    """Return the read-only query blocks of a validation script, in file order."""
+
+    lines = _normalise_comments(path.read_text(encoding="utf-8")).splitlines()
+    queries: List[CompetencyQuery] = []
+    seen: Dict[str, int] = {}
+    previous_line = 0
+    for line, statement in split_statements("\n".join(lines)):
+        if _WRITE_CLAUSE.search(re.sub(r'"[^"]*"|\'[^\']*\'', "", statement)):
+            previous_line = line
+            continue
+        identifier, title = f"line{line}", statement.splitlines()[0]
+        part: Optional[Tuple[str, str]] = None
+        for comment in reversed(lines[previous_line : line - 1]):
+            comment = comment.strip()
+            numbered, named = _NUMBERED_HEADER.match(comment), _QUERY_HEADER.match(comment)
+            if numbered:
+                identifier, title = f"vq{int(numbered.group(1)):02d}", numbered.group(2)
+                break
+            if named:
+                # "// Query 29: ..." followed by "// Part A: ..." names the first part.
+                letter, title = (named.group(2), named.group(3)) if named.group(2) else (part or ("", named.group(3)))
+                identifier = f"q{int(named.group(1)):02d}{letter.lower()}"
+                break
+            if part is None and _PART_HEADER.match(comment):
+                part = _PART_HEADER.match(comment).groups()
+        seen[identifier] = seen.get(identifier, 0) + 1
+        if seen[identifier] > 1:
+            identifier = f"{identifier}_{seen[identifier]}"
+        queries.append(CompetencyQuery(identifier, title, path.name, line, statement.rstrip(";").strip()))
+        previous_line = line
+    return queries
+
+
+def parse_competency_questions(path: Path) -> Tuple[List[Dict[str, Any]], List[CompetencyQuery]]:
+    """Return the numbered questions and the queries in fenced ``cypher`` blocks under them."""
+
+    questions: List[Dict[str, Any]] = []
+    queries: List[CompetencyQuery] = []
+    category = ""
+    block: Optional[List[str]] = None
+    block_line = 0
+    for number, raw in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        stripped = raw.strip()
+        if block is not None:
+            if stripped.startswith("```"):
+                current = questions[-1] if questions else {"number": 0, "question": "", "expected": None}
+                blocks = current.setdefault("queries", [])
+                suffix = f"_{len(blocks) + 1}" if blocks else ""
+                query = CompetencyQuery(
+                    f"cq{current['number']:03d}{suffix}",
+                    current["question"],
+                    path.name,
+                    block_line,
+                    "\n".join(block).strip().rstrip(";"),
+                    question=current["question"],
+                    expected=current.get("expected"),
+                )
+                blocks.append(query.id)
+                queries.append(query)
+                block = None
+            else:
+                block.append(raw)
+            continue
+        if stripped.lower().startswith("```cypher"):
+            block, block_line = [], number + 1
+        elif _CATEGORY.match(stripped):
+            category = _CATEGORY.match(stripped).group(1)
+        elif _QUESTION.match(stripped):
+            match = _QUESTION.match(stripped)
+            questions.append({"number": int(match.group(1)), "question": match.group(2), "category": category, "expected": None})
+        elif questions and _EXPECTED.match(raw) and questions[-1]["expected"] is None:
+            questions[-1]["expected"] = _EXPECTED.match(raw).group(1)
+    return questions, queries
+
+
+def _walk_profile(plan: Dict[str, Any]) -> int:
+    return int(plan.get("dbHits", 0)) + sum(_walk_profile(child) for child in plan.get("children", []))
+
+
+def _plain(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Driver values (dates, nodes, paths) as JSON-comparable values."""
+
+    return json.loads(json.dumps(rows, default=str))
+
+
+def measure(session, query: CompetencyQuery, repeat: int) -> Measurement:
+    result = Measurement(query)
+    try:
+        profiled = session.run("PROFILE " + query.query)
+        result.rows = _plain([record.data() for record in profiled])
+        result.db_hits = _walk_profile(profiled.consume().profile or {})
+        timings: List[float] = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            session.run(query.query).consume()
+            timings.append((time.perf_counter() - started) * 1000)
+        result.median_ms = statistics.median(timings) if timings else 0.0
+    except Exception as exc:  # a failing block must not stop the suite
+        result.error = str(exc).splitlines()[0]
+        result.status = STATUS_ERROR
+    return result
+
+
+def _values_equal(left: Any, right: Any, tolerance: float) -> bool:
+    if isinstance(left, float) or isinstance(right, float):
+        if isinstance(left, (int, float)) and isinstance(right, (int, float)):
+            return math.isclose(left, right, rel_tol=tolerance, abs_tol=tolerance)
+        return False
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(_values_equal(left[key], right[key], tolerance) for key in left)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(_values_equal(a, b, tolerance) for a, b in zip(left, right))
+    return left == right
+
+
+def _canonical(rows: List[Dict[str, Any]], ordered: bool) -> List[Dict[str, Any]]:
+    return rows if ordered else sorted(rows, key=lambda row: json.dumps(row, sort_keys=True))
+
+
+def compare(
+    result: Measurement,
+    golden: Optional[Dict[str, Any]],
+    tolerance: float,
+    max_hit_growth: float,
+    max_latency_growth: float,
+    min_latency_ms: float,
+) -> None:
+    """Set ``result.status`` and notes against its golden entry."""
+
+    if result.error or golden is None:
+        return
+    result.status = STATUS_OK
+    ordered = result.query.ordered
+    if not _values_equal(_canonical(result.rows, ordered), _canonical(golden.get("rows", []), ordered), tolerance):
+        result.status = STATUS_CHANGED
+        result.notes.append(f"results differ (rows {len(golden.get('rows', []))} -> {result.row_count})")
+    golden_hits = int(golden.get("db_hits", 0))
+    if result.db_hits > golden_hits * (1 + max_hit_growth):
+        if result.status == STATUS_OK:
+            result.status = STATUS_REGRESSED
+        result.notes.append(f"db hits {golden_hits:,} -> {result.db_hits:,}")
+    golden_ms = float(golden.get("median_ms", 0.0))
+    if result.median_ms > golden_ms * (1 + max_latency_growth) and result.median_ms - golden_ms > min_latency_ms:
+        if result.status == STATUS_OK:
+            result.status = STATUS_SLOWER
+        result.notes.append(f"median {golden_ms:.1f} ms -> {result.median_ms:.1f} ms")
+
+
+def golden_entries(results: Sequence[Measurement]) -> Dict[str, Any]:
+    return {
+        result.query.id: {
+            "title": result.query.title,
+            "rows": result.rows,
+            "row_count": result.row_count,
+            "db_hits": result.db_hits,
+            "median_ms": round(result.median_ms, 3),
+        }
+        for result in results
+        if result.error is None
+    }
+
+
+def render_report(results: Sequence[Measurement], questions: Sequence[Dict[str, Any]], database: str) -> str:
+    counts = {status: sum(1 for result in results if result.status == status) for status in (STATUS_OK, STATUS_NEW, STATUS_SLOWER) + FAILING}
+    lines = [
+        "# Competency benchmark",
+        "",
+        f"Database `{database}`, {len(results)} queries: "
+        + ", ".join(f"{count} {status}" for status, count in counts.items() if count),
+        "",
+        "| Query | Title | Status | Rows | DB hits | Median ms | Notes |",
+        "|---|---|---|---:|---:|---:|---|",
+    ]
+    for result in results:
+        notes = "; ".join(result.notes) or (result.error or "")
+        lines.append(
+            f"| {result.query.id} | {result.query.title.replace('|', '/')} | {result.status} | {result.row_count} "
+            f"| {result.db_hits:,} | {result.median_ms:.1f} | {notes.replace('|', '/')} |"
+        )
+    covered = sum(1 for question in questions if question.get("queries"))
+    lines += ["", f"Competency questions with a query block: {covered}/{len(questions)}"]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the competency queries against golden results.")
+    parser.add_argument("--queries", type=Path, default=DEFAULT_QUERIES, help="Validation query script")
+    parser.add_argument("--questions", type=Path, default=DEFAULT_QUESTIONS, help="Competency question document")
+    parser.add_argument("--golden", type=Path, default=DEFAULT_GOLDEN, help="Golden results file")
+    parser.add_argument("--record", action="store_true", help="Write the current results as the golden file")
+    parser.add_argument("--report", type=Path, help="Write a Markdown regression report here")
+    parser.add_argument("--only", action="append", help="Only run this query id (repeatable)")
+    parser.add_argument("--list", action="store_true", help="List the parsed queries and exit")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per query")
+    parser.add_argument("--tolerance", type=float, default=1e-6, help="Relative tolerance for numeric results")
+    parser.add_argument("--max-db-hit-growth", type=float, default=0.10, help="Allowed db hit growth (fraction)")
+    parser.add_argument("--max-latency-growth", type=float, default=0.50, help="Allowed median latency growth (fraction)")
+    parser.add_argument("--min-latency-ms", type=float, default=5.0, help="Ignore latency changes below this many ms")
+    parser.add_argument("--database", default=NEO4J_CONFIG.database, help="Target database")
+    args = parser.parse_args(argv)
+
+    questions, question_queries = parse_competency_questions(args.questions)
+    queries = parse_validation_queries(args.queries) + question_queries
+    if args.only:
+        queries = [query for query in queries if query.id in set(args.only)]
+
+    if args.list:
+        for query in queries:
+            print(f"{query.id:<10}{query.source}:{query.line:<6}{'ordered' if query.ordered else '':<9}{query.title}")
+        print(f"{len(queries)} queries; {len(questions)} competency questions, {len(question_queries)} with query blocks")
+        return 0
+
+    from neo4j import GraphDatabase
+
+    golden: Dict[str, Any] = json.loads(args.golden.read_text(encoding="utf-8")) if args.golden.exists() else {}
+    driver = GraphDatabase.driver(NEO4J_CONFIG.uri, auth=(NEO4J_CONFIG.username, NEO4J_CONFIG.password))
+    try:
+        with driver.session(database=args.database) as session:
+            results = [measure(session, query, args.repeat) for query in queries]
+    except Exception as exc:
+        print(f"Database connection is not ready: {exc}", file=sys.stderr)
+        return 2
+    finally:
+        driver.close()
+
+    for result in results:
+        compare(
+            result,
+            golden.get(result.query.id),
+            args.tolerance,
+            args.max_db_hit_growth,
+            args.max_latency_growth,
+            args.min_latency_ms,
+        )
+
+    if args.record:
+        golden.update(golden_entries(results))
+        args.golden.write_text(json.dumps(golden, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Recorded {len(golden_entries(results))} golden result(s) in {args.golden}")
+
+    report = render_report(results, questions, args.database)
+    if args.report:
+        args.report.write_text(report, encoding="utf-8")
+    print(report)
+    return 1 if any(result.status in FAILING for result in results) and not args.record else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Microbenchmark the shared frame engine against the row-wise page code.
+
+Builds a synthetic revenue frame (default 1M rows) and times the quarterly
+filter/label/group-by and the monthly timeline filter/group-by, both the
+way the pages used to do it (``DataFrame.apply(axis=1)``, object columns,
+one group-by per consumer) and through ``pages/frames.py``. No database
+is needed.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.benchmark_frames --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.pages.frames import (
+        FrameAggregator,
+        member_mask,
+        period_index,
+        period_mask,
+        prepare_frame,
+        quarter_mask,
+    )
+else:  # pragma: no cover - executed in package context
+    from ..pages.frames import FrameAggregator, member_mask, period_index, period_mask, prepare_frame, quarter_mask
+
+PRODUCTS = ["Goldenberries (Physalis)", "Pitahaya (Dragon Fruit)", "Exotic Fruits Mix", "Bench A", "Bench B"]
+
+
+def _synthetic_frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    years = rng.integers(2015, 2026, rows)
+    months = rng.integers(1, 13, rows)
+    products = np.array(PRODUCTS, dtype=object)[rng.integers(0, len(PRODUCTS), rows)]
+    return pd.DataFrame(
+        {
+            "product": products,
+            "display_name": products,
+            "year": years,
+            "month": months,
+            "quarter": (months - 1) // 3 + 1,
+            "date": pd.to_datetime({"year": years, "month": months, "day": 1}),
+            "revenue": rng.random(rows) * 1000,
+        }
+    )
+
+
+def _legacy_quarterly(df: pd.DataFrame, quarters: set, products: List[str]) -> None:
+    filtered = df[
+        df["product"].isin(products)
+        & df.apply(lambda row: (int(row["year"]), int(row["quarter"])) in quarters, axis=1)
+    ].copy()
+    filtered["quarter_label"] = filtered.apply(lambda row: f"Q{int(row['quarter'])} {int(row['year'])}", axis=1)
+    filtered.groupby(["quarter_label", "display_name"], as_index=False)["revenue"].sum()
+    filtered.groupby("display_name")["revenue"].sum().sort_values(ascending=False)
+
+
+def _engine_quarterly(frame: pd.DataFrame, quarters: set, products: List[str]) -> None:
+    filtered = FrameAggregator(frame[member_mask(frame, "product", products) & quarter_mask(frame, quarters)], "revenue")
+    filtered.by("quarter_index", "quarter_label", "display_name")
+    filtered.totals_by("display_name")
+
+
+def _legacy_timeline(df: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp, products: List[str]) -> None:
+    filtered = df[(df["date"] >= start) & (df["date"] <= end) & (df["product"].isin(products))].copy()
+    filtered["date"].dt.to_period("M").nunique()
+    filtered.groupby(["date", "display_name"], as_index=False)["revenue"].sum().sort_values("date")
+    filtered.groupby("display_name")["revenue"].sum().sort_values(ascending=False)
+
+
+def _engine_timeline(frame: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp, products: List[str]) -> None:
+    mask = period_mask(frame, period_index(start.year, start.month), period_index(end.year, end.month))
+    filtered = FrameAggregator(frame[mask & member_mask(frame, "product", products)], "revenue")
+    filtered.frame["period"].nunique()
+    filtered.by("date", "display_name")
+    filtered.totals_by("display_name")
+
+
+def _time(action: Callable[[], None], repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare row-wise page filtering with pages/frames.py.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic rows")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per variant")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args(argv)
+
+    df = _synthetic_frame(args.rows, args.seed)
+    started = time.perf_counter()
+    frame = prepare_frame(df, ("product", "display_name"), {"product": PRODUCTS})
+    prepare_ms = (time.perf_counter() - started) * 1000
+
+    quarters = {(year, quarter) for year in range(2018, 2024) for quarter in (1, 3)}
+    products = PRODUCTS[:3]
+    start, end = pd.Timestamp(2017, 4, 1), pd.Timestamp(2023, 9, 1)
+
+    results: Dict[str, Dict[str, float]] = {
+        "quarterly": {
+            "legacy": _time(lambda: _legacy_quarterly(df, quarters, products), args.repeat),
+            "engine": _time(lambda: _engine_quarterly(frame, quarters, products), args.repeat),
+        },
+        "timeline": {
+            "legacy": _time(lambda: _legacy_timeline(df, start, end, products), args.repeat),
+            "engine": _time(lambda: _engine_timeline(frame, start, end, products), args.repeat),
+        },
+    }
+
+    print(f"{args.rows:,} rows; one-off prepare_frame {prepare_ms:.1f} ms")
+    print(f"{'workload':<12}{'legacy ms':>12}{'engine ms':>12}{'speed-up':>10}")
+    for name, stats in results.items():
+        speedup = stats["legacy"] / stats["engine"] if stats["engine"] else float("inf")
+        print(f"{name:<12}{stats['legacy']:>12.1f}{stats['engine']:>12.1f}{speedup:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Benchmark the revenue timeseries join strategies at multi-year scale.
+
+Seeds synthetic ``bench_*`` products with monthly price and volume facts,
+then compares the legacy ``tp.id = tp2.id`` cross product against the
+shared ``TimePeriod`` join now used by ``Neo4jConnection``. Row counts and
+db hits come from ``PROFILE``; latency is the median of repeated runs.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.benchmark_revenue_joins --years 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from neo4j import GraphDatabase
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.config import NEO4J_CONFIG
+    from dashboard_codex.database.data_version import DOMAIN_REVENUE, bump_in_transaction
+else:  # pragma: no cover - executed in package context
+    from ..config import NEO4J_CONFIG
+    from ..database.data_version import DOMAIN_REVENUE, bump_in_transaction
+
+BENCH_PREFIX = "bench_"
+
+LEGACY_QUERY = """
+MATCH (p:Product) WHERE p.id STARTS WITH $prefix
+MATCH (pd:PriceData)-[:PRICE_FOR_PRODUCT]->(p)
+MATCH (vd:VolumeData)-[:VOLUME_FOR_PRODUCT]->(p)
+MATCH (pd)-[:PRICED_IN_PERIOD]->(tp:TimePeriod)
+MATCH (vd)-[:OCCURS_IN_PERIOD]->(tp2:TimePeriod)
+WHERE tp.id = tp2.id
+WITH p.name AS Product, tp.year AS Year, tp.month AS Month, SUM(pd.price * vd.volume) AS MonthlyRevenue
+RETURN Product, Year, Month, MonthlyRevenue
+ORDER BY Year, Month, Product
+"""
+
+SHARED_PERIOD_QUERY = """
+MATCH (p:Product) WHERE p.id STARTS WITH $prefix
+MATCH (p)<-[:VOLUME_FOR_PRODUCT]-(vd:VolumeData)-[:OCCURS_IN_PERIOD]->(tp:TimePeriod)
+MATCH (p)<-[:PRICE_FOR_PRODUCT]-(pd:PriceData)-[:PRICED_IN_PERIOD]->(tp)
+WITH p.name AS Product, tp.year AS Year, tp.month AS Month, SUM(pd.price * vd.volume) AS MonthlyRevenue
+RETURN Product, Year, Month, MonthlyRevenue
+ORDER BY Year, Month, Product
+"""
+
+SEED_QUERY = """
+UNWIND $periods AS period
+MERGE (tp:TimePeriod {id: period.id})
+SET tp.year = period.year, tp.month = period.month, tp.quarter = period.quarter, tp.periodType = 'monthly'
+WITH collect(tp) AS periods
+UNWIND $facts AS fact
+MATCH (tp:TimePeriod {id: fact.period_id})
+MERGE (p:Product {id: fact.product_id})
+SET p.name = fact.product_name
+CREATE (vd:VolumeData {id: fact.volume_id, volume: fact.volume, unit: 'kg'})
+CREATE (pd:PriceData {id: fact.price_id, price: fact.price, currency: 'USD'})
+CREATE (vd)-[:VOLUME_FOR_PRODUCT]->(p)
+CREATE (pd)-[:PRICE_FOR_PRODUCT]->(p)
+CREATE (vd)-[:OCCURS_IN_PERIOD]->(tp)
+CREATE (pd)-[:PRICED_IN_PERIOD]->(tp)
+"""
+
+CLEANUP_QUERY = """
+MATCH (n)
+WHERE (n:Product OR n:TimePeriod OR n:VolumeData OR n:PriceData) AND n.id STARTS WITH $prefix
+DETACH DELETE n
+"""
+
+
+def _build_seed(years: int, products: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    periods: List[Dict[str, Any]] = []
+    facts: List[Dict[str, Any]] = []
+    for year_offset in range(years):
+        year = 2000 + year_offset
+        for month in range(1, 13):
+            period_id = f"{BENCH_PREFIX}tp_{year}_{month:02d}"
+            periods.append(
+                {"id": period_id, "year": year, "month": month, "quarter": f"Q{(month - 1) // 3 + 1}"}
+            )
+            for index in range(products):
+                suffix = f"{index}_{year}_{month:02d}"
+                facts.append(
+                    {
+                        "period_id": period_id,
+                        "product_id": f"{BENCH_PREFIX}prod_{index}",
+                        "product_name": f"Benchmark Product {index}",
+                        "volume_id": f"{BENCH_PREFIX}vd_{suffix}",
+                        "price_id": f"{BENCH_PREFIX}pd_{suffix}",
+                        "volume": float(1000 + 10 * month + index),
+                        "price": float(5 + index),
+                    }
+                )
+    return periods, facts
+
+
+def _write(session, query: str, **parameters: Any) -> None:
+    """Run a benchmark write and bump the revenue DataVersion atomically."""
+
+    def _work(tx) -> None:
+        tx.run(query, parameters).consume()
+        bump_in_transaction(tx, DOMAIN_REVENUE)
+
+    session.execute_write(_work)
+
+
+def _walk_profile(plan: Dict[str, Any]) -> Tuple[int, int]:
+    """Return (peak operator rows, total db hits) for a profile tree."""
+
+    peak_rows = int(plan.get("rows", 0))
+    db_hits = int(plan.get("dbHits", 0))
+    for child in plan.get("children", []):
+        child_rows, child_hits = _walk_profile(child)
+        peak_rows = max(peak_rows, child_rows)
+        db_hits += child_hits
+    return peak_rows, db_hits
+
+
+def _measure(session, query: str, repeat: int) -> Dict[str, Any]:
+    profile = session.run("PROFILE " + query, prefix=BENCH_PREFIX).consume().profile or {}
+    peak_rows, db_hits = _walk_profile(profile)
+
+    timings: List[float] = []
+    result_rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result_rows = len(list(session.run(query, prefix=BENCH_PREFIX)))
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "result_rows": result_rows,
+        "peak_rows": peak_rows,
+        "db_hits": db_hits,
+        "median_ms": statistics.median(timings),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=5, help="Years of monthly facts to seed")
+    parser.add_argument("--products", type=int, default=3, help="Number of synthetic products")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per query")
+    parser.add_argument("--database", default=NEO4J_CONFIG.database, help="Target database")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic data after the run")
+    args = parser.parse_args(argv)
+
+    periods, facts = _build_seed(args.years, args.products)
+    driver = GraphDatabase.driver(NEO4J_CONFIG.uri, auth=(NEO4J_CONFIG.username, NEO4J_CONFIG.password))
+    try:
+        with driver.session(database=args.database) as session:
+            _write(session, CLEANUP_QUERY, prefix=BENCH_PREFIX)
+            _write(session, SEED_QUERY, periods=periods, facts=facts)
+
+            results = {
+                "legacy (tp.id = tp2.id)": _measure(session, LEGACY_QUERY, args.repeat),
+                "shared TimePeriod": _measure(session, SHARED_PERIOD_QUERY, args.repeat),
+            }
+
+            if not args.keep:
+                _write(session, CLEANUP_QUERY, prefix=BENCH_PREFIX)
+    finally:
+        driver.close()
+
+    months = args.years * 12
+    print(f"{args.products} products x {months} months ({len(facts)} price/volume pairs)")
+    print(f"{'strategy':<26}{'result rows':>12}{'peak rows':>12}{'db hits':>12}{'median ms':>12}")
+    for name, stats in results.items():
+        print(
+            f"{name:<26}{stats['result_rows']:>12,}{stats['peak_rows']:>12,}"
+            f"{stats['db_hits']:>12,}{stats['median_ms']:>12.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Check that the DuckDB analytical mirror returns the same numbers as Neo4j.
+
+Runs every metric read (per product and per cost category where the read
+takes one) on a plain ``Neo4jConnection`` and on a freshly synced
+``MirrorConnection`` and compares the results row by row, ignoring row
+order and float rounding. Result caches are bypassed on both sides. Exits
+with 1 when any read differs.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.check_mirror_parity [--tolerance 1e-9]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pandas as pd
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import Neo4jConnection
+    from dashboard_codex.database.analytical_mirror import MirrorConnection
+else:  # pragma: no cover - executed in package context
+    from ..database import Neo4jConnection
+    from ..database.analytical_mirror import MirrorConnection
+
+# Reads without arguments, including the composite TOC metrics built on them.
+READS: Tuple[str, ...] = (
+    "get_product_count",
+    "get_total_revenue",
+    "get_total_volume",
+    "get_average_monthly_revenue",
+    "get_average_price_per_kg",
+    "get_total_costs",
+    "get_variable_costs",
+    "get_fixed_costs",
+    "get_cost_timeseries",
+    "get_quarterly_costs",
+    "get_cost_categories",
+    "get_product_cost_breakdown",
+    "get_product_variable_costs",
+    "get_average_cost_per_kg",
+    "get_variable_cost_timeseries_frame",
+    "get_fixed_cost_timeseries_frame",
+    "get_cost_totals_by_behavior",
+    "get_cost_totals_by_category",
+    "get_product_metrics",
+    "get_product_monthly_performance_frame",
+    "get_revenue_timeseries_frame",
+    "get_quarterly_revenue",
+    "get_throughput",
+    "get_inventory_investment",
+    "get_toc_roi",
+    "get_toc_productivity",
+    "get_investment_turn",
+)
+PRODUCT_READS: Tuple[str, ...] = (
+    "get_product_costs",
+    "get_product_variable_cost",
+    "get_product_toc_metrics",
+)
+
+
+def _canonical(value: Any) -> Any:
+    """Turn a read result into nested lists/dicts with rows in a stable order."""
+
+    if isinstance(value, pd.DataFrame):
+        value = value.to_dict("records")
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return sorted((_canonical(item) for item in value), key=_sort_key)
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    return value
+
+
+def _sort_key(row: Any) -> str:
+    # Rounded so float noise in one column cannot reorder otherwise equal rows.
+    if isinstance(row, dict):
+        return repr(sorted((key, round(item, 4) if isinstance(item, float) else item) for key, item in row.items()))
+    return repr(round(row, 4) if isinstance(row, float) else row)
+
+
+def _differences(expected: Any, actual: Any, tolerance: float, path: str = "") -> List[str]:
+    if isinstance(expected, float) or isinstance(actual, float):
+        if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+            if math.isclose(expected, actual, rel_tol=tolerance, abs_tol=tolerance):
+                return []
+        return [f"{path or 'value'}: neo4j={expected!r} duckdb={actual!r}"]
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        if expected.keys() != actual.keys():
+            return [f"{path or 'value'}: keys {sorted(expected)} != {sorted(actual)}"]
+        return [
+            difference
+            for key in expected
+            for difference in _differences(expected[key], actual[key], tolerance, f"{path}.{key}")
+        ]
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path or 'value'}: {len(expected)} rows != {len(actual)} rows"]
+        return [
+            difference
+            for index, (left, right) in enumerate(zip(expected, actual))
+            for difference in _differences(left, right, tolerance, f"{path}[{index}]")
+        ]
+    return [] if expected == actual else [f"{path or 'value'}: neo4j={expected!r} duckdb={actual!r}"]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare every metric read between Neo4j and the DuckDB mirror.")
+    parser.add_argument("--path", help="DuckDB file (default: GOLDENBERRY_DUCKDB_PATH)")
+    parser.add_argument("--tolerance", type=float, default=1e-9, help="Relative/absolute float tolerance")
+    parser.add_argument("--show", type=int, default=5, help="Differences printed per failing read")
+    args = parser.parse_args(argv)
+
+    reference = Neo4jConnection()
+    mirrored = MirrorConnection(path=args.path)
+    try:
+        if not reference.connected:
+            print(reference.error_message or "Database connection is not ready", file=sys.stderr)
+            return 2
+        if mirrored.mirror is None:
+            print("Analytical mirror unavailable; is duckdb installed?", file=sys.stderr)
+            return 2
+        # Compare the backends themselves, not cached copies of either.
+        for connection in (reference, mirrored):
+            connection.period_cache = None
+            connection.shared_cache = None
+        mirrored.mirror.sync(mirrored, force=True)
+
+        products = [row["Product"] for row in reference.get_product_metrics()]
+        categories = reference.get_cost_categories()
+        calls: List[Tuple[str, tuple, dict]] = [(name, (), {}) for name in READS]
+        calls += [(name, (product,), {}) for name in PRODUCT_READS for product in products]
+        calls += [("get_cost_timeseries", (), {"product": product}) for product in products]
+        calls += [("get_quarterly_costs", (), {"category": category}) for category in categories]
+        calls.append(("iter_cost_line_items", (), {}))
+
+        failures = 0
+        for name, call_args, call_kwargs in calls:
+            label = name + (f"{call_args or ''}{call_kwargs or ''}" if call_args or call_kwargs else "")
+            results = []
+            for connection in (reference, mirrored):
+                result = getattr(connection, name)(*call_args, **call_kwargs)
+                if name == "iter_cost_line_items":
+                    result = [row for batch in result for row in batch]
+                results.append(_canonical(result))
+            differences = _differences(results[0], results[1], args.tolerance)
+            status = "ok" if not differences else f"{len(differences)} difference(s)"
+            print(f"{label:<70}{status}")
+            for difference in differences[: args.show]:
+                print(f"    {difference}")
+            failures += bool(differences)
+
+        print(f"{len(calls) - failures} of {len(calls)} reads match")
+        return 1 if failures else 0
+    finally:
+        mirrored.close()
+        reference.close()
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
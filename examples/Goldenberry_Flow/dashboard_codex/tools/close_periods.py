@@ -0,0 +1,56 @@
+"""
+Mark fiscal periods as closed so their aggregates are cached on disk.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.close_periods --period tp_2024_09 --period tp_2024_10
+    python -m dashboard_codex.tools.close_periods --period tp_2024_09    # again after a correction
+    python -m dashboard_codex.tools.close_periods --clear-cache    # drop every cached file
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import get_connection
+    from dashboard_codex.database.period_cache import close_periods
+else:  # pragma: no cover - executed in package context
+    from ..database import get_connection
+    from ..database.period_cache import close_periods
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Flag TimePeriods as closed and manage the closed-period cache.")
+    parser.add_argument("--period", action="append", default=[], help="TimePeriod id to close (repeatable)")
+    parser.add_argument("--clear-cache", action="store_true", help="Drop cached closed-period aggregates")
+    args = parser.parse_args(argv)
+
+    if not args.period and not args.clear_cache:
+        parser.error("pass at least one --period or --clear-cache")
+
+    connection = get_connection()
+    if not connection.connected:
+        print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+        return 2
+
+    if args.clear_cache:
+        if connection.period_cache is None:
+            print("Closed-period cache is disabled (GOLDENBERRY_CLOSED_PERIOD_CACHE=0)")
+        else:
+            connection.period_cache.clear()
+            print(f"Cleared {connection.period_cache.root}")
+
+    if args.period:
+        closed = close_periods(connection, args.period)
+        print(f"Closed {closed} of {len(args.period)} periods")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
@@ -0,0 +1,423 @@
+"""
+Write ``neo4j-admin database import`` CSVs for a full offline rebuild.
+
+Exports a seeded graph (business model, 12-month revenue and cost
+integration data, loaded once with the seed scripts) label by label and
+relationship type by type, and can append generated scale data that never
+goes through Cypher at all. Node headers follow ``core/schema_definition.md``
+for the twelve canvas labels; other labels and extra properties take their
+types from ``db.schema.nodeTypeProperties()``. Every label gets its own ID
+space keyed on ``id``. An ``import.sh`` with the matching command is written
+next to the files. Derived nodes (MonthlyFact, DataVersion, LoadCheckpoint)
+are skipped; rebuild them after the import with ``provision_schema`` and
+``refresh_monthly_facts``.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.export_bulk_import exports/import
+    python -m dashboard_codex.tools.export_bulk_import exports/import --scale-products 28000 --scale-years 10 --compress
+    python -m dashboard_codex.tools.export_bulk_import exports/scale --no-graph --scale-products 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import calendar
+import csv
+import gzip
+import re
+import sys
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import Neo4jConnection
+else:  # pragma: no cover - executed in package context
+    from ..database import Neo4jConnection
+
+SCHEMA_DEFINITION = Path(__file__).resolve().parents[4] / "core" / "schema_definition.md"
+DERIVED_LABELS = ("MonthlyFact", "DataVersion", "LoadCheckpoint")
+SCALE_PREFIX = "scale_"
+
+# core/schema_definition.md types and db.schema.*TypeProperties() names -> import header types.
+HEADER_TYPES = {
+    "STRING": "",
+    "FLOAT": "double",
+    "INTEGER": "long",
+    "DATE": "date",
+    "BOOLEAN": "boolean",
+    "String": "",
+    "Long": "long",
+    "Integer": "long",
+    "Double": "double",
+    "Float": "double",
+    "Boolean": "boolean",
+    "Date": "date",
+    "DateTime": "datetime",
+    "LocalDateTime": "localdatetime",
+    "LocalTime": "localtime",
+    "Time": "time",
+    "Duration": "duration",
+    "StringArray": "string[]",
+    "LongArray": "long[]",
+    "DoubleArray": "double[]",
+    "BooleanArray": "boolean[]",
+}
+
+NODE_TYPES_QUERY = "CALL db.schema.nodeTypeProperties()"
+REL_TYPES_QUERY = "CALL db.schema.relTypeProperties()"
+
+# Formatted with one label at a time; a node is exported under its first label only.
+NODES_QUERY = """
+MATCH (n:`{label}`)
+WHERE labels(n)[0] = $label
+RETURN n.id AS id, labels(n) AS labels, properties(n) AS props
+"""
+
+RELATIONSHIPS_QUERY = """
+MATCH (a)-[r]->(b)
+WHERE a.id IS NOT NULL AND b.id IS NOT NULL
+  AND NOT any(label IN labels(a) + labels(b) WHERE label IN $excluded)
+RETURN labels(a)[0] AS start_label, a.id AS start_id, type(r) AS type,
+       labels(b)[0] AS end_label, b.id AS end_id, properties(r) AS props
+"""
+
+Column = Tuple[str, str]  # (property, header type)
+
+
+def parse_schema_definition(path: Path = SCHEMA_DEFINITION) -> Tuple[Dict[str, List[Column]], Dict[str, List[Column]]]:
+    """Return declared node and relationship properties from the schema document."""
+
+    text = path.read_text(encoding="utf-8")
+    nodes: Dict[str, List[Column]] = {}
+    relationships: Dict[str, List[Column]] = {}
+    block = re.compile(r"(?:CREATE \(\w+:(\w+)|\(\w+\)-\[:(\w+)) \{(.*?)\}\]?[-)]", re.DOTALL)
+    prop = re.compile(r"^\s*(\w+):\s*(\"STRING\"|FLOAT|INTEGER|BOOLEAN|date\()", re.MULTILINE)
+    for match in block.finditer(text):
+        columns = [
+            (name, HEADER_TYPES["DATE" if kind.startswith("date") else kind.strip('"')])
+            for name, kind in prop.findall(match.group(3))
+        ]
+        if match.group(1):
+            nodes[match.group(1)] = columns
+        else:
+            relationships.setdefault(match.group(2), columns)
+    return nodes, relationships
+
+
+def _format(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ";".join(_format(item) for item in value)
+    if hasattr(value, "iso_format"):  # neo4j.time values
+        return value.iso_format()
+    return str(value)
+
+
+def _header(name: str, kind: str) -> str:
+    return f"{name}:{kind}" if kind else name
+
+
+class CsvSet:
+    """Open import files, their headers and the ``neo4j-admin`` arguments for them."""
+
+    def __init__(self, root: Path, compress: bool) -> None:
+        self.root = root
+        self.compress = compress
+        self.files: Dict[str, Tuple[IO[str], Any]] = {}
+        self.arguments: List[str] = []
+        self.rows: Dict[str, int] = {}
+
+    def open(self, name: str, header: Sequence[str], option: str) -> Any:
+        suffix = ".csv.gz" if self.compress else ".csv"
+        path = self.root / f"{name}{suffix}"
+        stream = (
+            gzip.open(path, "wt", newline="", encoding="utf-8")
+            if self.compress
+            else open(path, "w", newline="", encoding="utf-8")
+        )
+        writer = csv.writer(stream)
+        writer.writerow(header)
+        self.files[name] = (stream, writer)
+        self.arguments.append(f"--{option}={path.name}")
+        self.rows[name] = 0
+        return writer
+
+    def write_frame(self, name: str, header: Sequence[str], option: str, frame: pd.DataFrame) -> None:
+        """Append a frame whose columns are in header order (opens the file on first use)."""
+
+        if name not in self.files:
+            self.open(name, header, option)
+        stream, _ = self.files[name]
+        frame.to_csv(stream, header=False, index=False)
+        self.rows[name] += len(frame)
+
+    def close(self) -> None:
+        for stream, _ in self.files.values():
+            stream.close()
+
+
+def _graph_columns(rows: Iterable[Dict[str, Any]], key: str) -> Dict[str, List[Column]]:
+    columns: Dict[str, List[Column]] = {}
+    for row in rows:
+        owners = row.get(key)
+        name = row.get("propertyName")
+        if not owners or not name:
+            continue
+        owner = owners[0] if isinstance(owners, list) else str(owners).strip(":`")
+        types = row.get("propertyTypes") or ["String"]
+        columns.setdefault(owner, []).append((name, HEADER_TYPES.get(types[0], "")))
+    return columns
+
+
+def _merge(declared: List[Column], observed: List[Column]) -> List[Column]:
+    """Declared columns in document order, then anything else the graph holds."""
+
+    names = {name for name, _ in declared}
+    extra = sorted((column for column in observed if column[0] not in names and column[0] != "id"))
+    return [column for column in declared if column[0] != "id"] + extra
+
+
+def export_graph(connection: Neo4jConnection, csvs: CsvSet, fetch_size: int) -> Dict[str, int]:
+    """Stream every non-derived label and relationship type into import CSVs."""
+
+    declared_nodes, declared_rels = parse_schema_definition()
+    node_columns = _graph_columns(connection.execute_query(NODE_TYPES_QUERY), "nodeLabels")
+    rel_columns = _graph_columns(connection.execute_query(REL_TYPES_QUERY), "relType")
+    skipped: Dict[str, int] = {}
+
+    for label in sorted(set(node_columns) - set(DERIVED_LABELS)):
+        columns = _merge(declared_nodes.get(label, []), node_columns[label])
+        header = [f"id:ID({label})"] + [_header(name, kind) for name, kind in columns] + [":LABEL"]
+        writer = csvs.open(f"nodes_{label}", header, "nodes")
+        for batch in connection.stream_query(NODES_QUERY.format(label=label), {"label": label}, fetch_size=fetch_size):
+            for row in batch:
+                if row["id"] is None:
+                    skipped[label] = skipped.get(label, 0) + 1
+                    continue
+                props = row["props"]
+                writer.writerow(
+                    [row["id"]] + [_format(props.get(name)) for name, _ in columns] + [";".join(row["labels"])]
+                )
+                csvs.rows[f"nodes_{label}"] += 1
+
+    writers: Dict[Tuple[str, str, str], Tuple[Any, List[Column]]] = {}
+    for batch in connection.stream_query(RELATIONSHIPS_QUERY, {"excluded": list(DERIVED_LABELS)}, fetch_size=fetch_size):
+        for row in batch:
+            key = (row["start_label"], row["type"], row["end_label"])
+            if key not in writers:
+                start, rel_type, end = key
+                columns = _merge(declared_rels.get(rel_type, []), rel_columns.get(rel_type, []))
+                header = [f":START_ID({start})", f":END_ID({end})", ":TYPE"] + [
+                    _header(name, kind) for name, kind in columns
+                ]
+                writers[key] = (csvs.open(f"rels_{start}_{rel_type}_{end}", header, "relationships"), columns)
+            writer, columns = writers[key]
+            props = row["props"] or {}
+            writer.writerow([row["start_id"], row["end_id"], row["type"]] + [_format(props.get(n)) for n, _ in columns])
+            csvs.rows[f"rels_{key[0]}_{key[1]}_{key[2]}"] += 1
+    return skipped
+
+
+def write_scale_data(csvs: CsvSet, products: int, years: int, start_year: int, cost_structure: Optional[str]) -> int:
+    """Generate revenue and variable-cost facts shaped like the seed data; return the fact count.
+
+    Rows are built per product block with numpy so ten million facts stay
+    within a few minutes and bounded memory.
+    """
+
+    months = pd.DataFrame(
+        [(year, month) for year in range(start_year, start_year + years) for month in range(1, 13)],
+        columns=["year", "month"],
+    )
+    months["period_id"] = [f"{SCALE_PREFIX}tp_{y}_{m:02d}" for y, m in zip(months.year, months.month)]
+    periods = pd.DataFrame(
+        {
+            "id": months.period_id,
+            "year": months.year,
+            "month": months.month,
+            "monthName": [calendar.month_name[m] for m in months.month],
+            "quarter": [f"Q{(m - 1) // 3 + 1}" for m in months.month],
+            "periodType": "monthly",
+            "startDate": [f"{y}-{m:02d}-01" for y, m in zip(months.year, months.month)],
+            "endDate": [f"{y}-{m:02d}-{calendar.monthrange(y, m)[1]:02d}" for y, m in zip(months.year, months.month)],
+            ":LABEL": "TimePeriod",
+        }
+    )
+    csvs.write_frame(
+        "scale_nodes_TimePeriod",
+        ["id:ID(TimePeriod)", "year:long", "month:long", "monthName", "quarter", "periodType",
+         "startDate:date", "endDate:date", ":LABEL"],
+        "nodes",
+        periods,
+    )
+
+    rng = np.random.default_rng(42)
+    suffix = [f"{y}_{m:02d}" for y, m in zip(months.year, months.month)]
+    period_label = [f"{y}-{m:02d}" for y, m in zip(months.year, months.month)]
+    block = max(1, 200_000 // len(months))
+    facts = 0
+    for first in range(0, products, block):
+        index = np.arange(first, min(first + block, products))
+        product_ids = np.array([f"{SCALE_PREFIX}prod_{i}" for i in index], dtype=object)
+        stream_ids = np.array([f"{SCALE_PREFIX}rs_{i}" for i in index], dtype=object)
+        base_price = np.round(rng.uniform(3.0, 9.0, len(index)), 2)
+        names = np.array([f"Scale Product {i}" for i in index], dtype=object)
+
+        csvs.write_frame(
+            "scale_nodes_Product",
+            ["id:ID(Product)", "name", "baseUnitPrice:double", "unitMeasure", ":LABEL"],
+            "nodes",
+            pd.DataFrame({"id": product_ids, "name": names, "price": base_price, "unit": "kg", "label": "Product"}),
+        )
+        csvs.write_frame(
+            "scale_nodes_RevenueStream",
+            ["id:ID(RevenueStream)", "name", "type", "pricingMechanism", "currency", "unitType", ":LABEL"],
+            "nodes",
+            pd.DataFrame(
+                {"id": stream_ids, "name": names + " Sales", "type": "one-time", "pricing": "fixed",
+                 "currency": "USD", "unit": "kg", "label": "RevenueStream"}
+            ),
+        )
+        csvs.write_frame(
+            "scale_rels_RevenueStream_SELLS_PRODUCT_Product",
+            [":START_ID(RevenueStream)", ":END_ID(Product)", ":TYPE"],
+            "relationships",
+            pd.DataFrame({"start": stream_ids, "end": product_ids, "type": "SELLS_PRODUCT"}),
+        )
+
+        # One row per (product, month), product-major.
+        product = np.repeat(np.arange(len(index)), len(months))
+        month = np.tile(np.arange(len(months)), len(index))
+        fact_suffix = index.astype(str).astype(object)[product] + "_" + np.array(suffix, dtype=object)[month]
+        volume = np.round(rng.uniform(100.0, 25_000.0, len(product)), 2)
+        price = base_price[product]
+        period_ids = months.period_id.to_numpy(dtype=object)[month]
+        vd_ids = f"{SCALE_PREFIX}vd_" + fact_suffix
+        pd_ids = f"{SCALE_PREFIX}pd_" + fact_suffix
+        cd_ids = f"{SCALE_PREFIX}cd_" + fact_suffix
+
+        csvs.write_frame(
+            "scale_nodes_VolumeData",
+            ["id:ID(VolumeData)", "volume:double", "unit", ":LABEL"],
+            "nodes",
+            pd.DataFrame({"id": vd_ids, "volume": volume, "unit": "kg", "label": "VolumeData"}),
+        )
+        csvs.write_frame(
+            "scale_nodes_PriceData",
+            ["id:ID(PriceData)", "price:double", "currency", "priceType", "unitMeasure", ":LABEL"],
+            "nodes",
+            pd.DataFrame({"id": pd_ids, "price": price, "currency": "USD", "type": "fixed", "unit": "kg",
+                          "label": "PriceData"}),
+        )
+        csvs.write_frame(
+            "scale_nodes_CostData",
+            ["id:ID(CostData)", "amount:double", "unit", "period", "costBehavior", "category", "productName", ":LABEL"],
+            "nodes",
+            pd.DataFrame(
+                {"id": cd_ids, "amount": np.round(volume * price * 0.55, 2), "unit": "USD",
+                 "period": np.array(period_label, dtype=object)[month], "behavior": "variable",
+                 "category": "Product Procurement", "product": names[product], "label": "CostData"}
+            ),
+        )
+
+        relationships = [
+            ("RevenueStream", "HAS_VOLUME_DATA", "VolumeData", stream_ids[product], vd_ids),
+            ("RevenueStream", "HAS_PRICE_DATA", "PriceData", stream_ids[product], pd_ids),
+            ("VolumeData", "VOLUME_FOR_PRODUCT", "Product", vd_ids, product_ids[product]),
+            ("VolumeData", "OCCURS_IN_PERIOD", "TimePeriod", vd_ids, period_ids),
+            ("PriceData", "PRICE_FOR_PRODUCT", "Product", pd_ids, product_ids[product]),
+            ("PriceData", "PRICED_IN_PERIOD", "TimePeriod", pd_ids, period_ids),
+            ("CostData", "COST_FOR_PRODUCT", "Product", cd_ids, product_ids[product]),
+            ("CostData", "INCURRED_IN_PERIOD", "TimePeriod", cd_ids, period_ids),
+        ]
+        if cost_structure:
+            relationships.append(
+                ("CostData", "COST_FOR_STRUCTURE", "CostStructure", cd_ids, np.full(len(cd_ids), cost_structure, dtype=object))
+            )
+        for start, rel_type, end, start_ids, end_ids in relationships:
+            csvs.write_frame(
+                f"scale_rels_{start}_{rel_type}_{end}",
+                [f":START_ID({start})", f":END_ID({end})", ":TYPE"],
+                "relationships",
+                pd.DataFrame({"start": start_ids, "end": end_ids, "type": rel_type}),
+            )
+        facts += 3 * len(product)
+    return facts
+
+
+def write_import_script(csvs: CsvSet, database: str) -> Path:
+    lines = [
+        "#!/bin/sh",
+        "# Run from this directory with the target database stopped.",
+        f"neo4j-admin database import full {database} \\",
+        "  --overwrite-destination --id-type=string --array-delimiter=';' --multiline-fields=true \\",
+    ]
+    lines += [f"  {argument} \\" for argument in csvs.arguments]
+    lines[-1] = lines[-1].rstrip(" \\")
+    path = csvs.root / "import.sh"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    path.chmod(0o755)
+    return path
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Write neo4j-admin import CSVs for the graph and generated scale data.")
+    parser.add_argument("output", type=Path, help="Directory for the CSVs and import.sh")
+    parser.add_argument("--no-graph", action="store_true", help="Only write generated scale data")
+    parser.add_argument("--scale-products", type=int, default=0, help="Synthetic products to generate")
+    parser.add_argument("--scale-years", type=int, default=10, help="Years of monthly facts per synthetic product")
+    parser.add_argument("--scale-start-year", type=int, default=2030, help="First year of synthetic periods")
+    parser.add_argument(
+        "--cost-structure",
+        default="cs_fruit_procurement",
+        help="CostStructure id synthetic costs attach to (omitted with --no-graph)",
+    )
+    parser.add_argument("--database", default="neo4j", help="Database name used in import.sh")
+    parser.add_argument("--fetch-size", type=int, default=10_000, help="Records per round trip when exporting")
+    parser.add_argument("--compress", action="store_true", help="Write .csv.gz files")
+    args = parser.parse_args(argv)
+
+    if args.no_graph and not args.scale_products:
+        parser.error("--no-graph needs --scale-products")
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    csvs = CsvSet(args.output, args.compress)
+    started = time.perf_counter()
+    facts = 0
+    try:
+        if not args.no_graph:
+            connection = Neo4jConnection()
+            try:
+                if not connection.connected:
+                    print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+                    return 2
+                for label, count in export_graph(connection, csvs, args.fetch_size).items():
+                    print(f"Skipped {count} {label} node(s) without an id", file=sys.stderr)
+            finally:
+                connection.close()
+        if args.scale_products:
+            cost_structure = None if args.no_graph else args.cost_structure
+            facts = write_scale_data(csvs, args.scale_products, args.scale_years, args.scale_start_year, cost_structure)
+    finally:
+        csvs.close()
+
+    for name, rows in sorted(csvs.rows.items()):
+        print(f"{name:<60}{rows:>12,} rows")
+    script = write_import_script(csvs, args.database)
+    print(f"{facts:,} generated facts; wrote {len(csvs.files)} files in {time.perf_counter() - started:.1f}s")
+    print(f"Import with: (cd {args.output} && ./{script.name})")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
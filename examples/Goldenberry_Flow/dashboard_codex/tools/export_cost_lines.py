@@ -0,0 +1,61 @@
+"""
+Export CostData line items to CSV in bounded memory.
+
+Rows are streamed from Neo4j in batches (``stream_query``) and written as
+they arrive, so multi-year exports never hold the full result at once.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.export_cost_lines cost_lines.csv
+    python -m dashboard_codex.tools.export_cost_lines - --product Goldenberries --fetch-size 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+from typing import List
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import get_connection
+else:  # pragma: no cover - executed in package context
+    from ..database import get_connection
+
+FIELDS = ["id", "period_id", "year", "month", "category", "product", "behavior", "amount", "unit", "description"]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Stream CostData line items to CSV.")
+    parser.add_argument("output", help="CSV path, or - for stdout")
+    parser.add_argument("--product", help="Only line items for this product name")
+    parser.add_argument("--category", help="Only line items for this cost structure name")
+    parser.add_argument("--fetch-size", type=int, default=None, help="Records per round trip and per batch")
+    args = parser.parse_args(argv)
+
+    connection = get_connection()
+    if not connection.connected:
+        print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+        return 2
+
+    stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    written = 0
+    try:
+        writer = csv.DictWriter(stream, fieldnames=FIELDS)
+        writer.writeheader()
+        for batch in connection.iter_cost_line_items(args.product, args.category, fetch_size=args.fetch_size):
+            writer.writerows(batch)
+            written += len(batch)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    print(f"Exported {written} cost line items", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
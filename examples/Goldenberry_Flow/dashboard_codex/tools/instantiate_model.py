@@ -0,0 +1,71 @@
+"""
+Instantiate a business model from a YAML or JSON spec.
+
+The spec is validated against ``templates/node_templates.cypher`` and
+``templates/relationship_templates.cypher`` and written as batched,
+parameterised statements (one per label and relationship type) in a single
+transaction. See ``templates/business_model_spec.example.yaml``.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.instantiate_model ../../templates/business_model_spec.example.yaml
+    python -m dashboard_codex.tools.instantiate_model spec.json --emit -    # print, do not write
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import Neo4jConnection
+    from dashboard_codex.database.model_templates import build_plan, load_spec, write_model
+else:  # pragma: no cover - executed in package context
+    from ..database import Neo4jConnection
+    from ..database.model_templates import build_plan, load_spec, write_model
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Create a business model from a template-validated spec.")
+    parser.add_argument("spec", type=Path, help="Business model spec (.yaml, .yml or .json)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows per UNWIND statement")
+    parser.add_argument("--inline-semantics", action="store_true", help="Copy the semantic texts onto every node instead of SemanticDefinition")
+    parser.add_argument("--emit", metavar="FILE", help="Write the statements as JSON to FILE ('-' for stdout) instead of the database")
+    args = parser.parse_args(argv)
+
+    try:
+        plan = build_plan(load_spec(args.spec), batch_size=args.batch_size, shared_semantics=not args.inline_semantics)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    if args.emit:
+        if args.emit == "-":
+            print(plan.to_json())
+        else:
+            Path(args.emit).write_text(plan.to_json(), encoding="utf-8")
+        return 0
+
+    connection = Neo4jConnection()
+    try:
+        if not connection.connected:
+            print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+            return 2
+        write_model(connection, plan)
+    finally:
+        connection.close()
+
+    for label, count in plan.nodes.items():
+        print(f"{label:<24}{count:>6} node(s)")
+    for rel_type, count in plan.relationships.items():
+        print(f"{rel_type:<24}{count:>6} relationship(s)")
+    print(f"{len(plan.statements)} statement(s) in one transaction")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
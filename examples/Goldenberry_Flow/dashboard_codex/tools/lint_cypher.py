@@ -0,0 +1,533 @@
+"""
+Static performance lint for the dashboard's Cypher and the seed scripts.
+
+Extracts the query strings from ``database/connection.py`` (any Python file
+can be passed) and the statements of ``examples/**/*.cypher``, then flags
+plan-level anti-patterns with a suggested rewrite: cartesian products,
+unanchored scans, lookups on unindexed properties, pattern predicates,
+``EXISTS()`` re-checks of an OPTIONAL MATCH, property-value joins,
+index-defeating predicates and statements repeated with different literals
+instead of parameters. Indexed properties come from ``REQUIRED_SCHEMA``.
+No database is needed.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.lint_cypher
+    python -m dashboard_codex.tools.lint_cypher dashboard_codex/tools/benchmark_revenue_joins.py --min-severity warning
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database.phased_load import mask_cypher, split_statements
+    from dashboard_codex.database.schema import REQUIRED_SCHEMA
+else:  # pragma: no cover - executed in package context
+    from ..database.phased_load import mask_cypher, split_statements
+    from ..database.schema import REQUIRED_SCHEMA
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_PYTHON_SOURCES = (PACKAGE_ROOT / "database" / "connection.py",)
+DEFAULT_CYPHER_ROOT = PACKAGE_ROOT.parents[1]  # examples/
+
+SEVERITIES = ("info", "warning")
+
+# Rule id -> (severity, suggested rewrite).
+RULES: Dict[str, Tuple[str, str]] = {
+    "CY001": (
+        "warning",
+        "Connect the patterns through a shared node or relationship; a disconnected MATCH multiplies the row counts.",
+    ),
+    "CY002": (
+        "info",
+        "Anchor the pattern on an indexed property or a bound variable, or read a precomputed aggregate "
+        "(MonthlyFact) instead of scanning the label.",
+    ),
+    "CY003": (
+        "warning",
+        "Put the label in the pattern (MATCH (n:Label)) so the planner can use the label index.",
+    ),
+    "CY004": (
+        "warning",
+        "Add the property to REQUIRED_SCHEMA (database/schema.py) or look the node up by an indexed key.",
+    ),
+    "CY005": (
+        "warning",
+        "Pattern predicates run as a per-row semi-apply and are deprecated in Neo4j 5; write EXISTS { MATCH ... } / "
+        "NOT EXISTS { ... }, or filter on an indexed property (e.g. cd.costBehavior = 'fixed').",
+    ),
+    "CY006": (
+        "warning",
+        "The OPTIONAL MATCH already answered this; test the bound variable instead (CASE WHEN p IS NOT NULL ...).",
+    ),
+    "CY007": (
+        "warning",
+        "Reuse one variable for the shared node in both patterns instead of joining two scans on a property value.",
+    ),
+    "CY008": (
+        "info",
+        "Functions, arithmetic and CONTAINS/ENDS WITH on a property cannot use a range index; compare the raw "
+        "property, store a normalised copy, or add a TEXT index.",
+    ),
+    "CY009": (
+        "warning",
+        "Send one parameterised statement (UNWIND $rows AS row ...) instead of repeating it with literals; "
+        "the plan is cached once and the writes batch in one transaction.",
+    ),
+}
+
+CLAUSE_KEYWORDS = (
+    "OPTIONAL MATCH",
+    "DETACH DELETE",
+    "ON CREATE SET",
+    "ON MATCH SET",
+    "ORDER BY",
+    "MATCH",
+    "WHERE",
+    "WITH",
+    "RETURN",
+    "UNWIND",
+    "CREATE",
+    "MERGE",
+    "SET",
+    "DELETE",
+    "REMOVE",
+    "SKIP",
+    "LIMIT",
+    "CALL",
+    "YIELD",
+    "FOREACH",
+    "UNION",
+    "SHOW",
+    "TERMINATE",
+)
+_KEYWORD = re.compile(r"\b(" + "|".join(k.replace(" ", r"\s+") for k in CLAUSE_KEYWORDS) + r")\b", re.IGNORECASE)
+_QUERY_START = re.compile(r"^\s*(OPTIONAL\s+MATCH|MATCH|UNWIND|MERGE|CREATE|CALL|WITH|RETURN|SHOW)\b")
+_NODE = re.compile(r"\(\s*(\w*)\s*((?::\s*`?\w+`?\s*)*)(\{[^}]*\})?\s*\)")
+_REL = re.compile(r"\[\s*(\w*)\s*(?::\s*([\w|:]+))?")
+_ALIAS = re.compile(r"\bAS\s+(\w+)", re.IGNORECASE)
+_PATTERN_IN_PREDICATE = re.compile(r"\(\s*\w*\s*(?::\s*\w+\s*)*\)\s*<?-\s*[\[-]")
+_EXISTS_FUNCTION = re.compile(r"\bEXISTS\s*\(\s*\(", re.IGNORECASE)
+_VALUE_JOIN = re.compile(r"\b(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)\b")
+_WRAPPED_PROPERTY = re.compile(
+    r"\b(toLower|toUpper|toString|toInteger|toFloat|trim|ltrim|rtrim|substring|left|right|replace|coalesce|size)"
+    r"\s*\(\s*(\w+)\.(\w+)",
+    re.IGNORECASE,
+)
+_SUBSTRING_MATCH = re.compile(r"\b(\w+)\.(\w+)\s+(CONTAINS|ENDS\s+WITH)\b", re.IGNORECASE)
+_LABEL_PREDICATE = re.compile(r"\b(\w+)\s*:\s*(\w+)")
+_STRING = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER = re.compile(r"(?<![\w.$])-?\d+(?:\.\d+)?(?![\w.])")
+
+
+@dataclass
+class Statement:
+    """One Cypher statement with the location it came from."""
+
+    source: Path
+    line: int
+    text: str
+    context: str = ""
+
+
+@dataclass
+class Finding:
+    rule: str
+    statement: Statement
+    offset: int
+    message: str
+    extra_lines: List[int] = field(default_factory=list)
+
+    @property
+    def severity(self) -> str:
+        return RULES[self.rule][0]
+
+    @property
+    def line(self) -> int:
+        return self.statement.line + self.statement.text[: self.offset].count("\n")
+
+
+@dataclass
+class Clause:
+    keyword: str
+    start: int
+    body: str
+    body_start: int
+
+
+# Extraction ---------------------------------------------------------
+def cypher_statements(path: Path) -> Iterator[Statement]:
+    """Split a .cypher script on top-level semicolons."""
+
+    for line, text in split_statements(path.read_text(encoding="utf-8-sig")):
+        yield Statement(path, line, text)
+
+
+def python_statements(path: Path) -> Iterator[Statement]:
+    """Yield string constants that look like Cypher, labelled with their function."""
+
+    tree = ast.parse(path.read_text(encoding="utf-8-sig"), filename=str(path))
+
+    def visit(node: ast.AST, context: str) -> Iterator[Statement]:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                yield from visit(child, child.name)
+            elif isinstance(child, ast.Constant) and isinstance(child.value, str) and _QUERY_START.match(child.value):
+                yield Statement(path, child.lineno, child.value, context)
+            else:
+                yield from visit(child, context)
+
+    yield from visit(tree, "")
+
+
+# Parsing -------------------------------------------------------------
+def _split_clauses(masked: str) -> List[Clause]:
+    """Return top-level clauses (keywords inside brackets are ignored)."""
+
+    depth = 0
+    depth_at: List[int] = []
+    for char in masked:
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth = max(depth - 1, 0)
+        depth_at.append(depth)
+
+    hits = [m for m in _KEYWORD.finditer(masked) if depth_at[m.start()] == 0]
+    clauses: List[Clause] = []
+    for position, match in enumerate(hits):
+        end = hits[position + 1].start() if position + 1 < len(hits) else len(masked)
+        keyword = re.sub(r"\s+", " ", match.group(1).upper())
+        clauses.append(Clause(keyword, match.start(), masked[match.end() : end], match.end()))
+    return clauses
+
+
+def _split_top_level(body: str, body_start: int) -> List[Tuple[str, int]]:
+    parts: List[Tuple[str, int]] = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(body):
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append((body[start:index], body_start + start))
+            start = index + 1
+    parts.append((body[start:], body_start + start))
+    return [(text, offset) for text, offset in parts if text.strip()]
+
+
+@dataclass
+class PatternNode:
+    variable: str
+    labels: Tuple[str, ...]
+    properties: Tuple[str, ...]
+
+
+def _pattern_nodes(pattern: str) -> List[PatternNode]:
+    nodes = []
+    for match in _NODE.finditer(pattern):
+        labels = tuple(label.strip("` ") for label in match.group(2).split(":") if label.strip("` "))
+        properties = tuple(re.findall(r"(\w+)\s*:", match.group(3) or ""))
+        nodes.append(PatternNode(match.group(1), labels, properties))
+    return nodes
+
+
+def _pattern_variables(pattern: str) -> Set[str]:
+    variables = {node.variable for node in _pattern_nodes(pattern) if node.variable}
+    variables.update(match.group(1) for match in _REL.finditer(pattern) if match.group(1))
+    path = re.match(r"\s*(\w+)\s*=", pattern)
+    if path:
+        variables.add(path.group(1))
+    return variables
+
+
+def _identifiers(text: str) -> Set[str]:
+    return set(re.findall(r"\b([A-Za-z_]\w*)\b", text))
+
+
+def _indexed_properties() -> Dict[str, Set[str]]:
+    indexed: Dict[str, Set[str]] = defaultdict(set)
+    for obj in REQUIRED_SCHEMA:
+        # Composite indexes serve lookups on their leading property.
+        indexed[obj.label].add(obj.properties[0])
+    return indexed
+
+
+def _where_lookups(where: str) -> Dict[str, Set[str]]:
+    """Variables compared by equality/IN/STARTS WITH/range in a WHERE body -> properties."""
+
+    lookups: Dict[str, Set[str]] = defaultdict(set)
+    predicate = re.compile(r"\b(\w+)\.(\w+)\s*(=|IN\b|STARTS\s+WITH|<=?|>=?)", re.IGNORECASE)
+    for match in predicate.finditer(where):
+        # ``NOT x.prop IN ...`` and ``x.prop = y.prop`` joins do not anchor a lookup.
+        prefix = where[max(match.start() - 4, 0) : match.start()]
+        if re.search(r"NOT\s*$", prefix, re.IGNORECASE):
+            continue
+        lookups[match.group(1)].add(match.group(2))
+    for match in re.finditer(r"\b(?:elementId|id)\s*\(\s*(\w+)\s*\)\s*=", where):
+        lookups[match.group(1)].add("<id>")
+    return lookups
+
+
+# Rules ---------------------------------------------------------------
+def lint_statement(statement: Statement, indexed: Dict[str, Set[str]]) -> List[Finding]:
+    masked = mask_cypher(statement.text)
+    clauses = _split_clauses(masked)
+    findings: List[Finding] = []
+    bound: Set[str] = set()
+    entities: Set[str] = set()  # bound variables that hold nodes, relationships or paths
+    disconnected_scan = False
+    optional_bindings: Dict[str, str] = {}  # relationship type -> variable bound by an OPTIONAL MATCH
+
+    def report(rule: str, offset: int, message: str) -> None:
+        findings.append(Finding(rule, statement, offset, message))
+
+    for position, clause in enumerate(clauses):
+        following = clauses[position + 1] if position + 1 < len(clauses) else None
+        where = following.body if following is not None and following.keyword == "WHERE" else ""
+
+        if clause.keyword in ("MATCH", "OPTIONAL MATCH"):
+            lookups = _where_lookups(where)
+            for pattern, offset in _split_top_level(clause.body, clause.body_start):
+                nodes = _pattern_nodes(pattern)
+                variables = _pattern_variables(pattern)
+                referenced = _identifiers(pattern) | {
+                    other
+                    for match in _VALUE_JOIN.finditer(where)
+                    for left, other in ((match.group(1), match.group(3)), (match.group(3), match.group(1)))
+                    if left in variables
+                }
+                connected = bool(bound & referenced)
+
+                anchored = connected
+                for node in nodes:
+                    keys = set(node.properties) | lookups.get(node.variable, set())
+                    if not keys:
+                        continue
+                    anchored = True
+                    label = node.labels[0] if node.labels else None
+                    if label and "<id>" not in keys and not keys & indexed.get(label, set()):
+                        report(
+                            "CY004",
+                            offset,
+                            f"lookup of :{label} by {', '.join(sorted(keys))} has no index or constraint",
+                        )
+
+                if not anchored and clause.keyword == "MATCH":
+                    if nodes and not any(node.labels for node in nodes):
+                        labelled = [m for m in _LABEL_PREDICATE.finditer(where) if m.group(1) in variables]
+                        if labelled:
+                            report(
+                                "CY003",
+                                offset,
+                                f"label :{labelled[0].group(2)} is tested in WHERE; this is an AllNodesScan",
+                            )
+                        else:
+                            report("CY002", offset, "pattern without labels scans every node or relationship")
+                    else:
+                        scanned = next((node for node in nodes if node.labels), None)
+                        what = f":{scanned.labels[0]}" if scanned else "pattern"
+                        report("CY002", offset, f"unanchored {what} scan")
+
+                # Rows of scalars (e.g. after an aggregating WITH) are not multiplied into a product.
+                if entities and not connected and clause.keyword == "MATCH" and (not anchored or disconnected_scan):
+                    report(
+                        "CY001",
+                        offset,
+                        f"pattern ({', '.join(sorted(variables)) or 'anonymous'}) shares no variable with "
+                        f"({', '.join(sorted(entities))})",
+                    )
+                if not connected and not anchored:
+                    disconnected_scan = True
+
+                if clause.keyword == "OPTIONAL MATCH":
+                    for rel in _REL.finditer(pattern):
+                        for rel_type in (rel.group(2) or "").split("|"):
+                            new = [n.variable for n in nodes if n.variable and n.variable not in bound]
+                            if rel_type and new:
+                                optional_bindings[rel_type] = new[-1]
+                bound |= variables
+                entities |= variables
+
+        elif clause.keyword in ("MERGE", "CREATE"):
+            for pattern, _ in _split_top_level(clause.body, clause.body_start):
+                bound |= _pattern_variables(pattern)
+                entities |= _pattern_variables(pattern)
+        elif clause.keyword == "UNWIND":
+            bound |= set(_ALIAS.findall(clause.body))
+        elif clause.keyword == "WITH":
+            projected: Set[str] = set()
+            kept: Set[str] = set()
+            for item, _ in _split_top_level(clause.body, clause.body_start):
+                alias = _ALIAS.search(item)
+                source = item[: alias.start()].strip() if alias else item.strip()
+                name = alias.group(1) if alias else source
+                if alias or re.fullmatch(r"\w+", source):
+                    projected.add(name)
+                    if source in entities:
+                        kept.add(name)
+            if not re.search(r"(^|,)\s*\*", clause.body):
+                bound, entities = projected, kept
+
+        if clause.keyword == "WHERE":
+            _lint_where(clause, report)
+
+        for match in _EXISTS_FUNCTION.finditer(clause.body):
+            offset = clause.body_start + match.start()
+            inner = clause.body[match.end() :]
+            types = [t for rel in _REL.finditer(inner[:200]) for t in (rel.group(2) or "").split("|") if t]
+            in_case = re.search(r"\bCASE\b", masked[: offset], re.IGNORECASE) is not None
+            variable = next((optional_bindings[t] for t in types if t in optional_bindings), None)
+            if in_case and variable:
+                report(
+                    "CY006",
+                    offset,
+                    f"EXISTS() re-walks :{types[0]} after OPTIONAL MATCH bound {variable}; use {variable} IS NOT NULL",
+                )
+            else:
+                report("CY005", offset, "EXISTS(pattern) function form is a per-row pattern predicate")
+
+    return findings
+
+
+def _lint_where(clause: Clause, report) -> None:
+    body = clause.body
+    # Patterns inside EXISTS { } / COUNT { } subqueries are fine.
+    depth = 0
+    subquery_depth: List[int] = []
+    for index, char in enumerate(body):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        subquery_depth.append(depth)
+    for match in _PATTERN_IN_PREDICATE.finditer(body):
+        if subquery_depth[match.start()] > 0:
+            continue
+        negated = re.search(r"NOT\s*$", body[: match.start()], re.IGNORECASE) is not None
+        kind = "negated pattern predicate" if negated else "pattern predicate"
+        report("CY005", clause.body_start + match.start(), f"{kind} in WHERE")
+    for match in _VALUE_JOIN.finditer(body):
+        left, prop, right, other_prop = match.groups()
+        if left != right and prop == other_prop:
+            report("CY007", clause.body_start + match.start(), f"{left}.{prop} = {right}.{prop} joins on a value")
+    for match in _WRAPPED_PROPERTY.finditer(body):
+        report(
+            "CY008",
+            clause.body_start + match.start(),
+            f"{match.group(1)}({match.group(2)}.{match.group(3)}) hides the property from indexes",
+        )
+    for match in _SUBSTRING_MATCH.finditer(body):
+        operator = re.sub(r"\s+", " ", match.group(3).upper())
+        report("CY008", clause.body_start + match.start(), f"{match.group(1)}.{match.group(2)} {operator} needs a TEXT index")
+
+
+def _shape(text: str) -> str:
+    """Statement text with literals and variable numbering replaced, to find copy-pasted statements."""
+
+    without_comments = re.sub(r"//[^\n]*", "", _STRING.sub("?", text))
+    numbered = re.sub(r"\b([A-Za-z_]+)\d+\b", r"\1#", _NUMBER.sub("?", without_comments))
+    return re.sub(r"\s+", " ", numbered).strip()
+
+
+def lint_repeated_literals(statements: Sequence[Statement], threshold: int) -> List[Finding]:
+    """Group statements of one source that differ only in literal values."""
+
+    groups: Dict[str, List[Statement]] = defaultdict(list)
+    for statement in statements:
+        if _STRING.search(statement.text) or _NUMBER.search(mask_cypher(statement.text)):
+            groups[_shape(statement.text)].append(statement)
+    findings = []
+    for members in groups.values():
+        if len(members) < threshold or len({member.text for member in members}) < 2:
+            continue
+        first = members[0]
+        findings.append(
+            Finding(
+                "CY009",
+                first,
+                0,
+                f"{len(members)} statements differ only in literal values",
+                [member.line for member in members[1:]],
+            )
+        )
+    return findings
+
+
+def lint_sources(paths: Iterable[Path], repeat_threshold: int = 3) -> List[Finding]:
+    indexed = _indexed_properties()
+    findings: List[Finding] = []
+    for path in paths:
+        statements = list(python_statements(path) if path.suffix == ".py" else cypher_statements(path))
+        for statement in statements:
+            findings.extend(lint_statement(statement, indexed))
+        findings.extend(lint_repeated_literals(statements, repeat_threshold))
+    return sorted(findings, key=lambda finding: (str(finding.statement.source), finding.line, finding.rule))
+
+
+def _format(finding: Finding, root: Path) -> str:
+    try:
+        location = finding.statement.source.relative_to(root)
+    except ValueError:
+        location = finding.statement.source
+    context = f" [{finding.statement.context}]" if finding.statement.context else ""
+    lines = [f"{location}:{finding.line}: {finding.rule} {finding.severity}{context}: {finding.message}"]
+    if finding.extra_lines:
+        shown = ", ".join(str(line) for line in finding.extra_lines[:8])
+        more = f" and {len(finding.extra_lines) - 8} more" if len(finding.extra_lines) > 8 else ""
+        lines.append(f"    also at lines {shown}{more}")
+    lines.append(f"    suggestion: {RULES[finding.rule][1]}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Flag Cypher performance anti-patterns and suggest rewrites.")
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="Python modules or .cypher files (default: database/connection.py and examples/**/*.cypher)",
+    )
+    parser.add_argument("--min-severity", choices=SEVERITIES, default="info", help="Lowest severity to print")
+    parser.add_argument("--fail-on", choices=SEVERITIES + ("never",), default="warning", help="Exit 1 at this level")
+    parser.add_argument("--repeat-threshold", type=int, default=3, help="Copies of a literal statement to report")
+    parser.add_argument("--summary", action="store_true", help="Only print counts per file and rule")
+    args = parser.parse_args(argv)
+
+    paths = list(args.paths) or [*DEFAULT_PYTHON_SOURCES, *sorted(DEFAULT_CYPHER_ROOT.glob("**/*.cypher"))]
+    findings = lint_sources([path.resolve() for path in paths], args.repeat_threshold)
+    shown = [f for f in findings if SEVERITIES.index(f.severity) >= SEVERITIES.index(args.min_severity)]
+
+    root = DEFAULT_CYPHER_ROOT.parent
+    if args.summary:
+        counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        for finding in shown:
+            counts[(str(finding.statement.source.relative_to(root)), finding.rule)] += 1
+        for (source, rule), count in sorted(counts.items()):
+            print(f"{source:<70}{rule} {RULES[rule][0]:<8}{count:>5}")
+    else:
+        for finding in shown:
+            print(_format(finding, root))
+
+    by_severity = {severity: sum(f.severity == severity for f in findings) for severity in SEVERITIES}
+    print(f"{len(findings)} finding(s): {by_severity['warning']} warning(s), {by_severity['info']} info")
+    if args.fail_on == "never":
+        return 0
+    threshold = SEVERITIES.index(args.fail_on)
+    return 1 if any(SEVERITIES.index(f.severity) >= threshold for f in findings) else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Load a phased seed script (by default ``complete_cost_data_integration.cypher``).
+
+The schema phase runs first; the personnel, one-time and variable cost
+phases then load concurrently in chunked transactions, each chunk recording
+a ``LoadCheckpoint`` so a rerun after a failure skips what is already in.
+Every phase's validation query runs after it and timings are reported.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.load_phased_script --plan
+    python -m dashboard_codex.tools.load_phased_script [--workers 3] [--chunk-size 25]
+    python -m dashboard_codex.tools.load_phased_script --phase 4    # one phase only
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import Neo4jConnection
+    from dashboard_codex.database.data_version import DOMAIN_COST, DOMAINS
+    from dashboard_codex.database.phased_load import PhasedLoader, parse_phased_script
+else:  # pragma: no cover - executed in package context
+    from ..database import Neo4jConnection
+    from ..database.data_version import DOMAIN_COST, DOMAINS
+    from ..database.phased_load import PhasedLoader, parse_phased_script
+
+DEFAULT_SCRIPT = Path(__file__).resolve().parents[2] / "complete_cost_data_integration.cypher"
+
+
+def _print_plan(loader: PhasedLoader) -> None:
+    script = loader.script
+    depends = script.dependencies()
+    for phase in script.phases:
+        after = ", ".join(str(number) for number in sorted(depends[phase.number])) or "-"
+        kind = "schema" if phase.schema else "data"
+        print(
+            f"{phase.label:<55}{kind:<8}{len(phase.statements):>4} statements"
+            f"{len(loader.chunks(phase)):>4} chunk(s){len(phase.validations):>3} validation(s)  after: {after}"
+        )
+    if script.epilogue:
+        print(f"Epilogue: {len(script.epilogue)} statement(s)")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a phased Cypher seed script with checkpoints and concurrency.")
+    parser.add_argument("--script", type=Path, default=DEFAULT_SCRIPT, help="Phased .cypher script")
+    parser.add_argument("--phase", type=int, action="append", help="Only run this phase (repeatable)")
+    parser.add_argument("--workers", type=int, default=3, help="Phases loaded concurrently")
+    parser.add_argument("--chunk-size", type=int, default=25, help="Statements per write transaction")
+    parser.add_argument("--domain", action="append", choices=DOMAINS, help="DataVersion domain(s) to bump (default: cost)")
+    parser.add_argument("--no-validate", action="store_true", help="Skip the phases' validation queries")
+    parser.add_argument("--reset", action="store_true", help="Forget recorded checkpoints before running")
+    parser.add_argument("--plan", action="store_true", help="Print the phases and their dependencies, then exit")
+    args = parser.parse_args(argv)
+
+    script = parse_phased_script(args.script)
+    if args.plan:
+        _print_plan(PhasedLoader(None, script, chunk_size=args.chunk_size))  # type: ignore[arg-type]
+        return 0
+
+    connection = Neo4jConnection()
+    try:
+        if not connection.connected:
+            print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+            return 2
+
+        loader = PhasedLoader(
+            connection,
+            script,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            validate=not args.no_validate,
+            domains=args.domain or (DOMAIN_COST,),
+        )
+        if args.reset:
+            print(f"Removed {loader.reset()} checkpoint(s)")
+        report = loader.run(args.phase)
+    finally:
+        connection.close()
+
+    for result in report.results:
+        print(
+            f"{result.phase.label:<55}{result.status:<9}"
+            f"{result.chunks_written:>3} written {result.chunks_skipped:>3} skipped"
+            f"{result.write_seconds:>9.2f}s write{result.validation_seconds:>8.2f}s validate"
+        )
+        for row in result.validation_rows:
+            print(f"    {row}")
+        if result.error:
+            print(f"    error: {result.error}")
+    print(f"Wall time {report.wall_seconds:.2f}s (phases back to back: {report.serial_seconds:.2f}s)")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Move the canvas nodes' repeated semantic texts onto ``SemanticDefinition`` nodes.
+
+Without ``--apply`` the tool only reports, per label, how many inline copies
+would go and the estimated store and bytes-on-wire savings. ``--script``
+estimates from a seed script instead of the database, and ``--inline`` copies
+the shared texts back onto every node.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.migrate_semantics --script goldenberry_complete_model.cypher
+    python -m dashboard_codex.tools.migrate_semantics [--apply]
+    python -m dashboard_codex.tools.migrate_semantics --inline
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import Neo4jConnection
+    from dashboard_codex.database.semantic_store import (
+        SemanticReport,
+        deduplicate_semantics,
+        estimate_script,
+        inline_semantics,
+    )
+else:  # pragma: no cover - executed in package context
+    from ..database import Neo4jConnection
+    from ..database.semantic_store import SemanticReport, deduplicate_semantics, estimate_script, inline_semantics
+
+
+def _print_report(report: SemanticReport) -> None:
+    print(f"{'Label':<24}{'nodes':>6}{'moved':>7}{'kept':>6}{'wire before':>13}{'wire after':>12}{'store saved':>13}")
+    for item in report.labels:
+        moved = sum(len(names) for names in item.cleared.values())
+        print(
+            f"{item.label:<24}{item.nodes:>6}{moved:>7}{item.overrides:>6}"
+            f"{item.wire_bytes_before:>13,}{item.wire_bytes_after:>12,}"
+            f"{item.store_bytes_before - item.store_bytes_after:>13,}"
+        )
+    state = "saved" if report.applied else "would be saved"
+    print(
+        f"Bytes on wire for a full canvas read {state}: {report.wire_bytes_saved:,}; "
+        f"string store (estimate): {report.store_bytes_saved:,}"
+    )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Deduplicate the canvas nodes' semantic texts.")
+    parser.add_argument("--script", type=Path, help="Estimate from a seed .cypher script instead of the database")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--apply", action="store_true", help="Run the migration (default: report only)")
+    mode.add_argument("--inline", action="store_true", help="Copy the shared texts back onto every node")
+    args = parser.parse_args(argv)
+
+    if args.script:
+        _print_report(estimate_script(args.script))
+        return 0
+
+    connection = Neo4jConnection()
+    try:
+        if not connection.connected:
+            print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+            return 2
+        if args.inline:
+            print(f"Inlined the semantic texts of {inline_semantics(connection)} label(s)")
+            return 0
+        report = deduplicate_semantics(connection, apply=args.apply)
+    finally:
+        connection.close()
+
+    _print_report(report)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
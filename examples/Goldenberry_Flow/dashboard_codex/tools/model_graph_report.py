@@ -0,0 +1,94 @@
+"""
+Network analysis of the business-model graph from its in-memory snapshot.
+
+Loads the CSR snapshot once, then prints the structure (nodes per label,
+relationship patterns), the ValueProposition -> KeyActivity/KeyResource ->
+CostStructure dependency chains and the most central nodes, with the time
+each in-process computation took.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.model_graph_report [--top 10] [--directed]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import Neo4jConnection
+    from dashboard_codex.database.model_graph import ModelGraph, load_model_graph
+else:  # pragma: no cover - executed in package context
+    from ..database import Neo4jConnection
+    from ..database.model_graph import ModelGraph, load_model_graph
+
+# (title, hops) of the cost dependency chains reported per value proposition.
+COST_CHAINS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("activity", ("REQUIRES_ACTIVITY", "INCURS_COST")),
+    ("resource", ("REQUIRES_RESOURCE", "INCURS_COST")),
+    ("activity -> resource", ("REQUIRES_ACTIVITY", "USES_RESOURCE", "INCURS_COST")),
+]
+
+
+def _timed(compute: Callable[[], Any]) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    result = compute()
+    return result, (time.perf_counter() - started) * 1e6
+
+
+def _print_report(graph: ModelGraph, top: int, directed: bool) -> None:
+    print(f"{graph.node_count} nodes, {graph.edge_count} relationships, {len(graph.rel_types)} relationship types")
+    for label, count in graph.label_counts().items():
+        print(f"  {label:<24}{count:>6}")
+    patterns, elapsed = _timed(graph.relationship_counts)
+    print(f"Relationship patterns ({elapsed:,.0f} us)")
+    for (start, rel_type, end), count in sorted(patterns.items()):
+        pattern = f"({start})-[:{rel_type}]->({end})"
+        print(f"  {pattern:<64}{count:>6}")
+
+    print("Cost dependency chains")
+    for vp in graph.nodes_with_label("ValueProposition").tolist():
+        for title, steps in COST_CHAINS:
+            chains, elapsed = _timed(lambda: graph.chains(vp, *steps))
+            costs = sorted({graph.names[chain[-1]] for chain in chains})
+            print(f"  {graph.names[vp]} via {title}: {len(chains)} chain(s), {len(costs)} cost structure(s) ({elapsed:,.1f} us)")
+
+    for title, compute in (
+        ("Degree", lambda: graph.degree().astype(float)),
+        ("PageRank", graph.pagerank),
+        ("Betweenness", lambda: graph.betweenness(directed=directed)),
+    ):
+        scores, elapsed = _timed(compute)
+        print(f"{title} centrality ({elapsed:,.0f} us)")
+        for row in graph.ranking(scores, top):
+            print(f"  {row['score']:>10.4f}  {row['label']:<22}{row['name']}")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="In-process network analysis of the business-model graph.")
+    parser.add_argument("--top", type=int, default=10, help="Nodes listed per centrality measure")
+    parser.add_argument("--directed", action="store_true", help="Directed betweenness (default: undirected)")
+    args = parser.parse_args(argv)
+
+    connection = Neo4jConnection()
+    try:
+        if not connection.connected:
+            print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+            return 2
+        graph, elapsed = _timed(lambda: load_model_graph(connection))
+    finally:
+        connection.close()
+
+    print(f"Snapshot loaded in {elapsed / 1e3:,.1f} ms")
+    _print_report(graph, args.top, args.directed)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
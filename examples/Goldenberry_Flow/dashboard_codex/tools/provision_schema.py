@@ -0,0 +1,54 @@
+"""
+Apply and verify the Goldenberry constraints and indexes.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.provision_schema            # apply + verify
+    python -m dashboard_codex.tools.provision_schema --verify   # verify only
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import get_connection
+    from dashboard_codex.database.schema import REQUIRED_SCHEMA, apply_schema, verify_schema
+else:  # pragma: no cover - executed in package context
+    from ..database import get_connection
+    from ..database.schema import REQUIRED_SCHEMA, apply_schema, verify_schema
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Provision Goldenberry constraints and indexes.")
+    parser.add_argument("--verify", action="store_true", help="Only verify, do not create objects")
+    args = parser.parse_args(argv)
+
+    connection = get_connection()
+    if not connection.connected:
+        print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+        return 2
+
+    if not args.verify:
+        for statement in apply_schema(connection):
+            print(statement)
+
+    report = verify_schema(connection)
+    for method, scans in report.full_scans.items():
+        print(f"INFO: {method} scans without a lookup: {', '.join(scans)}")
+    if report.healthy:
+        print(f"OK: {len(REQUIRED_SCHEMA)} schema objects ONLINE, no label-scan fallbacks")
+        return 0
+
+    for problem in report.problems():
+        print(f"FAIL: {problem}")
+    return 1
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Rebuild MonthlyFact aggregate nodes after an ingestion batch.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.refresh_monthly_facts                 # all periods
+    python -m dashboard_codex.tools.refresh_monthly_facts --period tp_2025_08
+    python -m dashboard_codex.tools.refresh_monthly_facts --fact-id cd_manager_2025_08
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database import get_connection
+    from dashboard_codex.database.aggregates import refresh_for_batch, refresh_monthly_facts
+else:  # pragma: no cover - executed in package context
+    from ..database import get_connection
+    from ..database.aggregates import refresh_for_batch, refresh_monthly_facts
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Materialise MonthlyFact aggregate nodes.")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--period", action="append", default=[], help="TimePeriod id to rebuild (repeatable)")
+    group.add_argument(
+        "--fact-id",
+        action="append",
+        default=[],
+        help="Ingested VolumeData/PriceData/CostData id; rebuilds only its periods (repeatable)",
+    )
+    args = parser.parse_args(argv)
+
+    connection = get_connection()
+    if not connection.connected:
+        print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+        return 2
+
+    if args.fact_id:
+        created = refresh_for_batch(connection, args.fact_id)
+    else:
+        created = refresh_monthly_facts(connection, args.period or None)
+    print(f"Materialised {created} MonthlyFact nodes")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Sync the embedded DuckDB analytical mirror from Neo4j and optionally export it.
+
+Only periods that changed since the last sync are copied; ``--full``
+re-copies everything. Requires the optional ``duckdb`` package.
+
+Usage (from ``examples/Goldenberry_Flow``)::
+
+    python -m dashboard_codex.tools.sync_analytical_mirror
+    python -m dashboard_codex.tools.sync_analytical_mirror --full --parquet exports/mirror
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+if __package__ in (None, ""):
+    package_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(package_root.parent))
+    from dashboard_codex.database.analytical_mirror import MirrorConnection
+else:  # pragma: no cover - executed in package context
+    from ..database.analytical_mirror import MirrorConnection
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Copy changed fact nodes into the DuckDB analytical mirror.")
+    parser.add_argument("--path", help="DuckDB file (default: GOLDENBERRY_DUCKDB_PATH)")
+    parser.add_argument("--full", action="store_true", help="Re-copy every period, closed ones included")
+    parser.add_argument("--parquet", type=Path, help="Also write each mirrored table as Parquet into this directory")
+    args = parser.parse_args(argv)
+
+    connection = MirrorConnection(path=args.path)
+    try:
+        if not connection.connected:
+            print(connection.error_message or "Database connection is not ready", file=sys.stderr)
+            return 2
+        if connection.mirror is None:
+            print("Analytical mirror unavailable; is duckdb installed?", file=sys.stderr)
+            return 2
+
+        written = connection.mirror.sync(connection, force=True, full=args.full)
+        for table, rows in written.items():
+            print(f"{table:<24}{rows:>10,} rows")
+
+        if args.parquet:
+            for path in connection.mirror.export_parquet(args.parquet):
+                print(f"Wrote {path}")
+    finally:
+        connection.close()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    sys.exit(main())
@@ -9,6 +9,8 @@
 
 // =====================================================
 // CONSTRAINTS CREATION (Run these first)
+// The full constraint/index set used by the dashboard is declared in
+// dashboard_codex/database/schema.py (python -m dashboard_codex.tools.provision_schema)
 // =====================================================
 
 CREATE CONSTRAINT goldenberry_business_model_id IF NOT EXISTS FOR (bm:BusinessModel) REQUIRE bm.id IS UNIQUE;
@@ -1443,6 +1445,15 @@ CREATE (ka4)-[:INCURS_COST {costDriver: "Operational risk coverage"}]->(cost32);
 MATCH (cost33:CostStructure {id: "cost_emergency_response"}), (ka4:KeyActivity {id: "ka_supply_chain_coordination"})
 CREATE (ka4)-[:INCURS_COST {costDriver: "Emergency response capabilities"}]->(cost33);
 
+// =====================================================
+// DATA VERSION
+// =====================================================
+// Invalidate dashboard caches for the business-model domain (see dashboard_codex/database/data_version.py)
+
+MERGE (dv:DataVersion {domain: 'model'})
+SET dv.version = coalesce(dv.version, 0) + 1,
+    dv.updatedAt = datetime();
+
 // =====================================================
 // VALIDATION CONFIRMATION
 // =====================================================